@@ -0,0 +1,36 @@
+"""배치 작업 공용 도구 — 목록 파일 읽기, 워커 간 시작 간격 제한.
+
+사전 적재(prewarm)·DART 일괄 적재(dart_bulk) 등 기업 목록을 병렬 처리하는
+배치가 함께 쓴다.
+"""
+
+import pathlib
+import threading
+import time
+
+
+class Throttle:
+    """워커 간 공유하는 시작 간격 제한 (분당 rate_per_minute회)."""
+
+    def __init__(self, rate_per_minute: float):
+        self._interval = 60.0 / rate_per_minute if rate_per_minute > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self._interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
+def load_companies(path: str | pathlib.Path) -> list[str]:
+    """기업명(또는 기업코드) 목록 파일 읽기. 빈 줄·주석(#) 제외, 순서 유지 중복 제거."""
+    names = []
+    for line in pathlib.Path(path).read_text(encoding="utf-8").splitlines():
+        name = line.split("#", 1)[0].strip()
+        if name and name not in names:
+            names.append(name)
+    return names
@@ -7,8 +7,22 @@ import logging
 import os
 from typing import Any, cast
 
+from cover_letter import company_resolver
+from cover_letter.collectors import dart_filing_cache
+from crawling import rate_limiter
+
 logger = logging.getLogger(__name__)
 
+# 이보다 낮은 유사도의 후보는 다른 기업일 가능성이 커서 사용하지 않는다
+_MIN_RESOLVE_SCORE = 0.4
+
+# (결과 키, 사업보고서 섹션 제목에 포함되는 문자열)
+_SECTIONS = (
+    ("products", "주요 제품 및 서비스"),
+    ("market_conditions", "시장현황"),
+    ("r_and_d", "연구개발"),
+)
+
 
 def _search_business_filings(dart, corp_code: str, years: int) -> dict:
     """dart-fss 버전에 맞춰 사업보고서 목록 조회."""
@@ -34,6 +48,22 @@ def _search_business_filings(dart, corp_code: str, years: int) -> dict:
     raise AttributeError("지원되지 않는 dart-fss filings API")
 
 
+def resolve_corp(
+    company_name: str, allow_download: bool = True
+) -> company_resolver.Candidate | None:
+    """기업명에 해당하는 DART 기업 후보. 유사도가 낮으면 None.
+
+    Raises:
+        RuntimeError: 기업코드 인덱스를 사용할 수 없는 경우
+    """
+    # 정확 > 접두사 > 트라이그램 유사도 순, 동점이면 상장사·모회사 우선
+    resolver = company_resolver.get_resolver(allow_download=allow_download)
+    candidates = resolver.resolve(company_name, limit=1)
+    if not candidates or candidates[0].score < _MIN_RESOLVE_SCORE:
+        return None
+    return candidates[0]
+
+
 def collect_dart_reports_with_status(company_name: str, years: int = 3) -> dict:
     """DART 사업보고서 수집 결과와 상태를 함께 반환.
 
@@ -63,60 +93,31 @@ def collect_dart_reports_with_status(company_name: str, years: int = 3) -> dict:
 
     try:
         dart.set_api_key(api_key=api_key)
-        corp_list = dart.get_corp_list()
-
-        # 정확 매칭 우선, 없으면 부분 매칭 첫 번째 사용
-        matched = corp_list.find_by_corp_name(company_name, exactly=True)
-        if not matched:
-            matched = corp_list.find_by_corp_name(company_name, exactly=False)
-
-        if not matched:
+        target_corp = resolve_corp(company_name)
+        if target_corp is None:
             return {
                 "success": False,
                 "data": {},
                 "reason": f"기업코드 미발견: {company_name}",
             }
 
-        # find_by_corp_name은 Corp 객체 리스트 반환
-        # 상장사(stock_code 있는 것) 우선 선택
-        listed = [c for c in matched if getattr(c, "stock_code", None)]
-        target_corp = listed[0] if listed else matched[0]
-        corp_code = target_corp.corp_code
-        try:
-            filings = _search_business_filings(dart, corp_code, years)
-        except Exception as exc:
-            if "조회된 데이타가 없습니다" in str(exc):
-                return {
-                    "success": False,
-                    "data": {},
-                    "reason": "최근 사업보고서 없음",
-                }
-            raise
-
-        if not filings or not filings.get("list"):
-            return {
-                "success": False,
-                "data": {},
-                "reason": "최근 사업보고서 없음",
-            }
-
-        latest = filings["list"][0]
-        rcp_no = latest["rcept_no"]
-
-        result: dict[str, str] = {}
-        _extract_section(dart, rcp_no, "주요 제품 및 서비스", result, "products")
-        _extract_section(dart, rcp_no, "시장현황", result, "market_conditions")
-        _extract_section(dart, rcp_no, "연구개발", result, "r_and_d")
-
-        if not result:
+        logger.info(
+            "DART 기업 매칭: %s → %s (%s, score=%.2f)",
+            company_name,
+            target_corp.corp_name,
+            target_corp.matched_on,
+            target_corp.score,
+        )
+        status = collect_by_corp_code(dart, target_corp.corp_code, years)
+        if status["success"] and not status["data"]:
             # 최신 dart-fss에서는 본문 섹션 API가 제거되어 공시 메타데이터로 폴백
-            result = {
+            latest = status["filing"]
+            status["data"] = {
                 "products": latest.get("report_nm", "사업보고서"),
                 "market_conditions": f"공시일: {latest.get('rcept_dt', '')}",
-                "r_and_d": f"접수번호: {rcp_no}",
+                "r_and_d": f"접수번호: {latest.get('rcept_no', '')}",
             }
-
-        return {"success": True, "data": result, "reason": ""}
+        return status
     except Exception:
         logger.exception("DART 수집 실패: company=%s", company_name)
         return {"success": False, "data": {}, "reason": "DART API 호출 실패"}
@@ -151,24 +152,110 @@ def _years_ago(n: int) -> str:
     return past.strftime("%Y%m%d")
 
 
-def _extract_section(
-    dart, rcp_no: str, section_name: str, result: dict, key: str
-) -> None:
-    """사업보고서에서 특정 섹션 텍스트 추출. 실패 시 무시."""
-    try:
-        # 구버전 API 호환 (최신 버전은 이 경로가 없을 수 있음)
-        if not hasattr(dart.api, "document") or not hasattr(
-            dart.api.document, "get_document"
-        ):
-            return
+def collect_by_corp_code(
+    dart, corp_code: str, years: int = 3, before_request=None
+) -> dict:
+    """기업코드의 최신 사업보고서에서 주요 섹션 추출 (공시 목록·본문 캐시 사용).
+
+    Args:
+        dart: API 키가 설정된 dart_fss 모듈
+        corp_code: DART 기업코드
+        years: 사업보고서 조회 기간 (년)
+        before_request: DART API 호출 직전마다 부르는 추가 콜백
+            (공용 속도 제한 rate_limiter "dart"는 항상 적용)
 
+    Returns:
+        {
+            "success": bool,
+            "data": dict[str, str],  # 본문 섹션이 없으면 빈 dict
+            "reason": str,
+            "filing": {"rcept_no": str, "report_nm": str, "rcept_dt": str},
+        }
+    """
+
+    def _before_request() -> None:
+        rate_limiter.acquire("dart")
+        if before_request is not None:
+            before_request()
+
+    latest = dart_filing_cache.load_latest_filing(corp_code)
+    if latest is None:
+        _before_request()
+        try:
+            filings = _search_business_filings(dart, corp_code, years)
+        except Exception as exc:
+            if "조회된 데이타가 없습니다" in str(exc):
+                return {
+                    "success": False,
+                    "data": {},
+                    "reason": "최근 사업보고서 없음",
+                    "filing": {},
+                }
+            raise
+
+        if not filings or not filings.get("list"):
+            return {
+                "success": False,
+                "data": {},
+                "reason": "최근 사업보고서 없음",
+                "filing": {},
+            }
+
+        latest = filings["list"][0]
+        dart_filing_cache.save_latest_filing(corp_code, latest)
+
+    result = _extract_sections(dart, latest["rcept_no"], _before_request)
+    return {
+        "success": True,
+        "data": result,
+        "reason": "",
+        "filing": {
+            "rcept_no": latest.get("rcept_no", ""),
+            "report_nm": latest.get("report_nm", ""),
+            "rcept_dt": latest.get("rcept_dt", ""),
+        },
+    }
+
+
+def _extract_sections(dart, rcp_no: str, before_request=None) -> dict[str, str]:
+    """사업보고서 주요 섹션 추출. 본문은 rcept_no당 한 번만 내려받아 캐시."""
+    sections = dart_filing_cache.load_sections(rcp_no)
+    if sections is None:
+        sections = _fetch_sections(dart, rcp_no, before_request)
+        if sections is None:
+            return {}
+        dart_filing_cache.save_sections(rcp_no, sections)
+
+    result: dict[str, str] = {}
+    for key, section_name in _SECTIONS:
+        for title, content in sections.items():
+            if section_name in title and content:
+                # 프롬프트 길이는 prompt_budget이 섹션 예산으로 조절
+                result[key] = content
+                break
+    return result
+
+
+def _fetch_sections(dart, rcp_no: str, before_request=None) -> dict[str, str] | None:
+    """문서를 한 번 내려받아 {섹션 제목: 본문}으로 파싱. 본문 API가 없거나 실패 시 None."""
+    # 구버전 API 호환 (최신 버전은 이 경로가 없을 수 있음)
+    if not hasattr(dart.api, "document") or not hasattr(
+        dart.api.document, "get_document"
+    ):
+        return None
+
+    if before_request is not None:
+        before_request()
+    try:
         docs = dart.api.document.get_document(rcp_no)
-        for item in docs.get("list", []):
-            if section_name in item.get("title", ""):
-                content = item.get("sub_docs", [{}])[0].get("text_content", "")
-                if content:
-                    # 최대 2000자로 제한
-                    result[key] = content[:2000]
-                    return
     except Exception:
-        pass
+        logger.warning("DART 문서 조회 실패: rcept_no=%s", rcp_no, exc_info=True)
+        return None
+
+    sections: dict[str, str] = {}
+    for item in docs.get("list", []):
+        title = item.get("title", "")
+        content = (item.get("sub_docs") or [{}])[0].get("text_content", "")
+        if title and content and title not in sections:
+            sections[title] = content
+    return sections
@@ -0,0 +1,183 @@
+"""DART 기업코드 인덱스 — 디스크 캐시 + 프로세스당 1회 로드.
+
+dart.get_corp_list()는 호출마다 전체 기업코드 압축파일(약 10만 개사)을
+내려받아 Corp 객체로 파싱하므로 수 초와 많은 메모리가 든다.
+이 모듈은 기업코드 목록을 JSON 파일로 하루 단위 캐시하고 메모리에 한 번만 올린다.
+기업명 조회 인덱스는 company_resolver가 이 목록으로 만든다.
+
+캐시 위치: $TRENDOPS_CACHE_DIR/dart_corp_index.json (기본 ~/.cache/trendops)
+"""
+
+import json
+import logging
+import os
+import pathlib
+import re
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+
+from crawling import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE = timedelta(hours=float(os.getenv("DART_CORP_INDEX_MAX_AGE_HOURS", "24")))
+_CORP_SUFFIX_RE = re.compile(r"\(주\)|㈜|주식회사|\(유\)|유한회사")
+_TOKEN_SPLIT_RE = re.compile(r"[\s.,]+")
+_ENG_SUFFIXES = frozenset({"co", "corp", "corporation", "inc", "ltd", "limited"})
+
+
+@dataclass(frozen=True)
+class CorpRecord:
+    """기업코드 목록 1건."""
+
+    corp_code: str
+    corp_name: str
+    stock_code: str = ""
+    corp_eng_name: str = ""
+
+    @property
+    def listed(self) -> bool:
+        return bool(self.stock_code.strip())
+
+
+class CorpIndex:
+    """기업코드 목록 + 생성 시각."""
+
+    def __init__(self, records: list[CorpRecord], built_at: datetime):
+        self.records = records
+        self.built_at = built_at
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def is_stale(self) -> bool:
+        return datetime.now(timezone.utc) - self.built_at > _MAX_AGE
+
+
+def normalize_corp_name(name: str) -> str:
+    """비교용 기업명 — 법인 표기((주), 주식회사, Co., Ltd. 등)·공백 제거 + 소문자."""
+    tokens = _TOKEN_SPLIT_RE.split(_CORP_SUFFIX_RE.sub(" ", name).lower())
+    return "".join(t for t in tokens if t and t not in _ENG_SUFFIXES)
+
+
+def cache_dir() -> pathlib.Path:
+    """로컬 디스크 캐시 루트 ($TRENDOPS_CACHE_DIR, 기본 ~/.cache/trendops)."""
+    base = os.getenv("TRENDOPS_CACHE_DIR") or pathlib.Path.home() / ".cache/trendops"
+    return pathlib.Path(base)
+
+
+def cache_path() -> pathlib.Path:
+    return cache_dir() / "dart_corp_index.json"
+
+
+_index: CorpIndex | None = None
+_lock = threading.Lock()
+
+
+def get_index(allow_download: bool = True) -> CorpIndex:
+    """프로세스 공용 기업코드 인덱스. 없거나 하루가 지났으면 디스크/DART에서 갱신.
+
+    DART 다운로드가 실패하면 오래된 인덱스라도 계속 사용한다.
+
+    Args:
+        allow_download: False면 메모리·디스크 캐시만 사용 (오래됐어도 그대로)
+
+    Raises:
+        RuntimeError: 사용할 수 있는 인덱스가 전혀 없는 경우
+    """
+    global _index
+    with _lock:
+        if _index is not None and (not allow_download or not _index.is_stale()):
+            return _index
+
+        index = _index or _load_from_disk()
+        if not allow_download:
+            if index is None:
+                raise RuntimeError("DART 기업코드 인덱스 캐시 없음")
+        elif index is None or index.is_stale():
+            try:
+                index = _build_and_save()
+            except Exception:
+                if index is None:
+                    raise RuntimeError("DART 기업코드 목록 다운로드 실패") from None
+                logger.warning(
+                    "DART 기업코드 목록 갱신 실패, 기존 인덱스 사용 (built_at=%s)",
+                    index.built_at,
+                    exc_info=True,
+                )
+        _index = index
+        return index
+
+
+def reset() -> None:
+    """메모리 인덱스 초기화 (테스트용)."""
+    global _index
+    with _lock:
+        _index = None
+
+
+def _load_from_disk() -> CorpIndex | None:
+    path = cache_path()
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        records = [CorpRecord(**item) for item in data["corps"]]
+        built_at = datetime.fromisoformat(data["built_at"])
+    except Exception:
+        logger.warning("DART 기업코드 캐시 파일 손상: %s", path, exc_info=True)
+        return None
+    return CorpIndex(records, built_at)
+
+
+def _build_and_save() -> CorpIndex:
+    records = _download_corp_codes()
+    index = CorpIndex(records, datetime.now(timezone.utc))
+
+    path = cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(
+        json.dumps(
+            {
+                "built_at": index.built_at.isoformat(),
+                "corps": [asdict(r) for r in records],
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    os.replace(tmp, path)
+    logger.info("DART 기업코드 인덱스 갱신: %d개사 → %s", len(records), path)
+    return index
+
+
+def _download_corp_codes() -> list[CorpRecord]:
+    """DART 기업코드 목록 다운로드 (DART_API_KEY 필요)."""
+    import dart_fss as dart  # type: ignore[import-untyped]
+
+    dart.set_api_key(api_key=os.getenv("DART_API_KEY", ""))
+    rate_limiter.acquire("dart")
+
+    # 가벼운 corpCode 원본 API 우선, 없으면 Corp 객체 목록에서 변환
+    if hasattr(dart.api.filings, "get_corp_code"):
+        items = dart.api.filings.get_corp_code()
+    else:
+        items = [
+            {
+                "corp_code": corp.corp_code,
+                "corp_name": corp.corp_name,
+                "stock_code": getattr(corp, "stock_code", None),
+            }
+            for corp in dart.get_corp_list().corps
+        ]
+    return [
+        CorpRecord(
+            corp_code=str(item["corp_code"]),
+            corp_name=str(item["corp_name"]),
+            stock_code=str(item.get("stock_code") or "").strip(),
+            corp_eng_name=str(item.get("corp_eng_name") or ""),
+        )
+        for item in items
+    ]
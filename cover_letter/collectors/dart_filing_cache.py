@@ -0,0 +1,101 @@
+"""DART 공시 캐시 — 기업별 최신 사업보고서 + rcept_no별 본문 섹션.
+
+제출된 사업보고서는 수정되지 않으므로 접수번호(rcept_no) 단위로
+본문 섹션을 한 번만 내려받아 디스크에 보관한다.
+공시 목록은 마지막 사업보고서 이후 새 보고서가 나올 수 있는 시점
+(DART_FILING_RECHECK_DAYS, 기본 300일)이 지났을 때만 다시 조회하고,
+그 전에는 하루 1회까지만 재확인한다.
+
+캐시 위치: $TRENDOPS_CACHE_DIR/dart/{filings,documents}/*.json
+"""
+
+import json
+import logging
+import os
+import pathlib
+from datetime import datetime, timedelta, timezone
+
+from cover_letter.collectors.dart_corp_index import cache_dir
+
+logger = logging.getLogger(__name__)
+
+_RECHECK_AFTER_FILING = timedelta(
+    days=int(os.getenv("DART_FILING_RECHECK_DAYS", "300"))
+)
+_MIN_RECHECK_INTERVAL = timedelta(days=1)
+
+
+def _path(kind: str, key: str) -> pathlib.Path:
+    return cache_dir() / "dart" / kind / f"{key}.json"
+
+
+def _read(path: pathlib.Path) -> dict | None:
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        logger.warning("DART 캐시 파일 손상: %s", path, exc_info=True)
+        return None
+
+
+def _write(path: pathlib.Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_latest_filing(corp_code: str) -> dict | None:
+    """캐시된 최신 공시 메타데이터. 새 공시가 있을 수 있으면 None (재조회 필요).
+
+    Returns:
+        {"rcept_no": str, "report_nm": str, "rcept_dt": "YYYYMMDD"} 또는 None
+    """
+    cached = _read(_path("filings", corp_code))
+    if cached is None or not cached.get("latest"):
+        return None
+
+    now = datetime.now(timezone.utc)
+    checked_at = datetime.fromisoformat(cached["checked_at"])
+    if now - checked_at < _MIN_RECHECK_INTERVAL:
+        return cached["latest"]
+
+    latest = cached["latest"]
+    if "사업보고서" in latest.get("report_nm", "") and latest.get("rcept_dt"):
+        filed = datetime.strptime(latest["rcept_dt"], "%Y%m%d").replace(
+            tzinfo=timezone.utc
+        )
+        if now - filed < _RECHECK_AFTER_FILING:
+            return latest
+    return None
+
+
+def save_latest_filing(corp_code: str, latest: dict) -> None:
+    _write(
+        _path("filings", corp_code),
+        {
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "latest": {
+                "rcept_no": latest.get("rcept_no", ""),
+                "report_nm": latest.get("report_nm", ""),
+                "rcept_dt": latest.get("rcept_dt", ""),
+            },
+        },
+    )
+
+
+def load_sections(rcept_no: str) -> dict[str, str] | None:
+    """rcept_no 문서의 섹션 {제목: 본문}. 캐시에 없으면 None."""
+    cached = _read(_path("documents", rcept_no))
+    return cached.get("sections") if cached else None
+
+
+def save_sections(rcept_no: str, sections: dict[str, str]) -> None:
+    _write(
+        _path("documents", rcept_no),
+        {
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "sections": sections,
+        },
+    )
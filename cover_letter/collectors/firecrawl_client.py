@@ -0,0 +1,182 @@
+"""Firecrawl 검색 공용 클라이언트.
+
+홈페이지(website_crawler)·JD(jd_crawler)·뉴스 fallback(naver_collector)이
+같은 클라이언트를 공유해 다음을 함께 쓴다.
+
+- 연결 풀: requests.Session (keep-alive), API 키별 인스턴스 1개
+- 호출 속도 제한: 공용 토큰 버킷 rate_limiter "firecrawl" (429는 1회 백오프 재시도)
+- 응답 캐시: 디스크 영속 response_cache "firecrawl_search", (query, limit, lang, scrape) 키
+  유효 시간 FIRECRAWL_CACHE_TTL_SECONDS (기본 1800초), 빈 결과는 저장하지 않음
+- 결과 정규화: API 버전별 응답 형태(data 리스트 / web·news 그룹)를 SearchResult로
+"""
+
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from crawling import rate_limiter, response_cache
+
+logger = logging.getLogger(__name__)
+
+SEARCH_URL = "https://api.firecrawl.dev/v1/search"
+
+_CACHE_NAMESPACE = "firecrawl_search"
+_CACHE_TTL = float(os.getenv("FIRECRAWL_CACHE_TTL_SECONDS", "1800"))
+_MAX_RETRIES = 1
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """Firecrawl 검색 결과 1건."""
+
+    url: str
+    title: str = ""
+    description: str = ""
+    content: str = ""  # 스크랩된 본문 (markdown 등). 없으면 빈 문자열
+    published_date: str = ""
+
+    @property
+    def text(self) -> str:
+        """본문이 있으면 본문, 없으면 요약."""
+        return (self.content or self.description).strip()
+
+
+def normalize_items(results: Any) -> list[SearchResult]:
+    """Firecrawl search 응답을 SearchResult 리스트로 정규화.
+
+    API·SDK 버전에 따라 list / {"data": [...]} / {"data": {"web", "news"}} /
+    Pydantic(SearchData) 형태가 다르다.
+    """
+    if isinstance(results, dict):
+        results = results.get("data", results)
+
+    if isinstance(results, list):
+        entries: list[Any] = results
+    elif isinstance(results, dict):
+        entries = [*(results.get("web") or []), *(results.get("news") or [])]
+    elif hasattr(results, "web") or hasattr(results, "news"):
+        entries = [
+            *(getattr(results, "web", None) or []),
+            *(getattr(results, "news", None) or []),
+        ]
+    else:
+        return []
+
+    items: list[SearchResult] = []
+    for entry in entries:
+        if hasattr(entry, "model_dump"):
+            entry = entry.model_dump()
+        if isinstance(entry, dict):
+            items.append(_to_result(entry))
+    return items
+
+
+def _to_result(item: dict[str, Any]) -> SearchResult:
+    metadata = item.get("metadata") or {}
+    return SearchResult(
+        url=item.get("url") or item.get("sourceURL") or metadata.get("sourceURL", ""),
+        title=item.get("title") or metadata.get("title", ""),
+        description=item.get("description") or item.get("snippet") or "",
+        content=item.get("markdown") or item.get("content") or item.get("text") or "",
+        published_date=item.get("publishedDate") or item.get("date") or "",
+    )
+
+
+class FirecrawlClient:
+    """연결 풀·속도 제한·응답 캐시를 갖춘 Firecrawl 검색 클라이언트."""
+
+    def __init__(
+        self,
+        api_key: str,
+        cache: response_cache.ResponseCache | None = None,
+    ):
+        """
+        Args:
+            api_key: Firecrawl API 키
+            cache: 응답 캐시 (기본: 프로세스 공용 디스크 캐시)
+        """
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=16))
+        self._session.headers.update(
+            {
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            }
+        )
+        self._cache = cache or response_cache.get_cache()
+
+    def search(
+        self, query: str, limit: int = 10, lang: str = "", scrape: bool = False
+    ) -> list[SearchResult]:
+        """Firecrawl 검색 (캐시 우선).
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+            lang: 결과 언어 (예: "ko", 빈 문자열이면 지정하지 않음)
+            scrape: True면 결과 페이지 본문(markdown)도 함께 받음 (호출 비용 증가)
+
+        Raises:
+            requests.exceptions.RequestException: API 호출 실패 시
+        """
+        payload: dict[str, Any] = {"query": query, "limit": limit}
+        if lang:
+            payload["lang"] = lang
+        if scrape:
+            payload["scrapeOptions"] = {"formats": ["markdown"]}
+
+        cached = self._cache.get(_CACHE_NAMESPACE, payload)
+        if cached is not None:
+            return [SearchResult(**item) for item in cached]
+
+        for attempt in range(_MAX_RETRIES + 1):
+            rate_limiter.acquire("firecrawl")
+            response = self._session.post(SEARCH_URL, json=payload, timeout=15)
+            if response.status_code != 429 or attempt == _MAX_RETRIES:
+                break
+            delay = rate_limiter.retry_delay(
+                attempt, response.headers.get("Retry-After")
+            )
+            logger.warning("Firecrawl 429, %.1f초 후 재시도", delay)
+            rate_limiter.penalize("firecrawl", delay)
+
+        response.raise_for_status()
+        results = normalize_items(response.json())
+        if results:
+            self._cache.put(
+                _CACHE_NAMESPACE, payload, [asdict(r) for r in results], ttl=_CACHE_TTL
+            )
+        return results
+
+
+_clients: dict[str, FirecrawlClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(api_key: str | None = None) -> FirecrawlClient:
+    """API 키별 프로세스 공용 클라이언트.
+
+    Raises:
+        ValueError: FIRECRAWL_API_KEY 미설정
+    """
+    api_key = api_key or os.getenv("FIRECRAWL_API_KEY", "")
+    if not api_key:
+        raise ValueError("FIRECRAWL_API_KEY 미설정")
+
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = FirecrawlClient(api_key)
+            _clients[api_key] = client
+        return client
+
+
+def reset() -> None:
+    """공용 클라이언트 초기화 (테스트용)."""
+    with _clients_lock:
+        _clients.clear()
@@ -5,41 +5,29 @@ spec: FR-003d — 기업명·직무명으로 JD 자동 수집.
 
 import logging
 import os
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
 
-logger = logging.getLogger(__name__)
-
-
-def _normalize_firecrawl_items(results: Any) -> list[dict[str, Any]]:
-    """Firecrawl search 응답을 dict 리스트로 정규화."""
-    if isinstance(results, list):
-        return [item for item in results if isinstance(item, dict)]
-
-    if hasattr(results, "web") or hasattr(results, "news"):
-        items: list[dict[str, Any]] = []
-        for group in (getattr(results, "web", None), getattr(results, "news", None)):
-            for entry in group or []:
-                if isinstance(entry, dict):
-                    items.append(entry)
-                elif hasattr(entry, "model_dump"):
-                    items.append(entry.model_dump())
-        return items
+from cover_letter.collectors import firecrawl_client, jd_ranker, pdf_extractor
 
-    if isinstance(results, dict):
-        raw_items = results.get("data") or results.get("web") or []
-        return [item for item in raw_items if isinstance(item, dict)]
+logger = logging.getLogger(__name__)
 
-    return []
+_SEARCH_LIMIT = int(os.getenv("JD_SEARCH_LIMIT", "5"))
+_MAX_ALTERNATES = int(os.getenv("JD_MAX_ALTERNATES", "2"))
+_MAX_TEXT_CHARS = 5000
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="jd-fetch")
 
 
 def crawl_jd(company_name: str, job_title: str) -> dict:
     """기업명과 직무명으로 JD 텍스트 자동 수집.
 
     수집 우선순위:
-    1. Firecrawl search API — 채용공고 페이지 텍스트 추출
-    2. PDF URL 감지 시 pdfminer.six 폴백
+    1. Firecrawl search API — 검색 결과 본문(markdown)을 함께 받아 후보로 사용
+    2. PDF URL 감지 시 pdfminer.six 폴백 (pdf_extractor, 앞쪽 페이지만)
     3. 실패 시 manual 입력 안내
 
+    후보는 동시에 가져온 뒤 jd_ranker 점수로 정렬해 가장 채용공고다운 것을
+    고르고, 나머지 상위 후보는 alternates로 함께 돌려준다.
+
     Args:
         company_name: 기업명 (예: "카카오")
         job_title: 직무명 (예: "백엔드 개발자")
@@ -51,143 +39,109 @@ def crawl_jd(company_name: str, job_title: str) -> dict:
             "source_url": str,        # 출처 URL
             "source_type": str,       # 'firecrawl' | 'pdf' | 'manual'
             "error_reason": str,      # 실패 원인(성공 시 빈 문자열)
+            "score": float,           # jd_ranker 점수 (실패 시 0)
+            "alternates": list[dict], # 차순위 후보 (text·source_url·source_type·
+                                      #  title·score), 최대 JD_MAX_ALTERNATES개
         }
     """
     result = _crawl_via_firecrawl(company_name, job_title)
     if result["success"]:
         return result
+    return _failure(result.get("error_reason", "JD 자동 수집 실패"))
 
+
+def _failure(reason: str) -> dict:
     return {
         "success": False,
         "text": None,
         "source_url": "",
         "source_type": "manual",
-        "error_reason": result.get("error_reason", "JD 자동 수집 실패"),
+        "error_reason": reason,
+        "score": 0.0,
+        "alternates": [],
     }
 
 
 def _crawl_via_firecrawl(company_name: str, job_title: str) -> dict:
-    """Firecrawl search API로 JD 수집."""
+    """Firecrawl search API로 JD 후보 수집 후 점수순 선택."""
     try:
-        from firecrawl import FirecrawlApp
-    except ImportError:
-        return {
-            "success": False,
-            "text": None,
-            "source_url": "",
-            "source_type": "manual",
-            "error_reason": "firecrawl 미설치",
-        }
-
-    api_key = os.getenv("FIRECRAWL_API_KEY", "")
-    if not api_key:
-        return {
-            "success": False,
-            "text": None,
-            "source_url": "",
-            "source_type": "manual",
-            "error_reason": "FIRECRAWL_API_KEY 미설정",
-        }
+        client = firecrawl_client.get_client()
+    except ValueError as exc:
+        return _failure(str(exc))
 
     try:
-        app = FirecrawlApp(api_key=api_key)
         query = f"{company_name} {job_title} 채용공고 JD 직무기술서 자격요건 우대사항"
-        results: Any = app.search(query, limit=3)
-
-        items = _normalize_firecrawl_items(results)
-        if not items:
-            return {
-                "success": False,
-                "text": None,
-                "source_url": "",
-                "source_type": "manual",
-                "error_reason": "검색 결과 없음",
-            }
-
-        last_reason = "검색 결과에서 텍스트 추출 실패"
-        for item in items:
-            url: str = item.get("url") or item.get("sourceURL") or ""
-            content: str = (
-                item.get("markdown")
-                or item.get("content")
-                or item.get("text")
-                or item.get("description")
-                or ""
-            ).strip()
-
-            # PDF URL이 감지되고 텍스트가 없으면 pdfminer 폴백
-            if url.lower().endswith(".pdf") and not content:
-                pdf_text = _extract_pdf_from_url(url)
-                if pdf_text:
-                    return {
-                        "success": True,
-                        "text": pdf_text,
-                        "source_url": url,
-                        "source_type": "pdf",
-                        "error_reason": "",
-                    }
-                last_reason = "PDF 텍스트 추출 실패"
-                continue
-
-            if content:
-                return {
-                    "success": True,
-                    "text": content[:5000],
-                    "source_url": url,
-                    "source_type": "firecrawl",
-                    "error_reason": "",
-                }
-        return {
-            "success": False,
-            "text": None,
-            "source_url": "",
-            "source_type": "manual",
-            "error_reason": last_reason,
-        }
+        items = client.search(query, limit=_SEARCH_LIMIT, scrape=True)
     except Exception:
         logger.exception("JD 수집 실패: company=%s, job=%s", company_name, job_title)
-        return {
-            "success": False,
-            "text": None,
-            "source_url": "",
-            "source_type": "manual",
-            "error_reason": "Firecrawl 검색 호출 실패",
-        }
+        return _failure("Firecrawl 검색 호출 실패")
+
+    if not items:
+        return _failure("검색 결과 없음")
+
+    # PDF 추출 등 후보별 본문 확보는 동시에 (PDF 파싱은 프로세스 풀)
+    futures = [_FETCH_EXECUTOR.submit(_fetch_candidate, item) for item in items]
+    candidates = [c for c in (f.result() for f in futures) if c is not None]
+    if not candidates:
+        pdf_only = all(_is_pdf_without_content(item) for item in items)
+        return _failure(
+            "PDF 텍스트 추출 실패" if pdf_only else "검색 결과에서 텍스트 추출 실패"
+        )
 
+    best, *others = jd_ranker.rank(candidates, company_name, job_title)
+    logger.info(
+        "JD 후보 선택: company=%s job=%s url=%s score=%.3f features=%s",
+        company_name,
+        job_title,
+        best.url,
+        best.score,
+        best.features,
+    )
     return {
-        "success": False,
-        "text": None,
-        "source_url": "",
-        "source_type": "manual",
-        "error_reason": "JD 자동 수집 실패",
+        "success": True,
+        "text": best.text,
+        "source_url": best.url,
+        "source_type": best.source_type,
+        "error_reason": "",
+        "score": best.score,
+        "alternates": [
+            {
+                "text": c.text,
+                "source_url": c.url,
+                "source_type": c.source_type,
+                "title": c.title,
+                "score": c.score,
+            }
+            for c in others[:_MAX_ALTERNATES]
+        ],
     }
 
 
-def _extract_pdf_from_url(url: str) -> str | None:
-    """PDF URL에서 pdfminer.six로 텍스트 추출. 실패 시 None."""
-    try:
-        import io
+def _fetch_candidate(
+    item: firecrawl_client.SearchResult,
+) -> jd_ranker.JDCandidate | None:
+    """검색 결과 1건의 본문 확보. 본문이 없으면 None."""
+    if _is_pdf_without_content(item):
+        text = _extract_pdf_from_url(item.url) or ""
+        source_type = "pdf"
+    else:
+        text = item.text
+        source_type = "firecrawl"
+    if not text:
+        return None
+    return jd_ranker.JDCandidate(
+        url=item.url,
+        text=text[:_MAX_TEXT_CHARS],
+        title=item.title,
+        source_type=source_type,
+        published_date=item.published_date,
+    )
 
-        import requests
-        from pdfminer.high_level import extract_text_to_fp
-        from pdfminer.layout import LAParams
 
-        response = requests.get(
-            url,
-            headers={"User-Agent": "Mozilla/5.0 (compatible; TrendOpsBot/1.0)"},
-            timeout=20,
-        )
-        response.raise_for_status()
-
-        out = io.StringIO()
-        extract_text_to_fp(
-            io.BytesIO(response.content),
-            out,
-            laparams=LAParams(),
-            output_type="text",
-            codec="utf-8",
-        )
-        text = out.getvalue().strip()
-        return text[:5000] if text else None
-    except Exception:
-        return None
+def _is_pdf_without_content(item: firecrawl_client.SearchResult) -> bool:
+    return item.url.lower().endswith(".pdf") and not item.content
+
+
+def _extract_pdf_from_url(url: str) -> str | None:
+    """PDF URL에서 텍스트 추출 (pdf_extractor 워커 프로세스). 실패 시 None."""
+    return pdf_extractor.extract_text_from_url(url)
@@ -0,0 +1,124 @@
+"""JD 후보 점수화 — 검색 결과 중 실제 채용공고에 가까운 페이지 고르기.
+
+LLM 없이 로컬 특징만 쓴다 (0~1, 높을수록 좋음).
+    - 기업명: 제목·URL·본문 등장 여부와 본문 밀도
+    - 직무명: 직무명 단어가 본문·제목에 등장하는 비율
+    - 섹션 표식: "자격요건", "우대사항", "주요업무" 등 채용공고 섹션 제목 수
+    - 최신성: 게시일이 있으면 최근일수록 높게 (없으면 중간값)
+    - 길이: 너무 짧은 본문(검색 요약만 있는 경우 등)은 감점
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from cover_letter.date_utils import parse_pub_date
+
+SECTION_MARKERS = (
+    "자격요건",
+    "지원자격",
+    "우대사항",
+    "주요업무",
+    "담당업무",
+    "채용절차",
+    "전형절차",
+    "근무조건",
+    "qualifications",
+    "requirements",
+    "responsibilities",
+    "preferred",
+)
+_WEIGHTS = {
+    "company": 0.3,
+    "job": 0.25,
+    "sections": 0.3,
+    "recency": 0.1,
+    "length": 0.05,
+}
+_MIN_TEXT_CHARS = 300
+_FRESH_DAYS = 60
+_STALE_DAYS = 365
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class JDCandidate:
+    """JD 후보 1건 (점수화 전후 공용)."""
+
+    url: str
+    text: str
+    title: str = ""
+    source_type: str = "firecrawl"  # 'firecrawl' | 'pdf'
+    published_date: str = ""
+    score: float = 0.0
+    features: dict[str, float] = field(default_factory=dict)
+
+
+def score(
+    candidate: JDCandidate,
+    company_name: str,
+    job_title: str,
+    now: datetime | None = None,
+) -> float:
+    """후보 점수 계산 (candidate.score·features도 채움)."""
+    text = _normalize(candidate.text)
+    header = _normalize(f"{candidate.title} {candidate.url}")
+    company = _normalize(company_name)
+
+    company_hits = text.count(company) if company else 0
+    features = {
+        "company": (
+            0.0
+            if not company
+            else 0.5 * (company in header)
+            + 0.5 * min(company_hits * 1000 / max(len(text), 1) / 2, 1.0)
+        ),
+        "job": _job_coverage(job_title, f"{header} {text}"),
+        "sections": min(sum(marker in text for marker in SECTION_MARKERS) / 3, 1.0),
+        "recency": _recency(candidate.published_date, now),
+        "length": min(len(text) / _MIN_TEXT_CHARS, 1.0),
+    }
+    candidate.features = {key: round(value, 3) for key, value in features.items()}
+    candidate.score = round(
+        sum(_WEIGHTS[key] * value for key, value in features.items()), 4
+    )
+    return candidate.score
+
+
+def rank(
+    candidates: list[JDCandidate], company_name: str, job_title: str
+) -> list[JDCandidate]:
+    """점수 내림차순 정렬 (동점이면 검색 순서 유지)."""
+    now = datetime.now(timezone.utc)
+    for candidate in candidates:
+        score(candidate, company_name, job_title, now)
+    return sorted(candidates, key=lambda c: c.score, reverse=True)
+
+
+def _normalize(text: str) -> str:
+    """소문자 + 공백 제거 ("백엔드 개발자"와 "백엔드개발자"를 같게 본다)."""
+    return _WHITESPACE_RE.sub("", text).casefold()
+
+
+def _job_coverage(job_title: str, haystack: str) -> float:
+    """직무명 단어 중 haystack에 등장하는 비율 (붙여 쓴 직무명 전체가 있으면 1)."""
+    words = [_normalize(word) for word in job_title.split() if word.strip()]
+    if not words:
+        return 0.0
+    haystack = _normalize(haystack)
+    if "".join(words) in haystack:
+        return 1.0
+    return sum(word in haystack for word in words) / len(words)
+
+
+def _recency(published_date: str, now: datetime | None) -> float:
+    """게시일 기준 최신성. 날짜를 모르면 0.5."""
+    published = parse_pub_date(published_date)
+    if published is None:
+        return 0.5
+    age_days = ((now or datetime.now(timezone.utc)) - published).days
+    if age_days <= _FRESH_DAYS:
+        return 1.0
+    if age_days >= _STALE_DAYS:
+        return 0.0
+    return 1 - (age_days - _FRESH_DAYS) / (_STALE_DAYS - _FRESH_DAYS)
@@ -1,91 +1,222 @@
 """Naver News 수집기 — 기존 crawling 모듈 활용 + Firecrawl fallback.
 
 5건 미만 수집 시 FIRECRAWL_API_KEY가 있으면 Firecrawl API로 fallback.
+
+NEWS_HEDGE_ENABLED(기본 true)면 Firecrawl을 Naver 응답 뒤에 순차 실행하지 않고
+투기적으로 함께 띄운다:
+    - 같은 검색어의 최근 Naver 결과가 5건 미만이었으면 즉시
+    - 아니면 Naver가 NEWS_HEDGE_DELAY_SECONDS(기본 1.5초) 안에 응답하지 않을 때
+도착하는 순서대로 링크 중복 없이 병합하고, 전체 NEWS_DEADLINE_SECONDS
+(기본 12초)가 지나면 그때까지 모인 기사만 반환한다.
+
+NEWS_LOCAL_FIRST(기본 true)면 먼저 로컬 뉴스 코퍼스(news_article)에서
+NEWS_LOCAL_MAX_AGE_DAYS(기본 7일) 안의 기사를 찾고, 5건 이상이면 외부 API를
+호출하지 않는다. 외부에서 수집한 기사는 다음 조회를 위해 코퍼스에 저장한다.
+뉴스 갱신(백그라운드 갱신·뉴스 TTL 재수집)은 local_first=False로 코퍼스를 건너뛰고
+항상 외부 API를 호출한다.
 """
 
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from cover_letter import company_resolver, news_store
+from cover_letter.collectors import firecrawl_client
+from cover_letter.db import get_conn as _get_conn
+from crawling import naver_client
+
+logger = logging.getLogger(__name__)
+
+_MIN_ARTICLES = 5
+_LOCAL_FIRST = os.getenv("NEWS_LOCAL_FIRST", "true").lower() == "true"
+_LOCAL_MAX_AGE_DAYS = int(os.getenv("NEWS_LOCAL_MAX_AGE_DAYS", "7"))
+_HEDGE_ENABLED = os.getenv("NEWS_HEDGE_ENABLED", "true").lower() == "true"
+_HEDGE_DELAY = float(os.getenv("NEWS_HEDGE_DELAY_SECONDS", "1.5"))
+_DEADLINE = float(os.getenv("NEWS_DEADLINE_SECONDS", "12"))
 
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="news-fetch")
 
-def collect_news(company_name: str, job_title: str = "") -> list[dict]:
+# 검색어 → 최근 Naver 결과 건수 (LRU, 얇은 검색어 예측용)
+_HISTORY_SIZE = 2000
+_naver_counts: OrderedDict[str, int] = OrderedDict()
+_history_lock = threading.Lock()
+
+
+def collect_news(
+    company_name: str, job_title: str = "", local_first: bool = True
+) -> list[dict]:
     """Naver News API로 기업 관련 뉴스 수집.
 
     Args:
         company_name: 기업명
         job_title: 직무명 (검색어 보강에 사용)
+        local_first: False면 로컬 코퍼스를 건너뛰고 외부 API로만 수집
+            (수집한 기사는 코퍼스에 저장)
 
     Returns:
         뉴스 항목 목록:
         [{"title": str, "description": str, "pubDate": str, "link": str}]
         수집 실패 시 빈 리스트 반환.
     """
+    # 영문명·별칭·법인 표기는 DART 등록 기업명으로 통일 (예: "kakao corp" → "카카오")
+    company_name = company_resolver.canonical_name(company_name)
     query = f"{company_name} {job_title}".strip() if job_title else company_name
 
+    local = (
+        _search_local(company_name, job_title) if _LOCAL_FIRST and local_first else []
+    )
+    if len(local) >= _MIN_ARTICLES:
+        return local
+
+    articles = _collect_remote(query)
+    if _LOCAL_FIRST:
+        _save_local(company_name, articles)
+    _merge(articles, local)
+    return articles
+
+
+def _collect_remote(query: str) -> list[dict]:
+    """Naver(+ Firecrawl fallback)로 외부 뉴스 수집."""
+    firecrawl_key = os.getenv("FIRECRAWL_API_KEY", "")
+    if _HEDGE_ENABLED and firecrawl_key:
+        return _collect_hedged(query, firecrawl_key)
+
     articles = _fetch_naver_news(query, display=10)
+    _record_naver_count(query, len(articles))
 
-    if len(articles) < 5:
-        firecrawl_key = os.getenv("FIRECRAWL_API_KEY", "")
-        if firecrawl_key:
-            fallback = _fetch_firecrawl(query, firecrawl_key)
-            # 중복 없이 병합
-            existing_links = {a.get("link") for a in articles}
-            for item in fallback:
-                if item.get("link") not in existing_links:
-                    articles.append(item)
+    if len(articles) < _MIN_ARTICLES and firecrawl_key:
+        _merge(articles, _fetch_firecrawl(query, firecrawl_key))
 
     return articles
 
 
-def _fetch_naver_news(query: str, display: int = 10) -> list[dict]:
-    """Naver OpenAPI로 뉴스 검색. 자격증명 없으면 빈 리스트 반환."""
-    client_id = os.getenv("NAVER_CLIENT_ID", "")
-    client_secret = os.getenv("NAVER_CLIENT_SECRET", "")
-
-    if not client_id or not client_secret:
+def _search_local(company_name: str, job_title: str) -> list[dict]:
+    """로컬 뉴스 코퍼스 조회. DB를 쓸 수 없으면 빈 리스트."""
+    try:
+        conn = _get_conn()
+        try:
+            return news_store.search(
+                conn, company_name, job_title, max_age_days=_LOCAL_MAX_AGE_DAYS
+            )
+        finally:
+            conn.close()
+    except Exception:
+        logger.warning("로컬 뉴스 조회 실패: company=%s", company_name, exc_info=True)
         return []
 
+
+def _save_local(company_name: str, articles: list[dict]) -> None:
+    """외부에서 수집한 기사를 코퍼스에 저장. 실패는 무시."""
+    if not articles:
+        return
     try:
-        import requests  # type: ignore[import-untyped]
-
-        response = requests.get(
-            "https://openapi.naver.com/v1/search/news.json",
-            params={"query": query, "display": str(display), "sort": "date"},
-            headers={
-                "X-Naver-Client-Id": client_id,
-                "X-Naver-Client-Secret": client_secret,
-            },
-            timeout=10,
-        )
-        response.raise_for_status()
-        data = response.json()
-        return list(data.get("items", []))
+        conn = _get_conn()
+        try:
+            news_store.save(conn, company_name, articles)
+        finally:
+            conn.close()
     except Exception:
+        logger.warning("로컬 뉴스 저장 실패: company=%s", company_name, exc_info=True)
+
+
+def reset() -> None:
+    """검색어별 Naver 결과 이력 초기화 (테스트용)."""
+    with _history_lock:
+        _naver_counts.clear()
+
+
+def _collect_hedged(query: str, firecrawl_key: str) -> list[dict]:
+    """Naver와 Firecrawl을 겹쳐 실행하고 도착 순서대로 병합 (전체 마감 시간 내)."""
+    started = time.monotonic()
+    naver: Future = _EXECUTOR.submit(_fetch_naver_news, query, 10)
+    firecrawl: Future | None = None
+    if _predicted_thin(query):
+        firecrawl = _EXECUTOR.submit(_fetch_firecrawl, query, firecrawl_key)
+
+    articles: list[dict] = []
+    pending = {f for f in (naver, firecrawl) if f is not None}
+    while pending:
+        remaining = _DEADLINE - (time.monotonic() - started)
+        if remaining <= 0:
+            break
+        # Firecrawl이 아직 없으면 헤지 시점까지만 Naver를 기다린다
+        timeout = remaining
+        if firecrawl is None:
+            timeout = min(
+                remaining, max(_HEDGE_DELAY - (time.monotonic() - started), 0)
+            )
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+        if naver in done:
+            naver_articles = naver.result()
+            _record_naver_count(query, len(naver_articles))
+            _merge(articles, naver_articles)
+            if len(naver_articles) >= _MIN_ARTICLES:
+                break  # 진행 중인 Firecrawl 결과는 버린다
+        if firecrawl in done:
+            _merge(articles, firecrawl.result())
+
+        if firecrawl is None:
+            # Naver가 얇게 끝났거나 헤지 시점까지 응답이 없음
+            firecrawl = _EXECUTOR.submit(_fetch_firecrawl, query, firecrawl_key)
+            pending.add(firecrawl)
+
+    return articles
+
+
+def _merge(articles: list[dict], incoming: list[dict]) -> None:
+    """링크 중복 없이 incoming을 articles 뒤에 추가."""
+    existing_links = {a.get("link") for a in articles}
+    for item in incoming:
+        if item.get("link") not in existing_links:
+            articles.append(item)
+            existing_links.add(item.get("link"))
+
+
+def _predicted_thin(query: str) -> bool:
+    """같은 검색어의 직전 Naver 결과가 5건 미만이었는지."""
+    with _history_lock:
+        count = _naver_counts.get(query)
+    return count is not None and count < _MIN_ARTICLES
+
+
+def _record_naver_count(query: str, count: int) -> None:
+    with _history_lock:
+        _naver_counts[query] = count
+        _naver_counts.move_to_end(query)
+        while len(_naver_counts) > _HISTORY_SIZE:
+            _naver_counts.popitem(last=False)
+
+
+def _fetch_naver_news(query: str, display: int = 10) -> list[dict]:
+    """Naver OpenAPI로 뉴스 검색 (크롤러와 공용 클라이언트). 자격증명 없으면 빈 리스트."""
+    try:
+        client = naver_client.get_client()
+    except ValueError:
         return []
 
+    # 페이지 오류는 클라이언트가 흡수하고 그때까지의 기사를 반환
+    return client.crawl_news(query, max_pages=1, display=display, sort="date")
+
 
 def _fetch_firecrawl(query: str, api_key: str) -> list[dict]:
-    """Firecrawl API로 뉴스 검색 fallback. 실패 시 빈 리스트 반환."""
+    """Firecrawl 검색으로 뉴스 fallback (공용 클라이언트 캐시 사용). 실패 시 빈 리스트."""
     try:
-        import requests  # type: ignore[import-untyped]
-
-        response = requests.post(
-            "https://api.firecrawl.dev/v1/search",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={"query": query, "limit": 10, "lang": "ko"},
-            timeout=15,
+        results = firecrawl_client.get_client(api_key).search(
+            query, limit=10, lang="ko"
         )
-        response.raise_for_status()
-        results = response.json().get("data", [])
-        return [
-            {
-                "title": r.get("title", ""),
-                "description": r.get("description", ""),
-                "pubDate": r.get("publishedDate", ""),
-                "link": r.get("url", ""),
-            }
-            for r in results
-        ]
     except Exception:
         return []
+
+    return [
+        {
+            "title": r.title,
+            "description": r.description,
+            "pubDate": r.published_date,
+            "link": r.url,
+        }
+        for r in results
+    ]
@@ -0,0 +1,182 @@
+"""PDF 텍스트 추출 서비스 — JD PDF 폴백용.
+
+pdfminer 파싱은 CPU를 오래 점유하므로 Streamlit 프로세스 밖의 워커 프로세스에서
+실행하고, 호출 쪽은 제한 시간까지만 기다린다.
+
+- 다운로드: 스트리밍, PDF_MAX_BYTES(기본 10MB)를 넘으면 중단
+- 파싱: 앞쪽 PDF_MAX_PAGES(기본 10)쪽까지, PDF_MAX_CHARS(기본 5000자)가 모이면 중단
+- 실행: 최대 PDF_EXTRACT_WORKERS(기본 4, jd_crawler 동시 수집 수)개 워커 프로세스.
+  빈 워커를 기다리는 시간은 제외하고 파싱 시간만 PDF_EXTRACT_TIMEOUT_SECONDS
+  (기본 20초)로 제한하며, 초과하면 그 작업을 실행 중인 워커 하나만 종료하고 None 반환
+"""
+
+import io
+import logging
+import multiprocessing
+import os
+import threading
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+_USER_AGENT = "Mozilla/5.0 (compatible; TrendOpsBot/1.0)"
+_MAX_BYTES = int(os.getenv("PDF_MAX_BYTES", str(10 * 1024 * 1024)))
+_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "10"))
+_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "5000"))
+_TIMEOUT = float(os.getenv("PDF_EXTRACT_TIMEOUT_SECONDS", "20"))
+_WORKERS = max(int(os.getenv("PDF_EXTRACT_WORKERS", "4")), 1)
+_CHUNK_SIZE = 64 * 1024
+
+# 빈 워커 수만큼만 동시에 파싱 (대기 시간은 제한 시간에 포함하지 않는다)
+_slots = threading.BoundedSemaphore(_WORKERS)
+_idle: list["_Worker"] = []
+_idle_lock = threading.Lock()
+
+
+def extract_text_from_url(url: str) -> str | None:
+    """PDF URL에서 앞부분 텍스트 추출 (최대 PDF_MAX_CHARS자). 실패 시 None."""
+    try:
+        data = download(url)
+    except Exception as e:
+        logger.warning("PDF 다운로드 실패: url=%s reason=%s", url, e)
+        return None
+
+    try:
+        text = _run_in_worker(data)
+    except TimeoutError:
+        logger.warning("PDF 파싱 시간 초과(%.0f초): url=%s", _TIMEOUT, url)
+        return None
+    except Exception:
+        logger.warning("PDF 파싱 실패: url=%s", url, exc_info=True)
+        return None
+
+    return text or None
+
+
+def download(url: str, max_bytes: int = _MAX_BYTES) -> bytes:
+    """PDF 스트리밍 다운로드.
+
+    Raises:
+        ValueError: 응답 크기가 max_bytes를 넘는 경우
+        requests.exceptions.RequestException: 요청 실패 또는 오류 응답
+    """
+    with requests.get(
+        url, headers={"User-Agent": _USER_AGENT}, timeout=20, stream=True
+    ) as response:
+        response.raise_for_status()
+        declared = int(response.headers.get("Content-Length") or 0)
+        if declared > max_bytes:
+            raise ValueError(f"PDF 크기 초과: {declared} bytes")
+
+        buffer = io.BytesIO()
+        for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+            buffer.write(chunk)
+            if buffer.tell() > max_bytes:
+                raise ValueError(f"PDF 크기 초과: {max_bytes} bytes 이상")
+        return buffer.getvalue()
+
+
+def _extract_text(data: bytes, max_pages: int, max_chars: int) -> str:
+    """워커 프로세스에서 실행: 앞쪽 페이지부터 텍스트를 모으다 max_chars에서 중단."""
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LAParams, LTTextContainer
+
+    parts: list[str] = []
+    collected = 0
+    for page in extract_pages(
+        io.BytesIO(data), laparams=LAParams(), maxpages=max_pages
+    ):
+        for element in page:
+            if isinstance(element, LTTextContainer):
+                text = element.get_text()
+                parts.append(text)
+                collected += len(text)
+        if collected >= max_chars:
+            break
+    return "".join(parts).strip()[:max_chars]
+
+
+def _run_in_worker(data: bytes) -> str:
+    """빈 워커에서 _extract_text 실행.
+
+    Raises:
+        TimeoutError: 파싱이 _TIMEOUT을 넘김 (해당 워커는 종료)
+        RuntimeError: 워커에서 파싱 예외 발생
+    """
+    with _slots:
+        worker = _checkout()
+        try:
+            ok, value = worker.call((data, _MAX_PAGES, _MAX_CHARS), _TIMEOUT)
+        except BaseException:
+            # 시간 초과·워커 비정상 종료: 이 워커만 버리고 다음 호출에서 새로 띄운다
+            worker.kill()
+            raise
+        with _idle_lock:
+            _idle.append(worker)
+
+    if not ok:
+        raise RuntimeError(value)
+    return value
+
+
+def _checkout() -> "_Worker":
+    with _idle_lock:
+        while _idle:
+            worker = _idle.pop()
+            if worker.alive():
+                return worker
+            worker.kill()
+    return _Worker()
+
+
+class _Worker:
+    """파싱 전용 워커 프로세스 1개 (파이프로 작업 1건씩 주고받음).
+
+    Streamlit 등 멀티스레드 프로세스에서 fork하지 않도록 spawn으로 띄운다.
+    """
+
+    def __init__(self):
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_worker_loop, args=(child,), name="pdf-extract", daemon=True
+        )
+        self._process.start()
+        child.close()
+
+    def call(self, args: tuple, timeout: float) -> tuple[bool, str]:
+        """작업 전송 후 timeout까지 결과 대기. 초과 시 TimeoutError."""
+        self._conn.send(args)
+        if not self._conn.poll(timeout):
+            raise TimeoutError(f"PDF 파싱 {timeout:.0f}초 초과")
+        return self._conn.recv()
+
+    def alive(self) -> bool:
+        return self._process.is_alive()
+
+    def kill(self) -> None:
+        self._process.kill()
+        self._process.join(timeout=1)
+        self._conn.close()
+
+
+def _worker_loop(conn) -> None:
+    """워커 프로세스 본체: (data, max_pages, max_chars)를 받아 (성공 여부, 텍스트|오류)."""
+    while True:
+        try:
+            data, max_pages, max_chars = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send((True, _extract_text(data, max_pages, max_chars)))
+        except Exception as e:
+            conn.send((False, f"{type(e).__name__}: {e}"))
+
+
+def reset() -> None:
+    """유휴 워커 종료 (테스트용)."""
+    with _idle_lock:
+        workers, _idle[:] = list(_idle), []
+    for worker in workers:
+        worker.kill()
@@ -1,42 +1,28 @@
 """기업 공식 홈페이지 스크래퍼 — 인재상·비전·기업문화 추출.
 
-Firecrawl API 사용. API 장애 시 None 반환.
+Firecrawl 공용 클라이언트(firecrawl_client) 사용. API 장애 시 None 반환.
+
+인재상 페이지는 거의 바뀌지 않으므로 WEBSITE_CACHE_ENABLED(기본 true)면
+기업별 캐시(company_website)를 먼저 확인하고, 마지막 확인 후
+COMPANY_WEBSITE_CACHE_DAYS(기본 365일)가 지나지 않았으면 Firecrawl을 호출하지
+않는다. 캐시는 재검증 배치(cover_letter.website_revalidate)가 갱신한다.
 """
 
 import logging
 import os
-from typing import Any
-
-logger = logging.getLogger(__name__)
-
-
-def _normalize_firecrawl_items(results: Any) -> list[dict[str, Any]]:
-    """Firecrawl search 응답을 dict 리스트로 정규화.
-
-    firecrawl-py 버전에 따라 list/dict/Pydantic(SearchData) 형태가 다르다.
-    """
-    if isinstance(results, list):
-        return [item for item in results if isinstance(item, dict)]
 
-    if hasattr(results, "web") or hasattr(results, "news"):
-        items: list[dict[str, Any]] = []
-        for group in (getattr(results, "web", None), getattr(results, "news", None)):
-            for entry in group or []:
-                if isinstance(entry, dict):
-                    items.append(entry)
-                elif hasattr(entry, "model_dump"):
-                    items.append(entry.model_dump())
-        return items
+from cover_letter import website_store
+from cover_letter.collectors import firecrawl_client
+from cover_letter.db import get_conn as _get_conn
 
-    if isinstance(results, dict):
-        raw_items = results.get("data") or results.get("web") or []
-        return [item for item in raw_items if isinstance(item, dict)]
+logger = logging.getLogger(__name__)
 
-    return []
+_CACHE_ENABLED = os.getenv("WEBSITE_CACHE_ENABLED", "true").lower() == "true"
+_CACHE_DAYS = int(os.getenv("COMPANY_WEBSITE_CACHE_DAYS", "365"))
 
 
 def crawl_company_website_with_status(company_name: str) -> dict:
-    """인재상·비전·기업문화 수집 결과와 상태를 함께 반환.
+    """인재상·비전·기업문화 수집 결과와 상태를 함께 반환 (기업별 캐시 우선).
 
     Returns:
         {
@@ -45,43 +31,41 @@ def crawl_company_website_with_status(company_name: str) -> dict:
             "reason": str,
         }
     """
-    try:
-        from firecrawl import FirecrawlApp
-    except ImportError:
-        return {
-            "success": False,
-            "data": None,
-            "reason": "firecrawl 미설치",
-        }
+    if _CACHE_ENABLED:
+        cached = _load_cached(company_name)
+        if cached is not None:
+            return {"success": True, "data": cached, "reason": ""}
+
+    status = search_company_website(company_name)
+    if _CACHE_ENABLED and status["success"]:
+        _save_cached(company_name, status["data"])
+    return status
 
-    api_key = os.getenv("FIRECRAWL_API_KEY", "")
-    if not api_key:
+
+def search_company_website(company_name: str) -> dict:
+    """캐시 없이 Firecrawl 검색으로 인재상·비전·기업문화 수집.
+
+    Returns:
+        crawl_company_website_with_status와 같은 형태
+    """
+    try:
+        client = firecrawl_client.get_client()
+    except ValueError as exc:
         return {
             "success": False,
             "data": None,
-            "reason": "FIRECRAWL_API_KEY 미설정",
+            "reason": str(exc),
         }
 
     try:
-        app = FirecrawlApp(api_key=api_key)
         query = f"{company_name} 채용 인재상 기업문화 비전 핵심가치"
-        results: Any = app.search(query, limit=3)
-
         texts: list[str] = []
         source_url = ""
-        items = _normalize_firecrawl_items(results)
-        for item in items:
-            content = (
-                item.get("markdown")
-                or item.get("content")
-                or item.get("text")
-                or item.get("description")
-                or ""
-            )
-            if content.strip():
-                texts.append(content.strip())
+        for item in client.search(query, limit=3):
+            if item.text:
+                texts.append(item.text)
                 if not source_url:
-                    source_url = item.get("url") or item.get("sourceURL") or ""
+                    source_url = item.url
 
         if not texts:
             return {
@@ -90,7 +74,8 @@ def crawl_company_website_with_status(company_name: str) -> dict:
                 "reason": "검색 결과 텍스트 없음",
             }
 
-        combined = "\n\n".join(texts)[:3000]
+        # 프롬프트 길이는 prompt_budget이 섹션 예산으로 조절
+        combined = "\n\n".join(texts)
         return {
             "success": True,
             "data": {
@@ -122,3 +107,32 @@ def crawl_company_website(company_name: str) -> dict | None:
     status = crawl_company_website_with_status(company_name)
     data = status.get("data")
     return data if isinstance(data, dict) else None
+
+
+def _load_cached(company_name: str) -> dict | None:
+    """유효한 기업별 캐시. DB를 쓸 수 없으면 None."""
+    try:
+        conn = _get_conn()
+        try:
+            return website_store.load(conn, company_name, _CACHE_DAYS)
+        finally:
+            conn.close()
+    except Exception:
+        logger.warning(
+            "홈페이지 캐시 조회 실패: company=%s", company_name, exc_info=True
+        )
+        return None
+
+
+def _save_cached(company_name: str, data: dict) -> None:
+    """수집 결과를 기업별 캐시에 저장. 실패는 무시."""
+    try:
+        conn = _get_conn()
+        try:
+            website_store.save(conn, company_name, data)
+        finally:
+            conn.close()
+    except Exception:
+        logger.warning(
+            "홈페이지 캐시 저장 실패: company=%s", company_name, exc_info=True
+        )
@@ -0,0 +1,216 @@
+"""기업명 해석기 — DART 기업코드 목록 위 접두사·트라이그램 인덱스.
+
+사용자가 입력한 기업명("카카오", "kakao", "(주)카카오", "카카오 뱅크")을
+DART 등록 기업 후보로 순위화해 반환한다. dart_collector(기업코드 선택),
+naver_collector(검색어 정규화), 프론트엔드(기업명 제안)가 같은 인덱스를 쓴다.
+
+점수 (0~1):
+    정확 일치(국문·영문·별칭) 1.0 > 접두사 일치 0.6~0.9 > 트라이그램 유사도 ~0.8
+동점이면 상장사, 짧은 이름(모회사) 순으로 우선한다.
+"""
+
+import bisect
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+
+from cover_letter.collectors import dart_corp_index
+from cover_letter.collectors.dart_corp_index import CorpRecord, normalize_corp_name
+
+logger = logging.getLogger(__name__)
+
+_PREFIX_LIMIT = 200
+_MIN_TRIGRAM_SIMILARITY = 0.3
+_DISPLAY_SUFFIX_RE = re.compile(r"\(주\)|㈜|주식회사")
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """기업명 해석 후보 1건."""
+
+    corp_code: str
+    corp_name: str
+    stock_code: str
+    score: float
+    matched_on: str  # "exact" | "prefix" | "trigram"
+
+    @property
+    def display_name(self) -> str:
+        """법인 표기를 뺀 표시용 기업명 (예: "(주)카카오" → "카카오")."""
+        return _DISPLAY_SUFFIX_RE.sub("", self.corp_name).strip()
+
+    @property
+    def listed(self) -> bool:
+        return bool(self.stock_code)
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f"^{key}$"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class CompanyResolver:
+    """기업코드 목록에 대한 메모리 인덱스.
+
+    Args:
+        records: DART 기업코드 목록
+        aliases: 별칭 → 기업명 (예: {"네이버": "NAVER"})
+    """
+
+    def __init__(
+        self, records: list[CorpRecord], aliases: dict[str, str] | None = None
+    ):
+        self._records = records
+        self._by_key: dict[str, list[int]] = {}
+        for i, record in enumerate(records):
+            for name in (record.corp_name, record.corp_eng_name):
+                key = normalize_corp_name(name) if name else ""
+                if key:
+                    self._by_key.setdefault(key, []).append(i)
+
+        for alias, target in (aliases or {}).items():
+            alias_key = normalize_corp_name(alias)
+            target_ids = list(self._by_key.get(normalize_corp_name(target), []))
+            if alias_key and target_ids:
+                ids = self._by_key.setdefault(alias_key, [])
+                ids.extend(i for i in target_ids if i not in ids)
+
+        self._sorted_keys = sorted(self._by_key)
+        self._trigram_index: dict[str, list[str]] = {}
+        self._gram_counts: dict[str, int] = {}
+        for key in self._sorted_keys:
+            grams = _trigrams(key)
+            self._gram_counts[key] = len(grams)
+            for gram in grams:
+                self._trigram_index.setdefault(gram, []).append(key)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def resolve(self, query: str, limit: int = 5) -> list[Candidate]:
+        """입력 기업명에 대한 후보를 점수순으로 반환.
+
+        Args:
+            query: 사용자 입력 기업명
+            limit: 최대 후보 수
+
+        Returns:
+            Candidate 목록 (점수 내림차순). 후보가 없으면 빈 리스트.
+        """
+        q = normalize_corp_name(query)
+        if not q:
+            return []
+
+        scores: dict[str, tuple[float, str]] = {}
+
+        def _offer(key: str, score: float, matched_on: str) -> None:
+            if score > scores.get(key, (0.0, ""))[0]:
+                scores[key] = (score, matched_on)
+
+        if q in self._by_key:
+            _offer(q, 1.0, "exact")
+
+        start = bisect.bisect_left(self._sorted_keys, q)
+        for key in self._sorted_keys[start : start + _PREFIX_LIMIT]:
+            if not key.startswith(q):
+                break
+            _offer(key, 0.6 + 0.3 * len(q) / len(key), "prefix")
+
+        q_grams = _trigrams(q)
+        shared = Counter(
+            key for gram in q_grams for key in self._trigram_index.get(gram, ())
+        )
+        for key, count in shared.items():
+            similarity = count / (len(q_grams) + self._gram_counts[key] - count)
+            if similarity >= _MIN_TRIGRAM_SIMILARITY:
+                _offer(key, 0.8 * similarity, "trigram")
+
+        candidates: dict[str, Candidate] = {}
+        for key, (score, matched_on) in scores.items():
+            for i in self._by_key[key]:
+                record = self._records[i]
+                existing = candidates.get(record.corp_code)
+                if existing is None or existing.score < score:
+                    candidates[record.corp_code] = Candidate(
+                        corp_code=record.corp_code,
+                        corp_name=record.corp_name,
+                        stock_code=record.stock_code,
+                        score=round(score, 4),
+                        matched_on=matched_on,
+                    )
+
+        ranked = sorted(
+            candidates.values(),
+            key=lambda c: (-c.score, not c.listed, len(c.corp_name), c.corp_name),
+        )
+        return ranked[:limit]
+
+
+_resolver: CompanyResolver | None = None
+_resolver_index: dart_corp_index.CorpIndex | None = None
+_lock = threading.Lock()
+
+
+def get_resolver(allow_download: bool = True) -> CompanyResolver:
+    """프로세스 공용 해석기. 기업코드 인덱스가 갱신되면 다시 만든다.
+
+    Raises:
+        RuntimeError: 기업코드 인덱스를 사용할 수 없는 경우
+    """
+    global _resolver, _resolver_index
+    index = dart_corp_index.get_index(allow_download=allow_download)
+    with _lock:
+        if _resolver is None or _resolver_index is not index:
+            _resolver = CompanyResolver(index.records, _load_aliases())
+            _resolver_index = index
+        return _resolver
+
+
+def resolve(
+    query: str, limit: int = 5, allow_download: bool = False
+) -> list[Candidate]:
+    """기업명 후보 조회. 기업코드 인덱스가 없으면 빈 리스트.
+
+    Args:
+        query: 사용자 입력 기업명
+        limit: 최대 후보 수
+        allow_download: 인덱스가 없거나 오래됐을 때 DART에서 내려받을지 여부
+    """
+    try:
+        resolver = get_resolver(allow_download=allow_download)
+    except RuntimeError:
+        return []
+    return resolver.resolve(query, limit=limit)
+
+
+def canonical_name(company_name: str) -> str:
+    """정확 일치(국문·영문·별칭) 후보가 있으면 표시용 DART 기업명, 없으면 입력 그대로."""
+    candidates = resolve(company_name, limit=1)
+    if candidates and candidates[0].matched_on == "exact":
+        return candidates[0].display_name
+    return company_name
+
+
+def reset() -> None:
+    """메모리 해석기 초기화 (테스트용)."""
+    global _resolver, _resolver_index
+    with _lock:
+        _resolver = None
+        _resolver_index = None
+
+
+def _load_aliases() -> dict[str, str]:
+    """COMPANY_ALIASES_FILE(JSON: 별칭 → DART 기업명)이 있으면 로드."""
+    path = os.getenv("COMPANY_ALIASES_FILE", "")
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return dict(json.load(f))
+    except Exception:
+        logger.warning("기업 별칭 파일 로드 실패: %s", path, exc_info=True)
+        return {}
@@ -1,21 +1,71 @@
-"""기업·직무 분석 서비스 — 3-소스 수집 오케스트레이션 + DB 캐싱."""
+"""기업·직무 분석 서비스 — 3-소스 병렬 수집 오케스트레이션 + DB 캐싱."""
 
+import hashlib
 import json
 import logging
-import pathlib
-from datetime import datetime, timezone
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
+from datetime import datetime, timedelta, timezone
 
-from cover_letter import llm_client
+import psycopg2.errors
+
+from cover_letter import (
+    dart_report_store,
+    llm_client,
+    prompt_budget,
+    prompt_registry,
+    source_store,
+)
 from cover_letter.collectors import dart_collector, naver_collector, website_crawler
 from cover_letter.db import get_conn as _get_conn
 
-_PROMPT_PATH = pathlib.Path(__file__).parent / "prompts" / "company_analysis.txt"
-_CACHE_DAYS = 7
+_CACHE_DAYS = int(os.getenv("COMPANY_CACHE_DAYS", "7"))
+_JOB_CACHE_DAYS = int(os.getenv("JOB_CACHE_DAYS", "30"))
+_SOURCES = ("dart", "news", "website")
+# 소스별 수집 타임아웃(초, 수집 시작 시점부터). 초과 시 해당 소스만 실패 처리하고
+# 나머지로 분석 계속
+_SOURCE_TIMEOUTS: dict[str, float] = {
+    "dart": float(os.getenv("COMPANY_DART_TIMEOUT", "40")),
+    "news": float(os.getenv("COMPANY_NEWS_TIMEOUT", "20")),
+    "website": float(os.getenv("COMPANY_WEBSITE_TIMEOUT", "40")),
+}
+# 소스별 재수집 주기 — 사업보고서는 연 단위, 인재상은 드물게, 뉴스는 자주 바뀐다
+_SOURCE_TTLS: dict[str, timedelta] = {
+    "dart": timedelta(days=int(os.getenv("COMPANY_DART_TTL_DAYS", "90"))),
+    "news": timedelta(days=int(os.getenv("COMPANY_NEWS_TTL_DAYS", "7"))),
+    "website": timedelta(days=int(os.getenv("COMPANY_WEBSITE_TTL_DAYS", "30"))),
+}
+# 시간 초과된 소스 재시도 대기(분) — 연속 시간 초과마다 2배, 소스 TTL이 상한
+_TIMEOUT_BACKOFF_MINUTES = int(os.getenv("COMPANY_TIMEOUT_BACKOFF_MINUTES", "30"))
+# 캐시 히트 시 뉴스가 이 시간보다 오래됐으면 백그라운드 갱신 (stale-while-revalidate)
+_NEWS_FRESH_MINUTES = int(os.getenv("COMPANY_NEWS_FRESH_MINUTES", "360"))
+_REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="news-refresh")
+# 진행 중인 갱신만 담는다 (완료 콜백에서 제거)
+_news_refreshes: dict[int, Future] = {}
+# 완료된 갱신 결과: id → (news_summary, 완료 시각 monotonic). _NEWS_FRESH_MINUTES 후 만료
+_refreshed_news: dict[int, tuple[str, float]] = {}
+_news_refresh_lock = threading.Lock()
+# 동일 기업 동시 분석 합치기 (single-flight)
+_SINGLE_FLIGHT_TIMEOUT = float(os.getenv("COMPANY_SINGLE_FLIGHT_TIMEOUT", "180"))
+_ADVISORY_LOCK_NAMESPACE = 7301  # pg_advisory_lock(int, int) 1번 키: 기업 분석
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
 logger = logging.getLogger(__name__)
 
 
 def get_or_analyze_company(company_name: str) -> dict:
-    """기업 분석 결과 반환. 캐시 히트 시 뉴스만 재수집, 미스 시 3-소스 전체 분석.
+    """기업 분석 결과 반환. 캐시 히트 시 즉시 반환, 만료·미스 시 재분석.
+
+    캐시 히트인데 뉴스가 COMPANY_NEWS_FRESH_MINUTES보다 오래됐으면 뉴스만
+    백그라운드에서 갱신한다. 갱신 결과는 get_refreshed_news()로 가져간다.
+
+    분석이 COMPANY_CACHE_DAYS보다 오래됐으면 소스별 TTL이 지난 소스만
+    재수집하고, 내용 해시가 바뀐 경우에만 LLM 요약을 다시 만든다.
 
     Args:
         company_name: 기업명
@@ -31,90 +81,315 @@ def get_or_analyze_company(company_name: str) -> dict:
     """
     conn = _get_conn()
     try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT id, company_name, overview, culture_and_values, industry_trends,
-                       competitive_edge, news_summary, dart_summary,
-                       analyzed_at, user_overrides
-                FROM company_analysis
-                WHERE company_name = %s
-                """,
-                (company_name,),
-            )
-            row = cur.fetchone()
+        cached = _load_cached(company_name, conn)
+        if cached is not None and _is_fresh(cached):
+            # 캐시 히트: 즉시 반환, 오래된 뉴스는 백그라운드 갱신
+            if _news_is_stale(cached["news_updated_at"]):
+                _schedule_news_refresh(cached["id"], company_name)
+            return cached
 
-        if row is not None:
-            cached = _row_to_dict(row)
-            analyzed_at = cached["analyzed_at"]
-            if isinstance(analyzed_at, str):
-                analyzed_at = datetime.fromisoformat(analyzed_at)
-            age_days = (
-                datetime.now(timezone.utc) - analyzed_at.replace(tzinfo=timezone.utc)
-            ).days
-
-            if age_days < _CACHE_DAYS:
-                # 캐시 히트: 뉴스만 재수집
-                fresh_news = _summarize_news(company_name, "")
-                if fresh_news:
-                    with conn, conn.cursor() as cur:
-                        cur.execute(
-                            "UPDATE company_analysis SET news_summary=%s, news_updated_at=NOW() WHERE id=%s",
-                            (fresh_news, cached["id"]),
-                        )
-                    cached["news_summary"] = fresh_news
-                dart_ok = bool(cached.get("dart_summary"))
-                website_ok = bool(cached.get("culture_and_values"))
-                cached["source_status"] = {
-                    "dart": {
-                        "success": dart_ok,
-                        "reason": (
-                            "" if dart_ok else "이전 분석 시 수집 실패 (쫨시 참조)"
-                        ),
-                    },
-                    "website": {
-                        "success": website_ok,
-                        "reason": (
-                            "" if website_ok else "이전 분석 시 수집 실패 (쫨시 참조)"
-                        ),
-                    },
-                }
-                return cached
-
-        # 캐시 미스: 3-소스 전체 분석
-        return _full_analysis(company_name, conn)
+        # 캐시 만료·미스: 재분석 (동일 기업 동시 요청은 1회로 합침)
+        return _analyze_single_flight(company_name, conn, cached)
     finally:
         conn.close()
 
 
-def _full_analysis(company_name: str, conn) -> dict:
-    """3-소스 수집 후 LLM 통합 요약, DB 저장."""
-    # 1. DART 사업보고서
-    dart_result = dart_collector.collect_dart_reports_with_status(company_name)
-    dart_data = dart_result.get("data", {}) if isinstance(dart_result, dict) else {}
-    dart_text = _format_dart(dart_data)
-
-    # 2. Naver 뉴스
-    news_articles = naver_collector.collect_news(company_name)
-    news_text = _format_news(news_articles)
-
-    # 3. 홈페이지 스크래핑
-    website_result = website_crawler.crawl_company_website_with_status(company_name)
-    website_data = (
-        website_result.get("data", {}) if isinstance(website_result, dict) else {}
-    )
-    website_text = website_data.get("talent", "") if website_data else ""
+def _load_cached(company_name: str, conn) -> dict | None:
+    """company_analysis 캐시 조회 (만료 여부 무관). 없으면 None."""
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT id, company_name, overview, culture_and_values, industry_trends,
+                   competitive_edge, news_summary, dart_summary,
+                   analyzed_at, user_overrides, news_updated_at, source_state
+            FROM company_analysis
+            WHERE company_name = %s
+            """,
+            (company_name,),
+        )
+        row = cur.fetchone()
+
+    if row is None:
+        return None
 
-    source_status = {
+    cached = _row_to_dict(row)
+    dart_ok = bool(cached.get("dart_summary"))
+    website_ok = bool(cached.get("culture_and_values"))
+    cached["source_status"] = {
         "dart": {
-            "success": bool(dart_result.get("success")),
-            "reason": str(dart_result.get("reason", "")),
+            "success": dart_ok,
+            "reason": ("" if dart_ok else "이전 분석 시 수집 실패 (쫨시 참조)"),
         },
         "website": {
-            "success": bool(website_result.get("success")),
-            "reason": str(website_result.get("reason", "")),
+            "success": website_ok,
+            "reason": ("" if website_ok else "이전 분석 시 수집 실패 (쫨시 참조)"),
         },
     }
+    return cached
+
+
+def _is_fresh(cached: dict) -> bool:
+    """분석 결과가 _CACHE_DAYS 이내이고 재시도할 때가 된 시간 초과 소스가 없는지 여부.
+
+    시간 초과로 자료 없이 요약한 결과는 백오프 대기가 끝날 때까지 그대로 쓰고,
+    그 뒤 요청에서 해당 소스만 다시 수집한다.
+    """
+    state = cached.get("source_state") or {}
+    now = datetime.now(timezone.utc)
+    if any(_timeout_retry_due(source, entry, now) for source, entry in state.items()):
+        return False
+    analyzed_at = _as_utc(cached["analyzed_at"])
+    return (now - analyzed_at).days < _CACHE_DAYS
+
+
+def _timeout_retry_due(source: str, entry: dict, now: datetime) -> bool:
+    """시간 초과 소스의 재시도 대기(연속 시간 초과마다 2배)가 끝났는지 여부."""
+    if entry.get("status") != "timeout":
+        return False
+    attempts = max(int(entry.get("attempts", 1)), 1)
+    backoff = min(
+        timedelta(minutes=_TIMEOUT_BACKOFF_MINUTES * 2 ** (attempts - 1)),
+        _SOURCE_TTLS.get(source, timedelta(days=1)),
+    )
+    return now - _as_utc(entry["fetched_at"]) >= backoff
+
+
+def _mark_timeout(state: dict, source: str, now_iso: str) -> None:
+    """이전 원문이 없는 소스의 시간 초과를 기록 (연속 횟수 누적, 시각 갱신)."""
+    entry = state.get(source)
+    if entry is not None and entry.get("status") != "timeout":
+        return
+    attempts = int(entry.get("attempts", 1)) + 1 if entry is not None else 1
+    state[source] = {
+        "hash": "",
+        "fetched_at": now_iso,
+        "status": "timeout",
+        "attempts": attempts,
+    }
+
+
+def _analyze_single_flight(company_name: str, conn, previous: dict | None) -> dict:
+    """동일 기업의 동시 분석 요청을 1회 실행으로 합친다.
+
+    - 프로세스 내: 기업명별 Future를 공유해 후속 요청은 선행 분석 결과를 기다린다.
+    - 프로세스 간: Postgres advisory lock으로 직렬화하고, 락 대기 후에는
+      다른 프로세스가 방금 저장한 캐시를 다시 확인한다.
+    """
+    with _inflight_lock:
+        future = _inflight.get(company_name)
+        leader = future is None
+        if leader:
+            future = Future()
+            _inflight[company_name] = future
+
+    if not leader:
+        logger.info("company analysis already in flight, waiting: %s", company_name)
+        try:
+            return future.result(timeout=_SINGLE_FLIGHT_TIMEOUT)
+        except FutureTimeoutError as e:
+            raise _busy_error(company_name) from e
+
+    try:
+        result = _analyze_with_advisory_lock(company_name, conn, previous)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(company_name, None)
+
+
+def _analyze_with_advisory_lock(company_name: str, conn, previous: dict | None) -> dict:
+    """기업명 advisory lock을 잡고 재분석 실행 (세션 락, 종료 시 해제).
+
+    다른 프로세스가 락을 쥐고 있으면 COMPANY_SINGLE_FLIGHT_TIMEOUT까지만 기다린다.
+
+    Raises:
+        RuntimeError: 락 대기 시간 초과
+    """
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT pg_try_advisory_lock(%s, hashtext(%s))",
+            (_ADVISORY_LOCK_NAMESPACE, company_name),
+        )
+        acquired = bool(cur.fetchone()[0])
+
+    if not acquired:
+        # 다른 프로세스가 분석 중 → 끝날 때까지 대기 (lock_timeout으로 상한)
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute(
+                    "SELECT set_config('lock_timeout', %s, true)",
+                    (f"{int(_SINGLE_FLIGHT_TIMEOUT * 1000)}ms",),
+                )
+                cur.execute(
+                    "SELECT pg_advisory_lock(%s, hashtext(%s))",
+                    (_ADVISORY_LOCK_NAMESPACE, company_name),
+                )
+        except psycopg2.errors.LockNotAvailable as e:
+            raise _busy_error(company_name) from e
+
+    try:
+        if not acquired:
+            # 락 대기 후 다른 프로세스가 방금 저장한 캐시 재확인
+            previous = _load_cached(company_name, conn)
+            if previous is not None and _is_fresh(previous):
+                return previous
+        return _reanalyze(company_name, conn, previous)
+    finally:
+        with conn, conn.cursor() as cur:
+            cur.execute(
+                "SELECT pg_advisory_unlock(%s, hashtext(%s))",
+                (_ADVISORY_LOCK_NAMESPACE, company_name),
+            )
+
+
+def _busy_error(company_name: str) -> RuntimeError:
+    """동시 분석 대기 시간 초과 — 다른 분석 실패와 같은 RuntimeError로 알린다."""
+    logger.warning(
+        "company analysis wait timed out (%.0fs): %s",
+        _SINGLE_FLIGHT_TIMEOUT,
+        company_name,
+    )
+    return RuntimeError(
+        f"'{company_name}' 분석이 다른 요청에서 진행 중입니다. 잠시 후 다시 시도하세요."
+    )
+
+
+def _reanalyze(company_name: str, conn, previous: dict | None) -> dict:
+    """TTL이 지난 소스만 재수집. 모든 소스가 만료면 전체 분석."""
+    stale = _stale_sources(previous)
+    if previous is None or len(stale) == len(_SOURCES):
+        return _full_analysis(company_name, conn)
+    return _partial_analysis(company_name, conn, previous, stale)
+
+
+def _stale_sources(previous: dict | None) -> tuple[str, ...]:
+    """재수집할 소스 목록.
+
+    source_state에 없거나, fetched_at이 소스별 TTL을 넘겼거나, 시간 초과 후
+    재시도 대기가 끝난 소스. 대기 중인 시간 초과 소스는 건너뛴다.
+    """
+    if previous is None:
+        return _SOURCES
+    state = previous.get("source_state") or {}
+    now = datetime.now(timezone.utc)
+
+    def _stale(source: str) -> bool:
+        entry = state.get(source)
+        if entry is None:
+            return True
+        if entry.get("status") == "timeout":
+            return _timeout_retry_due(source, entry, now)
+        return now - _as_utc(entry["fetched_at"]) > _SOURCE_TTLS[source]
+
+    return tuple(source for source in _SOURCES if _stale(source))
+
+
+def _full_analysis(company_name: str, conn) -> dict:
+    """3-소스 병렬 수집 후 LLM 통합 요약, DB 저장."""
+    results = _collect_sources(company_name)
+    _store_documents(company_name, conn, results)
+    return _summarize_and_store(company_name, conn, results, {})
+
+
+def _partial_analysis(
+    company_name: str, conn, previous: dict, stale: tuple[str, ...]
+) -> dict:
+    """만료된 소스만 재수집. 내용 해시가 그대로면 LLM 요약 없이 갱신 시각만 연장."""
+    results = _collect_sources(company_name, stale, collectors=_REFRESH_COLLECTORS)
+    _store_documents(company_name, conn, results)
+    state = previous.get("source_state") or {}
+    changed = [
+        source
+        for source, result in results.items()
+        if result.get("success")
+        and _content_hash(_source_text(source, result.get("data")))
+        != state.get(source, {}).get("hash")
+    ]
+    logger.info(
+        "company partial re-analysis: company=%s stale=%s changed=%s",
+        company_name,
+        list(stale),
+        changed,
+    )
+    if changed:
+        return _summarize_and_store(company_name, conn, results, state)
+
+    # 내용 변화 없음 → 수집 성공한 소스의 fetched_at과 analyzed_at만 연장
+    now_iso = datetime.now(timezone.utc).isoformat()
+    new_state = _compact_state(state)
+    for source, result in results.items():
+        if result.get("success"):
+            new_state[source] = {**new_state[source], "fetched_at": now_iso}
+        elif result.get("timed_out"):
+            _mark_timeout(new_state, source, now_iso)
+
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE company_analysis
+            SET analyzed_at = NOW(), source_state = %s
+            WHERE id = %s
+            RETURNING analyzed_at
+            """,
+            (json.dumps(new_state, ensure_ascii=False), previous["id"]),
+        )
+        analyzed_at = cur.fetchone()[0]
+
+    return {
+        **previous,
+        "analyzed_at": _isoformat(analyzed_at),
+        "source_state": new_state,
+        "source_status": _source_status(results, new_state),
+    }
+
+
+def _summarize_and_store(
+    company_name: str, conn, results: dict[str, dict], previous_state: dict
+) -> dict:
+    """수집 결과 + 재수집하지 않은 소스의 이전 원문으로 LLM 통합 요약 후 upsert.
+
+    source_state에는 소스별 해시·수집 시각·상태만 남기고, 이전 원문은
+    source_document에서 필요할 때만 읽는다.
+    수집에 실패한 소스는 이전 원문을 그대로 쓴다 (이전 수집 시각 유지).
+    이전 원문 없이 시간 초과된 소스는 status="timeout"과 연속 횟수를 남겨
+    백오프 대기 후 해당 소스만 재시도하게 한다.
+    결과에 fetched_at이 있으면(저장된 원본 재사용) 그 시각을 수집 시각으로 쓴다.
+    """
+    now_iso = datetime.now(timezone.utc).isoformat()
+    state = _compact_state(previous_state)
+    texts = {source: "" for source in _SOURCES}
+    for source, result in results.items():
+        if result.get("success"):
+            texts[source] = _source_text(source, result.get("data"))
+            state[source] = {
+                "hash": _content_hash(texts[source]),
+                "fetched_at": result.get("fetched_at") or now_iso,
+                "status": "ok",
+            }
+        elif result.get("timed_out"):
+            _mark_timeout(state, source, now_iso)
+
+    reused = [
+        source
+        for source in _SOURCES
+        if state.get(source, {}).get("status") == "ok"
+        and not (results.get(source) or {}).get("success")
+    ]
+    if reused:
+        texts.update(_load_stored_texts(company_name, conn, reused))
+
+    dart_text, news_text, website_text = (
+        texts["dart"],
+        texts["news"],
+        texts["website"],
+    )
+
+    source_status = _source_status(results, state)
     for source, status in source_status.items():
         if not status["success"]:
             logger.warning(
@@ -125,19 +400,16 @@ def _full_analysis(company_name: str, conn) -> dict:
             )
 
     # LLM 통합 요약
-    prompt_template = _PROMPT_PATH.read_text(encoding="utf-8")
-    system = ""
-    user = prompt_template
-    if "## System\n" in prompt_template and "## User\n" in prompt_template:
-        parts = prompt_template.split("## User\n", 1)
-        system = parts[0].replace("## System\n", "").strip()
-        user = parts[1].strip()
-
-    user = (
-        user.replace("{company_name}", company_name)
-        .replace("{dart_summary}", dart_text or "자료 없음")
-        .replace("{news_summary}", news_text or "자료 없음")
-        .replace("{website_summary}", website_text or "자료 없음")
+    sections = prompt_budget.fit_sections(
+        "company_analysis",
+        {
+            "dart_summary": dart_text or "자료 없음",
+            "news_summary": news_text or "자료 없음",
+            "website_summary": website_text or "자료 없음",
+        },
+    )
+    system, user = prompt_registry.render(
+        "company_analysis", company_name=company_name, **sections
     )
 
     raw = llm_client.call(user, tier="flash", system=system)
@@ -156,18 +428,29 @@ def _full_analysis(company_name: str, conn) -> dict:
             "dart_summary": "",
         }
 
-    # DB 저장
-    source_urls = []
-    if website_data and website_data.get("source_url"):
-        source_urls.append(website_data["source_url"])
+    # DB 저장 (홈페이지를 재수집하지 않았으면 기존 source_urls 유지)
+    source_urls = None
+    website_data = (results.get("website") or {}).get("data") or {}
+    if website_data:
+        source_urls = (
+            [website_data["source_url"]] if website_data.get("source_url") else []
+        )
+    news_state = state.get("news") or {}
+    news_updated_at = (
+        datetime.fromisoformat(news_state["fetched_at"])
+        if news_state.get("status") == "ok"
+        else None
+    )
 
     with conn, conn.cursor() as cur:
         cur.execute(
             """
             INSERT INTO company_analysis
                 (company_name, overview, culture_and_values, industry_trends,
-                 competitive_edge, news_summary, dart_summary, source_urls, analyzed_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW())
+                 competitive_edge, news_summary, dart_summary, source_urls,
+                 analyzed_at, news_updated_at, source_state)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, COALESCE(%s, '{}'::text[]),
+                    NOW(), %s, %s)
             ON CONFLICT (company_name) DO UPDATE SET
                 overview           = EXCLUDED.overview,
                 culture_and_values = EXCLUDED.culture_and_values,
@@ -175,8 +458,10 @@ def _full_analysis(company_name: str, conn) -> dict:
                 competitive_edge   = EXCLUDED.competitive_edge,
                 news_summary       = EXCLUDED.news_summary,
                 dart_summary       = EXCLUDED.dart_summary,
-                source_urls        = EXCLUDED.source_urls,
-                analyzed_at        = NOW()
+                source_urls        = COALESCE(%s, company_analysis.source_urls),
+                analyzed_at        = NOW(),
+                news_updated_at    = EXCLUDED.news_updated_at,
+                source_state       = EXCLUDED.source_state
             RETURNING id, analyzed_at
             """,
             (
@@ -188,11 +473,18 @@ def _full_analysis(company_name: str, conn) -> dict:
                 news_text,
                 analysis.get("dart_summary", ""),
                 source_urls,
+                news_updated_at,
+                json.dumps(state, ensure_ascii=False),
+                source_urls,
             ),
         )
         row = cur.fetchone()
         new_id, analyzed_at = row[0], row[1]
 
+    # 이전 백그라운드 뉴스 갱신 결과가 새 요약을 덮어쓰지 않도록 폐기
+    with _news_refresh_lock:
+        _refreshed_news.pop(new_id, None)
+
     return {
         "id": new_id,
         "company_name": company_name,
@@ -202,19 +494,150 @@ def _full_analysis(company_name: str, conn) -> dict:
         "competitive_edge": analysis.get("competitive_edge", ""),
         "news_summary": news_text,
         "dart_summary": analysis.get("dart_summary", ""),
-        "analyzed_at": (
-            analyzed_at.isoformat()
-            if hasattr(analyzed_at, "isoformat")
-            else str(analyzed_at)
-        ),
+        "analyzed_at": _isoformat(analyzed_at),
         "source_status": source_status,
         "user_overrides": {},
+        "news_updated_at": news_updated_at,
+        "source_state": state,
     }
 
 
+def resummarize_from_store(company_name: str) -> dict | None:
+    """source_document에 저장된 최신 원본만으로 기업 요약을 다시 만든다.
+
+    외부 수집 API(DART·Naver·Firecrawl)를 호출하지 않으므로 프롬프트 변경 후
+    오프라인 백필에 사용한다.
+
+    Args:
+        company_name: 기업명
+
+    Returns:
+        get_or_analyze_company와 같은 구조의 dict. 저장된 원본이 없으면 None.
+    """
+    conn = _get_conn()
+    try:
+        documents = source_store.load_latest(conn, company_name)
+        if not documents:
+            return None
+        results = {
+            source: {
+                "success": True,
+                "data": document["payload"],
+                "reason": "",
+                "latency_ms": 0,
+                "fetched_at": _as_utc(document["fetched_at"]).isoformat(),
+            }
+            for source, document in documents.items()
+        }
+        return _summarize_and_store(company_name, conn, results, {})
+    finally:
+        conn.close()
+
+
+def _store_documents(company_name: str, conn, results: dict[str, dict]) -> None:
+    """수집에 성공한 소스의 원본을 source_document에 보관. 실패해도 분석은 계속."""
+    for source, result in results.items():
+        if not result.get("success"):
+            continue
+        data = result.get("data")
+        url = data.get("source_url", "") if isinstance(data, dict) else ""
+        try:
+            source_store.save(conn, company_name, source, data, url=url)
+        except Exception:
+            logger.warning(
+                "source document save failed: company=%s source=%s",
+                company_name,
+                source,
+                exc_info=True,
+            )
+
+
+def _source_text(source: str, data) -> str:
+    """수집 결과를 프롬프트에 넣을 소스별 원문 텍스트로 변환."""
+    if source == "dart":
+        return _format_dart(data or {})
+    if source == "news":
+        return _format_news(data or [])
+    return (data or {}).get("talent", "")
+
+
+def _compact_state(state: dict) -> dict:
+    """source_state를 소스별 {"hash", "fetched_at", "status"}로 정리.
+
+    시간 초과 소스는 연속 횟수("attempts")도 남긴다.
+    원문("text")까지 담던 이전 형식의 행도 다음 저장부터 줄어든다.
+    """
+    compact = {}
+    for source, entry in state.items():
+        compact[source] = {
+            "hash": entry.get("hash", ""),
+            "fetched_at": entry.get("fetched_at"),
+            "status": entry.get("status", "ok"),
+        }
+        if compact[source]["status"] == "timeout":
+            compact[source]["attempts"] = int(entry.get("attempts", 1))
+    return compact
+
+
+def _load_stored_texts(company_name: str, conn, sources: list[str]) -> dict[str, str]:
+    """재수집하지 않은 소스의 원문을 source_document 최신 원본에서 복원."""
+    try:
+        documents = source_store.load_latest(conn, company_name)
+    except Exception:
+        logger.warning(
+            "source document load failed: company=%s", company_name, exc_info=True
+        )
+        return {}
+    return {
+        source: _source_text(source, documents[source]["payload"])
+        for source in sources
+        if source in documents
+    }
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _source_status(results: dict[str, dict], state: dict) -> dict[str, dict]:
+    """이번에 수집한 소스는 수집 결과, 재사용한 소스는 캐시 상태로 표시."""
+    status = {}
+    for source in _SOURCES:
+        if source in results:
+            result = results[source]
+            status[source] = {
+                "success": bool(result.get("success")),
+                "reason": str(result.get("reason", "")),
+                "latency_ms": result.get("latency_ms", 0),
+            }
+        else:
+            status[source] = {
+                "success": state.get(source, {}).get("status") == "ok",
+                "reason": "",
+                "latency_ms": 0,
+                "cached": True,
+            }
+    return status
+
+
+def _as_utc(value) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _isoformat(value) -> str:
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
 def analyze_job(company_analysis_id: int, job_title: str) -> dict:
     """직무 분석 (간단 프롬프트) 후 DB 저장.
 
+    같은 기업·정규화 직무명(공백 제거, 소문자)의 분석이 JOB_CACHE_DAYS 이내이고
+    기업 개요·업계 동향이 그대로면 LLM을 호출하지 않고 저장된 결과를 반환한다.
+
     Args:
         company_analysis_id: 연결된 기업 분석 ID
         job_title: 직무명
@@ -234,16 +657,25 @@ def analyze_job(company_analysis_id: int, job_title: str) -> dict:
         if row is None:
             raise ValueError(f"company_analysis id={company_analysis_id} 없음")
         company_name, overview, industry_trends = row[0], row[1], row[2]
+        # 기업 분석 요약이 다시 만들어지면 해시가 바뀌어 직무 캐시도 무효화된다
+        context_hash = _content_hash(f"{overview or ''}\n{industry_trends or ''}")
 
-        prompt = (
-            f"기업: {company_name}\n직무: {job_title}\n\n"
-            f"기업 개요: {overview}\n업계 동향: {industry_trends}\n\n"
-            "위 정보를 바탕으로 해당 직무의 주요 업무(responsibilities), "
-            "직무 페인 포인트(pain_points), 기대 역량(expected_competencies, 배열), "
-            "미래 전망(future_direction)을 JSON으로 반환하세요."
-        )
+        cached = _load_cached_job(company_analysis_id, job_title, conn)
+        if cached is not None and _job_cache_valid(cached, context_hash):
+            logger.info(
+                "job analysis cache hit: company_analysis_id=%s job_title=%s",
+                company_analysis_id,
+                job_title,
+            )
+            return cached["data"]
 
-        system = "당신은 직무 분석 전문가입니다. 반드시 순수 JSON만 반환하세요."
+        system, prompt = prompt_registry.render(
+            "job_analysis",
+            company_name=company_name,
+            job_title=job_title,
+            overview=overview or "",
+            industry_trends=industry_trends or "",
+        )
         raw = llm_client.call(prompt, tier="flash", system=system)
         raw = raw.strip()
         if raw.startswith("```"):
@@ -254,30 +686,50 @@ def analyze_job(company_analysis_id: int, job_title: str) -> dict:
         except json.JSONDecodeError:
             job_data = {}
 
+        values = (
+            job_data.get("responsibilities", ""),
+            job_data.get("pain_points", ""),
+            job_data.get("expected_competencies", []),
+            job_data.get("future_direction", ""),
+            context_hash,
+        )
         with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO job_analysis
-                    (company_analysis_id, job_title, responsibilities, pain_points,
-                     expected_competencies, future_direction)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (company_analysis_id, job_title) DO UPDATE SET
-                    responsibilities      = EXCLUDED.responsibilities,
-                    pain_points           = EXCLUDED.pain_points,
-                    expected_competencies = EXCLUDED.expected_competencies,
-                    future_direction      = EXCLUDED.future_direction,
-                    analyzed_at           = NOW()
-                RETURNING id
-                """,
-                (
-                    company_analysis_id,
-                    job_title,
-                    job_data.get("responsibilities", ""),
-                    job_data.get("pain_points", ""),
-                    job_data.get("expected_competencies", []),
-                    job_data.get("future_direction", ""),
-                ),
-            )
+            if cached is not None:
+                # 표기만 다른 기존 직무 행을 갱신 (question 등 하위 참조 id 유지)
+                job_title = cached["data"]["job_title"]
+                cur.execute(
+                    """
+                    UPDATE job_analysis SET
+                        responsibilities      = %s,
+                        pain_points           = %s,
+                        expected_competencies = %s,
+                        future_direction      = %s,
+                        context_hash          = %s,
+                        analyzed_at           = NOW()
+                    WHERE id = %s
+                    RETURNING id
+                    """,
+                    (*values, cached["data"]["id"]),
+                )
+            else:
+                cur.execute(
+                    """
+                    INSERT INTO job_analysis
+                        (company_analysis_id, job_title, responsibilities,
+                         pain_points, expected_competencies, future_direction,
+                         context_hash)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (company_analysis_id, job_title) DO UPDATE SET
+                        responsibilities      = EXCLUDED.responsibilities,
+                        pain_points           = EXCLUDED.pain_points,
+                        expected_competencies = EXCLUDED.expected_competencies,
+                        future_direction      = EXCLUDED.future_direction,
+                        context_hash          = EXCLUDED.context_hash,
+                        analyzed_at           = NOW()
+                    RETURNING id
+                    """,
+                    (company_analysis_id, job_title, *values),
+                )
             job_id = cur.fetchone()[0]
 
         return {
@@ -290,6 +742,77 @@ def analyze_job(company_analysis_id: int, job_title: str) -> dict:
         conn.close()
 
 
+def normalize_job_title(job_title: str) -> str:
+    """직무명 비교 키 — 공백 제거 + 소문자 ("백엔드 개발자" == "백엔드개발자")."""
+    return re.sub(r"\s+", "", job_title).lower()
+
+
+def _load_cached_job(company_analysis_id: int, job_title: str, conn) -> dict | None:
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT id, job_title, responsibilities, pain_points,
+                   expected_competencies, future_direction,
+                   analyzed_at, context_hash
+            FROM job_analysis
+            WHERE company_analysis_id = %s AND job_title_key = %s
+            ORDER BY analyzed_at DESC
+            LIMIT 1
+            """,
+            (company_analysis_id, normalize_job_title(job_title)),
+        )
+        row = cur.fetchone()
+
+    if row is None:
+        return None
+    return {
+        "data": {
+            "id": row[0],
+            "company_analysis_id": company_analysis_id,
+            "job_title": row[1],
+            "responsibilities": row[2] or "",
+            "pain_points": row[3] or "",
+            "expected_competencies": list(row[4] or []),
+            "future_direction": row[5] or "",
+        },
+        "analyzed_at": row[6],
+        "context_hash": row[7],
+    }
+
+
+def _job_cache_valid(cached: dict, context_hash: str) -> bool:
+    if cached["context_hash"] != context_hash:
+        return False
+    age = datetime.now(timezone.utc) - _as_utc(cached["analyzed_at"])
+    return age < timedelta(days=_JOB_CACHE_DAYS)
+
+
+def get_refreshed_news(company_analysis_id: int) -> str | None:
+    """완료된 백그라운드 뉴스 갱신 결과 반환.
+
+    결과를 소비하지 않으므로 같은 기업을 보고 있는 모든 세션이 받는다.
+    해당 기업이 다시 분석되거나 COMPANY_NEWS_FRESH_MINUTES가 지나면
+    갱신 결과는 버려진다 (이후에는 DB의 news_summary가 최신).
+
+    Args:
+        company_analysis_id: 기업 분석 ID
+
+    Returns:
+        갱신된 news_summary. 갱신 중이거나 갱신 내역이 없으면 None.
+    """
+    with _news_refresh_lock:
+        entry = _refreshed_news.get(company_analysis_id)
+    if entry is None or _refresh_expired(entry[1]):
+        return None
+    return entry[0]
+
+
+def is_news_refreshing(company_analysis_id: int) -> bool:
+    """해당 기업의 뉴스 백그라운드 갱신이 진행 중인지 여부."""
+    with _news_refresh_lock:
+        return company_analysis_id in _news_refreshes
+
+
 def save_overrides(entity: str, entity_id: int, overrides: dict) -> None:
     """사용자 수정 내용을 user_overrides 필드에 저장.
 
@@ -313,6 +836,159 @@ def save_overrides(entity: str, entity_id: int, overrides: dict) -> None:
 # ============================================================
 # 내부 헬퍼
 # ============================================================
+def _collect_dart(company_name: str) -> dict:
+    stored = _load_bulk_dart(company_name)
+    if stored is not None:
+        return {"success": True, "data": stored, "reason": ""}
+    return dart_collector.collect_dart_reports_with_status(company_name)
+
+
+def _load_bulk_dart(company_name: str) -> dict[str, str] | None:
+    """일괄 적재(dart_bulk)된 사업보고서 섹션. 인덱스·DB를 쓸 수 없으면 None."""
+    try:
+        corp = dart_collector.resolve_corp(company_name, allow_download=False)
+    except RuntimeError:
+        return None  # 기업코드 인덱스 캐시 없음
+    if corp is None:
+        return None
+
+    try:
+        conn = _get_conn()
+        try:
+            return dart_report_store.load_sections(
+                conn, corp.corp_code, _SOURCE_TTLS["dart"].days
+            )
+        finally:
+            conn.close()
+    except Exception:
+        logger.warning(
+            "dart_report 조회 실패, DART API로 수집: company=%s",
+            company_name,
+            exc_info=True,
+        )
+        return None
+
+
+def _collect_news(company_name: str) -> dict:
+    articles = naver_collector.collect_news(company_name)
+    return {
+        "success": bool(articles),
+        "data": articles,
+        "reason": "" if articles else "수집된 기사 없음",
+    }
+
+
+def _collect_news_remote(company_name: str) -> dict:
+    """뉴스 TTL 재수집용 — 로컬 코퍼스를 건너뛰고 외부 API로만 수집."""
+    articles = naver_collector.collect_news(company_name, local_first=False)
+    return {
+        "success": bool(articles),
+        "data": articles,
+        "reason": "" if articles else "수집된 기사 없음",
+    }
+
+
+def _collect_website(company_name: str) -> dict:
+    return website_crawler.crawl_company_website_with_status(company_name)
+
+
+_COLLECTORS = {
+    "dart": _collect_dart,
+    "news": _collect_news,
+    "website": _collect_website,
+}
+# 부분 재분석(TTL 만료 소스 재수집)용 — 뉴스는 코퍼스가 아닌 외부 API에서 받는다
+_REFRESH_COLLECTORS = {**_COLLECTORS, "news": _collect_news_remote}
+
+
+def _collect_sources(
+    company_name: str,
+    sources: tuple[str, ...] = _SOURCES,
+    collectors: dict | None = None,
+) -> dict[str, dict]:
+    """소스별 수집기를 병렬 실행하고 도착 순서대로 결과를 모은다.
+
+    분석마다 소스 수만큼의 스레드 풀을 새로 띄워 다른 분석의 수집을 기다리지
+    않는다. 소스마다 수집을 시작한 시점부터 _SOURCE_TIMEOUTS 이내에 끝나지 않으면
+    실패(timed_out=True)로 기록하고 나머지 소스는 계속 기다린다. 멈춘 수집 호출은
+    이 분석의 스레드만 붙잡는다.
+
+    Args:
+        company_name: 기업명
+        sources: 수집할 소스
+        collectors: 소스별 수집기 (기본: _COLLECTORS)
+
+    Returns:
+        {source: {"success": bool, "data": Any, "reason": str, "latency_ms": int,
+                  "timed_out": bool (시간 초과 시에만)}}
+    """
+    collectors = collectors or _COLLECTORS
+    started_at: dict[str, float] = {}
+
+    def _run(source: str) -> dict:
+        started_at[source] = time.monotonic()
+        return collectors[source](company_name)
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(len(sources), 1), thread_name_prefix="company-collect"
+    )
+    futures = {executor.submit(_run, source): source for source in sources}
+    results: dict[str, dict] = {}
+    pending = set(futures)
+
+    try:
+        while pending:
+            now = time.monotonic()
+            next_deadline = min(
+                started_at.get(futures[f], now) + _SOURCE_TIMEOUTS[futures[f]]
+                for f in pending
+            )
+            done, pending = wait(
+                pending,
+                timeout=max(next_deadline - now, 0),
+                return_when=FIRST_COMPLETED,
+            )
+            now = time.monotonic()
+
+            for future in done:
+                source = futures[future]
+                try:
+                    result = future.result()
+                except Exception:
+                    logger.exception(
+                        "company source raised: company=%s source=%s",
+                        company_name,
+                        source,
+                    )
+                    result = {
+                        "success": False,
+                        "data": None,
+                        "reason": "수집 중 예외 발생",
+                    }
+                elapsed = now - started_at.get(source, now)
+                results[source] = {**result, "latency_ms": int(elapsed * 1000)}
+
+            for future in list(pending):
+                source = futures[future]
+                if source not in started_at:
+                    continue
+                elapsed = now - started_at[source]
+                timeout = _SOURCE_TIMEOUTS[source]
+                if elapsed >= timeout:
+                    pending.discard(future)
+                    results[source] = {
+                        "success": False,
+                        "data": None,
+                        "reason": f"수집 시간 초과 ({timeout:.0f}초)",
+                        "latency_ms": int(elapsed * 1000),
+                        "timed_out": True,
+                    }
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
 def _format_dart(dart_data: dict) -> str:
     if not dart_data:
         return ""
@@ -338,10 +1014,76 @@ def _format_news(articles: list[dict]) -> str:
 
 
 def _summarize_news(company_name: str, job_title: str) -> str:
-    articles = naver_collector.collect_news(company_name, job_title)
+    """외부 API로 뉴스를 새로 받아 요약 텍스트로 (로컬 코퍼스 미사용)."""
+    articles = naver_collector.collect_news(company_name, job_title, local_first=False)
     return _format_news(articles)
 
 
+def _news_is_stale(news_updated_at) -> bool:
+    if news_updated_at is None:
+        return True
+    age = datetime.now(timezone.utc) - _as_utc(news_updated_at)
+    return age > timedelta(minutes=_NEWS_FRESH_MINUTES)
+
+
+def _schedule_news_refresh(company_analysis_id: int, company_name: str) -> None:
+    """뉴스 갱신 작업을 백그라운드에 등록. 같은 기업의 갱신이 진행 중이면 무시."""
+    with _news_refresh_lock:
+        if company_analysis_id in _news_refreshes:
+            return
+        future = _REFRESH_EXECUTOR.submit(
+            _refresh_news, company_analysis_id, company_name
+        )
+        _news_refreshes[company_analysis_id] = future
+    # 락 밖에서 등록: 이미 끝났으면 콜백이 이 스레드에서 바로 실행돼 같은 락을 잡는다
+    future.add_done_callback(lambda done: _on_news_refreshed(company_analysis_id, done))
+
+
+def _on_news_refreshed(company_analysis_id: int, future: Future) -> None:
+    """갱신 완료 콜백: 진행 중 목록에서 제거하고 결과를 만료 시각과 함께 보관."""
+    try:
+        fresh_news = future.result()
+    except Exception:
+        logger.exception("뉴스 백그라운드 갱신 실패: id=%s", company_analysis_id)
+        fresh_news = None
+
+    with _news_refresh_lock:
+        if _news_refreshes.get(company_analysis_id) is future:
+            del _news_refreshes[company_analysis_id]
+        if fresh_news:
+            _refreshed_news[company_analysis_id] = (fresh_news, time.monotonic())
+        for key in [
+            k for k, (_, at) in _refreshed_news.items() if _refresh_expired(at)
+        ]:
+            del _refreshed_news[key]
+
+
+def _refresh_expired(finished_at: float) -> bool:
+    return time.monotonic() - finished_at > _NEWS_FRESH_MINUTES * 60
+
+
+def _refresh_news(company_analysis_id: int, company_name: str) -> str | None:
+    """뉴스 재수집 후 company_analysis.news_summary 갱신. 수집 실패 시 None.
+
+    외부 API에서 기사를 받았을 때만 news_updated_at을 갱신한다.
+    """
+    fresh_news = _summarize_news(company_name, "")
+    if not fresh_news:
+        return None
+
+    conn = _get_conn()
+    try:
+        with conn, conn.cursor() as cur:
+            cur.execute(
+                "UPDATE company_analysis SET news_summary=%s, news_updated_at=NOW() "
+                "WHERE id=%s",
+                (fresh_news, company_analysis_id),
+            )
+    finally:
+        conn.close()
+    return fresh_news
+
+
 def _row_to_dict(row: tuple) -> dict:
     return {
         "id": row[0],
@@ -355,4 +1097,6 @@ def _row_to_dict(row: tuple) -> dict:
         "analyzed_at": row[8],
         "source_status": {},
         "user_overrides": row[9] or {},
+        "news_updated_at": row[10],
+        "source_state": row[11] or {},
     }
@@ -0,0 +1,155 @@
+"""DART 사업보고서 일괄 적재 배치.
+
+기업코드 목록의 최신 사업보고서를 DART 호출 속도 제한 안에서 병렬로 수집해
+주요 제품·시장현황·연구개발 섹션을 dart_report 테이블에 적재한다.
+채용 시즌 전에 수천 개 기업을 미리 적재해 두면 기업 분석의 DART 수집 단계가
+DART API 대신 적재된 섹션을 사용한다.
+
+    python -m cover_letter.dart_bulk
+
+환경 변수:
+    DART_BULK_CORP_CODES_FILE  기업코드 목록 파일 (한 줄에 하나, # 주석 허용)
+                               미설정 시 기업코드 인덱스의 상장사 전체
+    DART_BULK_WORKERS          동시 수집 기업 수 (기본 4)
+    DART_BULK_RATE_PER_MINUTE  분당 DART API 호출 상한 (기본 300)
+    DART_BULK_REFRESH_DAYS     이 기간 안에 적재된 기업코드는 건너뜀 (기본 30)
+
+진행 상황은 dart_report 행 자체로 기록되므로 중단 후 다시 실행하면
+처리를 마친 기업코드를 건너뛰고 실패한 기업코드만 다시 시도한다.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from cover_letter import dart_report_store
+from cover_letter.batch_utils import Throttle, load_companies
+from cover_letter.collectors import dart_collector, dart_corp_index
+from cover_letter.db import get_conn as _get_conn
+
+logger = logging.getLogger(__name__)
+
+
+def listed_corp_codes() -> list[str]:
+    """기업코드 인덱스의 상장사 기업코드 (필요하면 DART에서 내려받음)."""
+    index = dart_corp_index.get_index()
+    return [record.corp_code for record in index.records if record.listed]
+
+
+def ingest(
+    corp_codes: list[str],
+    workers: int = 4,
+    rate_per_minute: float = 300,
+    refresh_days: int = 30,
+    years: int = 3,
+) -> dict:
+    """기업코드 목록의 최신 사업보고서 섹션을 dart_report에 적재.
+
+    Args:
+        corp_codes: DART 기업코드 목록
+        workers: 동시 수집 기업 수
+        rate_per_minute: 분당 DART API 호출 상한 (0이면 제한 없음)
+        refresh_days: 이 기간 안에 처리를 마친 기업코드는 건너뜀
+        years: 사업보고서 조회 기간 (년)
+
+    Returns:
+        {"ok": int, "no_report": int, "skipped": int, "failed": {기업코드: 오류}}
+    """
+    import dart_fss as dart  # type: ignore[import-untyped]
+
+    dart.set_api_key(api_key=os.getenv("DART_API_KEY", ""))
+
+    conn = _get_conn()
+    try:
+        corp_codes = list(dict.fromkeys(corp_codes))
+        done = dart_report_store.completed(conn, corp_codes, refresh_days)
+        pending = [code for code in corp_codes if code not in done]
+        skipped = len(corp_codes) - len(pending)
+        if skipped:
+            logger.info("dart_bulk resume: %d corp codes already loaded", skipped)
+
+        corp_names = _corp_names()
+        throttle = Throttle(rate_per_minute)
+        counts = {"ok": 0, "no_report": 0}
+        failed: dict[str, str] = {}
+
+        def _fetch(corp_code: str) -> dict:
+            return dart_collector.collect_by_corp_code(
+                dart, corp_code, years, before_request=throttle.wait
+            )
+
+        # 수집은 워커 스레드에서, 저장은 이 스레드에서 (연결 1개 공유)
+        with ThreadPoolExecutor(
+            max_workers=max(workers, 1), thread_name_prefix="dart-bulk"
+        ) as pool:
+            futures = {pool.submit(_fetch, code): code for code in pending}
+            for future in as_completed(futures):
+                corp_code = futures[future]
+                corp_name = corp_names.get(corp_code, "")
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.exception("dart_bulk failed: corp_code=%s", corp_code)
+                    error = str(e) or type(e).__name__
+                    failed[corp_code] = error
+                    dart_report_store.mark_failed(conn, corp_code, corp_name, error)
+                    continue
+
+                status = "ok" if result["success"] else "no_report"
+                counts[status] += 1
+                dart_report_store.save(
+                    conn,
+                    corp_code,
+                    status,
+                    corp_name,
+                    filing=result["filing"],
+                    sections=result["data"],
+                    error=result["reason"],
+                )
+    finally:
+        conn.close()
+
+    return {**counts, "skipped": skipped, "failed": failed}
+
+
+def _corp_names() -> dict[str, str]:
+    """기업코드 → 기업명 (인덱스 캐시가 없으면 빈 dict)."""
+    try:
+        index = dart_corp_index.get_index(allow_download=False)
+    except RuntimeError:
+        return {}
+    return {record.corp_code: record.corp_name for record in index.records}
+
+
+def main() -> None:
+    """메인 실행 함수"""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    if not os.getenv("DART_API_KEY", ""):
+        raise ValueError("DART_API_KEY 환경 변수가 설정되지 않았습니다.")
+
+    codes_file = os.getenv("DART_BULK_CORP_CODES_FILE", "")
+    corp_codes = load_companies(codes_file) if codes_file else listed_corp_codes()
+
+    print("=== DART 사업보고서 일괄 적재 시작 ===")
+    print(f"대상 기업코드: {len(corp_codes)}개")
+
+    result = ingest(
+        corp_codes,
+        workers=int(os.getenv("DART_BULK_WORKERS", "4")),
+        rate_per_minute=float(os.getenv("DART_BULK_RATE_PER_MINUTE", "300")),
+        refresh_days=int(os.getenv("DART_BULK_REFRESH_DAYS", "30")),
+    )
+
+    print(
+        f"\n완료: {result['ok']}개 적재, {result['no_report']}개 보고서 없음, "
+        f"{result['skipped']}개 건너뜀, {len(result['failed'])}개 실패"
+    )
+    for corp_code, error in result["failed"].items():
+        print(f"  실패 - {corp_code}: {error}")
+
+
+if __name__ == "__main__":
+    main()
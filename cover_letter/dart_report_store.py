@@ -0,0 +1,114 @@
+"""DART 사업보고서 적재 저장소 — dart_report 테이블.
+
+일괄 수집(dart_bulk)이 기업코드별 최신 사업보고서 섹션과 처리 상태를 기록하고,
+기업 분석의 DART 수집 단계는 적재된 섹션이 있으면 DART API 대신 이를 쓴다.
+"""
+
+STATUSES = ("ok", "no_report", "failed")
+SECTION_KEYS = ("products", "market_conditions", "r_and_d")
+
+
+def save(
+    conn,
+    corp_code: str,
+    status: str,
+    corp_name: str = "",
+    filing: dict | None = None,
+    sections: dict | None = None,
+    error: str = "",
+) -> None:
+    """기업코드 1건의 적재 결과 저장 (기존 행은 덮어씀).
+
+    Args:
+        conn: psycopg2 Connection
+        corp_code: DART 기업코드
+        status: "ok" | "no_report" | "failed"
+        corp_name: DART 기업명
+        filing: {"rcept_no", "report_nm", "rcept_dt"}
+        sections: {"products", "market_conditions", "r_and_d"} 중 추출된 섹션
+        error: 실패 사유
+    """
+    if status not in STATUSES:
+        raise ValueError(f"알 수 없는 status: {status}")
+    filing = filing or {}
+    sections = sections or {}
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO dart_report
+                (corp_code, corp_name, status, rcept_no, report_nm, rcept_dt,
+                 products, market_conditions, r_and_d, error, fetched_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
+            ON CONFLICT (corp_code) DO UPDATE SET
+                corp_name         = COALESCE(NULLIF(EXCLUDED.corp_name, ''),
+                                             dart_report.corp_name),
+                status            = EXCLUDED.status,
+                rcept_no          = EXCLUDED.rcept_no,
+                report_nm         = EXCLUDED.report_nm,
+                rcept_dt          = EXCLUDED.rcept_dt,
+                products          = EXCLUDED.products,
+                market_conditions = EXCLUDED.market_conditions,
+                r_and_d           = EXCLUDED.r_and_d,
+                error             = EXCLUDED.error,
+                fetched_at        = NOW()
+            """,
+            (
+                corp_code,
+                corp_name,
+                status,
+                filing.get("rcept_no", ""),
+                filing.get("report_nm", ""),
+                filing.get("rcept_dt", ""),
+                *(sections.get(key, "") for key in SECTION_KEYS),
+                error,
+            ),
+        )
+
+
+def mark_failed(conn, corp_code: str, corp_name: str, error: str) -> None:
+    """수집 실패 기록. 이전에 적재된 섹션은 지우지 않는다."""
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO dart_report (corp_code, corp_name, status, error, fetched_at)
+            VALUES (%s, %s, 'failed', %s, NOW())
+            ON CONFLICT (corp_code) DO UPDATE SET error = EXCLUDED.error
+            """,
+            (corp_code, corp_name, error),
+        )
+
+
+def load_sections(conn, corp_code: str, max_age_days: int) -> dict[str, str] | None:
+    """적재된 사업보고서 섹션. 없거나 max_age_days보다 오래됐으면 None."""
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT products, market_conditions, r_and_d
+            FROM dart_report
+            WHERE corp_code = %s AND status = 'ok'
+              AND fetched_at > NOW() - make_interval(days => %s)
+            """,
+            (corp_code, max_age_days),
+        )
+        row = cur.fetchone()
+
+    if row is None:
+        return None
+    sections = {key: value for key, value in zip(SECTION_KEYS, row) if value}
+    return sections or None
+
+
+def completed(conn, corp_codes: list[str], max_age_days: int) -> set[str]:
+    """max_age_days 이내에 처리를 마친(ok·no_report) 기업코드 집합."""
+    if not corp_codes:
+        return set()
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT corp_code FROM dart_report
+            WHERE corp_code = ANY(%s) AND status IN ('ok', 'no_report')
+              AND fetched_at > NOW() - make_interval(days => %s)
+            """,
+            (list(corp_codes), max_age_days),
+        )
+        return {row[0] for row in cur.fetchall()}
@@ -0,0 +1,18 @@
+"""날짜 문자열 파싱 공용 도구 — 뉴스 코퍼스(news_store)·JD 점수화(jd_ranker) 공용."""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+def parse_pub_date(value: str) -> datetime | None:
+    """Naver(RFC 2822)·Firecrawl(ISO 8601) 발행일 문자열 파싱. 실패 시 None."""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
@@ -7,16 +7,10 @@
 
 import json
 import os
-import pathlib
 
-from cover_letter import llm_client
+from cover_letter import llm_client, prompt_budget, prompt_registry
 from cover_letter.db import get_conn as _get_conn
 
-_ANSWER_PROMPT_PATH = pathlib.Path(__file__).parent / "prompts" / "answer_generate.txt"
-_DIAG_PROMPT_PATH = pathlib.Path(__file__).parent / "prompts" / "self_diagnosis.txt"
-_HALLUCINATION_PROMPT_PATH = (
-    pathlib.Path(__file__).parent / "prompts" / "hallucination_check.txt"
-)
 MAX_RETRIES = int(os.getenv("COVER_LETTER_MAX_RETRIES", "3"))
 
 
@@ -76,40 +70,44 @@ def generate_answer(
             "in_range": bool,
         }
     """
-    prompt_template = _ANSWER_PROMPT_PATH.read_text(encoding="utf-8")
-    system_part, user_part = prompt_template.split("## User\n", 1)
-    system_text = system_part.replace("## System\n", "", 1).strip()
-
     experiences = profile.get("experiences", [])
-    mapped_text = _build_mapped_experiences_text(mapping_entries, experiences)
+    sections = prompt_budget.fit_sections(
+        "answer_generate",
+        {
+            "mapped_experiences_text": _build_mapped_experiences_text(
+                mapping_entries, experiences
+            ),
+            "culture_and_values": company_analysis.get("culture_and_values", ""),
+            "competitive_edge": company_analysis.get("competitive_edge", ""),
+        },
+    )
 
     writing_style = profile.get("writing_style", {})
     user_instruction_section = (
         f"[사용자 지시]\n{user_instruction}\n\n" if user_instruction else ""
     )
 
+    system_text, user_text = prompt_registry.render(
+        "answer_generate",
+        question_text=question_text,
+        char_limit=char_limit,
+        target_char_min=target_char_min,
+        target_char_max=target_char_max,
+        measured_competencies=", ".join(measured_competencies),
+        expected_level=expected_level,
+        company_name=company_analysis.get("company_name", ""),
+        job_title=job_analysis.get("job_title", ""),
+        name=profile.get("name", ""),
+        sentence_length=writing_style.get("sentence_length", "medium"),
+        tone=writing_style.get("tone", "formal"),
+        user_instruction_section=user_instruction_section,
+        **sections,
+    )
+
     best_text = ""
     best_attempt = 0
 
     for attempt in range(1, MAX_RETRIES + 1):
-        user_text = user_part.format(
-            question_text=question_text,
-            char_limit=char_limit,
-            target_char_min=target_char_min,
-            target_char_max=target_char_max,
-            measured_competencies=", ".join(measured_competencies),
-            expected_level=expected_level,
-            company_name=company_analysis.get("company_name", ""),
-            job_title=job_analysis.get("job_title", ""),
-            culture_and_values=company_analysis.get("culture_and_values", ""),
-            competitive_edge=company_analysis.get("competitive_edge", ""),
-            name=profile.get("name", ""),
-            sentence_length=writing_style.get("sentence_length", "medium"),
-            tone=writing_style.get("tone", "formal"),
-            mapped_experiences_text=mapped_text,
-            user_instruction_section=user_instruction_section,
-        )
-
         try:
             text = llm_client.call(
                 prompt=user_text, tier="pro", system=system_text
@@ -154,11 +152,8 @@ def run_self_diagnosis(
         [{"issue": str, "text": str, "suggestion": str}]
         문제 없으면 빈 리스트.
     """
-    prompt_template = _DIAG_PROMPT_PATH.read_text(encoding="utf-8")
-    system_part, user_part = prompt_template.split("## User\n", 1)
-    system_text = system_part.replace("## System\n", "", 1).strip()
-
-    user_text = user_part.format(
+    system_text, user_text = prompt_registry.render(
+        "self_diagnosis",
         question_text=question_text,
         target_char_min=target_char_min,
         target_char_max=target_char_max,
@@ -169,7 +164,10 @@ def run_self_diagnosis(
 
     try:
         raw = llm_client.call(
-            prompt=user_text, tier="pro-thinking", system=system_text
+            prompt=user_text,
+            tier="pro-thinking",
+            system=system_text,
+            critical=False,
         ).strip()
         if raw.startswith("```"):
             raw = raw.split("\n", 1)[1].rsplit("```", 1)[0].strip()
@@ -303,8 +301,6 @@ def check_hallucination(
     Returns:
         True: 환각 감지됨, False: 정상
     """
-    prompt_template = _HALLUCINATION_PROMPT_PATH.read_text(encoding="utf-8")
-
     # 사용된 경험만 추출
     experiences = profile.get("experiences", [])
     used_keys = {e.get("experience_key") for e in mapping_entries}
@@ -317,12 +313,12 @@ def check_hallucination(
         for e in used_experiences
     )
 
-    prompt = prompt_template.replace("{experiences}", exp_lines).replace(
-        "{answer_text}", answer_text
+    system, prompt = prompt_registry.render(
+        "hallucination_check", experiences=exp_lines, answer_text=answer_text
     )
 
     try:
-        raw = llm_client.call(prompt, tier="flash")
+        raw = llm_client.call(prompt, tier="flash", system=system)
         clean = (
             raw.strip()
             .removeprefix("```json")
@@ -1,13 +1,18 @@
-"""JD(직무기술서) 서비스 — 수집·저장·로드·역량 추출."""
+"""JD(직무기술서) 서비스 — 수집·저장·로드·역량 추출.
 
+요구 역량 추출 결과는 JD 본문 해시(공백 정규화) + 프롬프트 해시로
+jd_competency_cache에 보관해, 같은 공고를 다시 수집·분석하면 LLM을 호출하지 않는다.
+"""
+
+import hashlib
 import json
-import pathlib
+import logging
 
-from cover_letter import llm_client
+from cover_letter import llm_client, prompt_budget, prompt_registry
 from cover_letter.collectors.jd_crawler import crawl_jd
 from cover_letter.db import get_conn as _get_conn
 
-_PROMPT_PATH = pathlib.Path(__file__).parent / "prompts" / "question_analysis.txt"
+logger = logging.getLogger(__name__)
 
 
 def collect_jd(company_name: str, job_title: str) -> dict:
@@ -24,6 +29,8 @@ def collect_jd(company_name: str, job_title: str) -> dict:
             "source_url": str,
             "source_type": str,   # 'firecrawl' | 'pdf' | 'manual'
             "error_reason": str,  # 실패 사유(성공 시 빈 문자열)
+            "score": float,       # JD 후보 점수
+            "alternates": list[dict],  # 차순위 후보 (select_candidate로 교체)
             "required_competencies": list[str],
         }
     """
@@ -43,8 +50,34 @@ def collect_jd(company_name: str, job_title: str) -> dict:
     }
 
 
+def select_candidate(job_analysis_id: int, candidate: dict) -> int:
+    """차순위 JD 후보로 교체 저장 (요구 역량 재추출).
+
+    Args:
+        job_analysis_id: job_analysis 테이블 FK
+        candidate: collect_jd 반환값의 alternates 항목
+
+    Returns:
+        저장된 jd.id
+    """
+    try:
+        competencies = extract_required_competencies(candidate["text"])
+    except Exception:
+        competencies = []
+    return save_jd(
+        job_analysis_id,
+        {**candidate, "success": True, "required_competencies": competencies},
+    )
+
+
+def content_hash(jd_text: str) -> str:
+    """공백을 정규화한 JD 본문의 sha256."""
+    normalized = " ".join(jd_text.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
 def extract_required_competencies(jd_text: str) -> list[str]:
-    """JD 텍스트에서 LLM으로 요구 역량 목록 추출.
+    """JD 텍스트에서 요구 역량 목록 추출 (본문 해시 캐시 우선, 미스 시 LLM).
 
     Args:
         jd_text: JD 원문 텍스트
@@ -52,12 +85,24 @@ def extract_required_competencies(jd_text: str) -> list[str]:
     Returns:
         역량 키워드 목록 (예: ["Python", "협업", "문제해결력"])
     """
-    prompt = (
-        "다음 직무기술서에서 요구하는 핵심 역량과 기술을 JSON 배열로 반환하라.\n"
-        '예: ["Python", "문제해결력", "팀워크"]\n\n'
-        f"직무기술서:\n{jd_text[:3000]}"
-    )
-    raw = llm_client.call(prompt, tier="flash")
+    digest = content_hash(jd_text)
+    prompt_digest = _prompt_hash()
+    cached = _load_cached_competencies(digest, prompt_digest)
+    if cached is not None:
+        logger.info("jd competency cache hit: sha256=%s", digest[:12])
+        return cached
+
+    competencies = _extract_with_llm(jd_text)
+    if competencies:
+        _save_cached_competencies(digest, prompt_digest, competencies)
+    return competencies
+
+
+def _extract_with_llm(jd_text: str) -> list[str]:
+    """LLM(flash)으로 요구 역량 추출. 파싱 실패 시 빈 리스트."""
+    sections = prompt_budget.fit_sections("jd_competencies", {"jd_text": jd_text})
+    system, prompt = prompt_registry.render("jd_competencies", **sections)
+    raw = llm_client.call(prompt, tier="flash", system=system)
     try:
         # 마크다운 코드블록 제거
         clean = (
@@ -75,6 +120,65 @@ def extract_required_competencies(jd_text: str) -> list[str]:
     return []
 
 
+def _prompt_hash() -> str:
+    """jd_competencies 프롬프트 해시 (프롬프트가 바뀌면 캐시 무효화)."""
+    template = prompt_registry.get("jd_competencies")
+    return hashlib.sha256(
+        f"{template.system}\n{template.user}".encode("utf-8")
+    ).hexdigest()
+
+
+def _load_cached_competencies(digest: str, prompt_digest: str) -> list[str] | None:
+    """캐시된 요구 역량. 없거나 DB를 쓸 수 없으면 None."""
+    try:
+        conn = _get_conn()
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute(
+                    """
+                    UPDATE jd_competency_cache
+                    SET last_used_at = NOW()
+                    WHERE content_sha256 = %s AND prompt_sha256 = %s
+                    RETURNING required_competencies
+                    """,
+                    (digest, prompt_digest),
+                )
+                row = cur.fetchone()
+        finally:
+            conn.close()
+    except Exception:
+        logger.warning("jd competency cache 조회 실패", exc_info=True)
+        return None
+    return list(row[0]) if row else None
+
+
+def _save_cached_competencies(
+    digest: str, prompt_digest: str, competencies: list[str]
+) -> None:
+    """추출 결과 캐시 저장. 실패는 무시."""
+    try:
+        conn = _get_conn()
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO jd_competency_cache
+                        (content_sha256, prompt_sha256, required_competencies)
+                    VALUES (%s, %s, %s)
+                    ON CONFLICT (content_sha256) DO UPDATE SET
+                        prompt_sha256         = EXCLUDED.prompt_sha256,
+                        required_competencies = EXCLUDED.required_competencies,
+                        created_at            = NOW(),
+                        last_used_at          = NOW()
+                    """,
+                    (digest, prompt_digest, competencies),
+                )
+        finally:
+            conn.close()
+    except Exception:
+        logger.warning("jd competency cache 저장 실패", exc_info=True)
+
+
 def save_jd(job_analysis_id: int, jd_data: dict) -> int:
     """JD 데이터를 DB에 저장(없으면 INSERT, 있으면 UPDATE).
 
@@ -4,15 +4,27 @@ Tier 전략:
   flash       → GEMINI_FLASH_MODEL (수집/요약/매핑, 저비용)
   pro         → GEMINI_PRO_MODEL   (초안/전략, 중비용)
   pro-thinking → GEMINI_PRO_MODEL + thinking mode (자가진단/마무리, 고비용)
+
+실제 모델·thinking budget은 llm_router가 텔레메트리 기반으로 결정합니다.
 """
 
 import os
-from typing import Literal
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from cover_letter import llm_router, prompt_budget
+from cover_letter.llm_router import Tier
+from crawling import rate_limiter
 
-Tier = Literal["flash", "pro", "pro-thinking"]
+# 헤지(중복) 요청 대상 tier. 예: "pro,pro-thinking" (기본: 비활성)
+_HEDGE_TIERS = {
+    t.strip() for t in os.getenv("LLM_HEDGE_TIERS", "").split(",") if t.strip()
+}
+_HEDGE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm-hedge")
 
-_FLASH_DEFAULT = "gemini-2.5-flash"
-_PRO_DEFAULT = "gemini-2.5-pro"
+# 429(RESOURCE_EXHAUSTED) 응답 시 공용 버킷을 비우고 재시도하는 횟수
+_MAX_RATE_LIMIT_RETRIES = int(os.getenv("LLM_MAX_RATE_LIMIT_RETRIES", "2"))
 
 _TIER_TEMPERATURE: dict[str, float] = {
     "flash": 0.3,
@@ -43,6 +55,7 @@ def call(
     tier: Tier = "flash",
     system: str = "",
     temperature: float | None = None,
+    critical: bool = True,
 ) -> str:
     """Gemini 모델 호출. tier에 따라 모델 자동 선택.
 
@@ -51,6 +64,8 @@ def call(
         tier: 'flash' | 'pro' | 'pro-thinking'
         system: 시스템 프롬프트 (선택)
         temperature: 미지정 시 tier 기본값 사용
+        critical: False면 SLO 위반 시 저비용 모델·작은 thinking budget으로
+            다운그레이드 허용 (검증·진단 등 비핵심 pro 계열 호출, flash는 무시)
 
     Returns:
         모델 응답 텍스트
@@ -63,10 +78,10 @@ def call(
     except ImportError as e:
         raise RuntimeError("google-genai 패키지가 설치되어 있지 않습니다.") from e
 
-    if tier == "flash":
-        model_name = os.getenv("GEMINI_FLASH_MODEL", _FLASH_DEFAULT)
-    else:
-        model_name = os.getenv("GEMINI_PRO_MODEL", _PRO_DEFAULT)
+    route = llm_router.resolve(
+        tier, prompt_chars=len(prompt) + len(system), critical=critical
+    )
+    tier, model_name = route.tier, route.model
 
     temp = temperature if temperature is not None else _TIER_TEMPERATURE[tier]
 
@@ -74,27 +89,113 @@ def call(
 
     config_kwargs: dict = {"temperature": temp}
 
-    if tier == "pro-thinking":
+    if route.thinking_budget is not None:
         config_kwargs["thinking_config"] = types.ThinkingConfig(
-            thinking_budget=8192,
+            thinking_budget=route.thinking_budget,
         )
 
     if system:
         config_kwargs["system_instruction"] = system
 
+    config = types.GenerateContentConfig(**config_kwargs)
+    prompt_budget.preflight(prompt, system, model_name)
+    llm_router.note_call()
     try:
-        response = client.models.generate_content(
-            model=model_name,
-            contents=prompt,
-            config=types.GenerateContentConfig(**config_kwargs),
-        )
+        if tier in _HEDGE_TIERS:
+            text = _generate_hedged(client, route, prompt, config)
+        else:
+            text = _generate_once(client, route, prompt, config)
     except Exception as e:
         raise RuntimeError(f"Gemini API 호출 실패 ({tier}/{model_name}): {e}") from e
 
-    text = response.text
     if not text:
         raise RuntimeError(
             f"Gemini API가 빈 응답을 반환했습니다 ({tier}/{model_name})."
         )
 
     return str(text)
+
+
+def _generate_once(client, route: llm_router.Route, prompt: str, config) -> str:
+    """generate_content 1회 호출 후 (모델, tier) 텔레메트리 기록. 빈 응답은 빈 문자열.
+
+    호출 전 공용 속도 제한("gemini")을 거치고, 429 응답은 실패로 기록하지 않고
+    백오프 후 재시도한다.
+    """
+    for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+        rate_limiter.acquire("gemini")
+        started = time.monotonic()
+        try:
+            response = client.models.generate_content(
+                model=route.model,
+                contents=prompt,
+                config=config,
+            )
+            break
+        except Exception as e:
+            if _is_rate_limited(e) and attempt < _MAX_RATE_LIMIT_RETRIES:
+                rate_limiter.penalize("gemini", rate_limiter.retry_delay(attempt))
+                continue
+            llm_router.record(
+                route.model, route.tier, time.monotonic() - started, ok=False
+            )
+            raise
+
+    text = response.text or ""
+    llm_router.record(
+        route.model, route.tier, time.monotonic() - started, ok=bool(text)
+    )
+    return str(text)
+
+
+def _generate_hedged(client, route: llm_router.Route, prompt: str, config) -> str:
+    """p90 지연까지 응답이 없으면 중복 요청을 보내 먼저 끝난 결과 사용.
+
+    p90 표본이 부족하거나 헤지 예산(LLM_HEDGE_BUDGET)을 소진했으면
+    단일 요청과 동일하게 동작한다. 원 요청은 공용 풀 대기열을 거치지 않도록
+    전용 스레드에서 바로 시작하고, 풀(_HEDGE_EXECUTOR)은 헤지 요청에만 쓴다.
+    """
+    delay = llm_router.latency_percentile(route.model, route.tier, 0.9)
+    if delay is None:
+        return _generate_once(client, route, prompt, config)
+
+    primary = _start_thread(_generate_once, client, route, prompt, config)
+
+    done, _ = wait([primary], timeout=delay)
+    if done or not llm_router.acquire_hedge():
+        return primary.result()
+
+    hedge = _HEDGE_EXECUTOR.submit(_generate_once, client, route, prompt, config)
+    pending = {primary, hedge}
+    last_error: BaseException | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            error = future.exception()
+            if error is None and future.result():
+                return str(future.result())
+            last_error = error or last_error
+
+    if last_error is not None:
+        raise last_error
+    return ""
+
+
+def _start_thread(fn, *args) -> Future:
+    """fn(*args)를 새 데몬 스레드에서 즉시 실행하고 결과를 Future로 반환."""
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def _run() -> None:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=_run, name="llm-primary", daemon=True).start()
+    return future
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """google-genai APIError의 429(RESOURCE_EXHAUSTED) 여부."""
+    return getattr(error, "code", None) == 429 or "RESOURCE_EXHAUSTED" in str(error)
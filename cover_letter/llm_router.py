@@ -0,0 +1,198 @@
+"""LLM 라우팅 정책 — 모델별 지연·오류 텔레메트리 기반 적응형 티어 선택.
+
+정책:
+  - (모델, tier)별 최근 N회 호출의 지연시간·오류 여부를 롤링 윈도우로 집계
+    (pro와 pro-thinking은 같은 모델이어도 지연 분포가 달라 따로 집계)
+  - p90 지연이 SLO를 넘거나 오류율이 임계치를 넘으면 해당 tier를 '저하' 상태로 판정
+  - 비핵심 호출(critical=False)만 다운그레이드:
+      지연 초과 → pro-thinking은 thinking budget 축소, pro는 flash로 전환
+      오류 초과 → pro 계열 모두 flash로 전환
+  - flash는 더 내려갈 곳이 없으므로 critical 여부와 관계없이 그대로 호출
+  - pro-thinking의 thinking budget은 입력 길이에 비례해 조정
+  - 헤지 요청은 전체 호출 대비 LLM_HEDGE_BUDGET 비율 이내로 제한
+"""
+
+import math
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal
+
+Tier = Literal["flash", "pro", "pro-thinking"]
+
+_FLASH_DEFAULT = "gemini-2.5-flash"
+_PRO_DEFAULT = "gemini-2.5-pro"
+
+_WINDOW = int(os.getenv("LLM_TELEMETRY_WINDOW", "50"))
+_MIN_SAMPLES = int(os.getenv("LLM_TELEMETRY_MIN_SAMPLES", "5"))
+_SLO_FLASH_SECONDS = float(os.getenv("LLM_SLO_FLASH_SECONDS", "15"))
+_SLO_PRO_SECONDS = float(os.getenv("LLM_SLO_PRO_SECONDS", "60"))
+_SLO_ERROR_RATE = float(os.getenv("LLM_SLO_ERROR_RATE", "0.2"))
+# 전체 호출 대비 헤지(중복) 요청 허용 비율
+_HEDGE_BUDGET = float(os.getenv("LLM_HEDGE_BUDGET", "0.1"))
+
+THINKING_BUDGET_MIN = 1024
+THINKING_BUDGET_MAX = 8192
+# 입력 1자당 thinking 토큰 배수 (한국어는 대략 1~2자당 1토큰)
+_THINKING_TOKENS_PER_CHAR = 2
+
+
+@dataclass(frozen=True)
+class Route:
+    """라우팅 결정 결과."""
+
+    tier: Tier
+    model: str
+    thinking_budget: int | None = None
+    downgraded: bool = False
+
+
+class _ModelStats:
+    """(모델, tier) 1쌍의 롤링 윈도우 텔레메트리."""
+
+    def __init__(self, window: int) -> None:
+        self._samples: deque[tuple[float, bool]] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add(self, latency: float, ok: bool) -> None:
+        with self._lock:
+            self._samples.append((latency, ok))
+
+    def snapshot(self) -> list[tuple[float, bool]]:
+        with self._lock:
+            return list(self._samples)
+
+
+_stats: dict[tuple[str, Tier], _ModelStats] = {}
+_stats_lock = threading.Lock()
+
+
+def _get_stats(model: str, tier: Tier) -> _ModelStats:
+    with _stats_lock:
+        key = (model, tier)
+        if key not in _stats:
+            _stats[key] = _ModelStats(_WINDOW)
+        return _stats[key]
+
+
+def model_for_tier(tier: Tier) -> str:
+    """tier 기본 모델명 반환 (환경변수 오버라이드 반영)."""
+    if tier == "flash":
+        return os.getenv("GEMINI_FLASH_MODEL", _FLASH_DEFAULT)
+    return os.getenv("GEMINI_PRO_MODEL", _PRO_DEFAULT)
+
+
+def record(model: str, tier: Tier, latency: float, ok: bool) -> None:
+    """호출 1건의 결과를 텔레메트리에 기록.
+
+    Args:
+        model: 호출한 모델명
+        tier: 호출한 tier (라우팅 후 실제 tier)
+        latency: 소요 시간(초)
+        ok: 성공 여부
+    """
+    _get_stats(model, tier).add(latency, ok)
+
+
+def latency_percentile(model: str, tier: Tier, q: float) -> float | None:
+    """성공 호출 기준 지연시간 분위수(초). 표본 부족 시 None."""
+    latencies = sorted(lat for lat, ok in _get_stats(model, tier).snapshot() if ok)
+    if len(latencies) < _MIN_SAMPLES:
+        return None
+    idx = min(len(latencies) - 1, math.ceil(q * len(latencies)) - 1)
+    return latencies[max(idx, 0)]
+
+
+def error_rate(model: str, tier: Tier) -> float:
+    """최근 윈도우 오류율. 표본 부족 시 0.0."""
+    samples = _get_stats(model, tier).snapshot()
+    if len(samples) < _MIN_SAMPLES:
+        return 0.0
+    return sum(1 for _, ok in samples if not ok) / len(samples)
+
+
+def _slo_seconds(tier: Tier) -> float:
+    if tier == "flash":
+        return _SLO_FLASH_SECONDS
+    return _SLO_PRO_SECONDS
+
+
+def latency_breached(model: str, tier: Tier) -> bool:
+    """p90 지연이 SLO를 초과했는지 여부."""
+    p90 = latency_percentile(model, tier, 0.9)
+    return p90 is not None and p90 > _slo_seconds(tier)
+
+
+def errors_breached(model: str, tier: Tier) -> bool:
+    """오류율이 임계치를 초과했는지 여부."""
+    return error_rate(model, tier) > _SLO_ERROR_RATE
+
+
+def thinking_budget_for(prompt_chars: int) -> int:
+    """입력 길이에 비례한 thinking budget (MIN~MAX, 512 단위 올림)."""
+    raw = prompt_chars * _THINKING_TOKENS_PER_CHAR
+    rounded = math.ceil(raw / 512) * 512
+    return max(THINKING_BUDGET_MIN, min(THINKING_BUDGET_MAX, rounded))
+
+
+def resolve(tier: Tier, prompt_chars: int = 0, critical: bool = True) -> Route:
+    """tier·입력 길이·텔레메트리를 반영해 실제 호출할 모델과 설정 결정.
+
+    Args:
+        tier: 요청 tier
+        prompt_chars: system + user 프롬프트 총 글자 수
+        critical: False면 SLO 위반 시 다운그레이드 허용 (pro 계열만 해당)
+
+    Returns:
+        Route (tier, model, thinking_budget, downgraded)
+    """
+    model = model_for_tier(tier)
+    budget = thinking_budget_for(prompt_chars) if tier == "pro-thinking" else None
+
+    if critical or tier == "flash":
+        return Route(tier=tier, model=model, thinking_budget=budget)
+
+    if errors_breached(model, tier):
+        return Route(tier="flash", model=model_for_tier("flash"), downgraded=True)
+
+    if latency_breached(model, tier):
+        if tier == "pro-thinking":
+            return Route(
+                tier=tier,
+                model=model,
+                thinking_budget=THINKING_BUDGET_MIN,
+                downgraded=True,
+            )
+        return Route(tier="flash", model=model_for_tier("flash"), downgraded=True)
+
+    return Route(tier=tier, model=model, thinking_budget=budget)
+
+
+_hedge_counts = {"calls": 0, "hedges": 0}
+_hedge_lock = threading.Lock()
+
+
+def note_call() -> None:
+    """헤지 예산 계산용 호출 수 증가."""
+    with _hedge_lock:
+        _hedge_counts["calls"] += 1
+
+
+def acquire_hedge() -> bool:
+    """헤지 예산 내이면 헤지 1건을 차감하고 True 반환."""
+    with _hedge_lock:
+        limit = _HEDGE_BUDGET * _hedge_counts["calls"]
+        allowed = _hedge_counts["hedges"] + 1 <= limit
+        if allowed:
+            _hedge_counts["hedges"] += 1
+        return allowed
+
+
+def reset() -> None:
+    """텔레메트리·헤지 예산 초기화 (테스트용)."""
+    with _stats_lock:
+        _stats.clear()
+    with _hedge_lock:
+        _hedge_counts["calls"] = 0
+        _hedge_counts["hedges"] = 0
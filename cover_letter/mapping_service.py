@@ -5,13 +5,10 @@ score≥3인 경험만 매핑 결과에 포함합니다.
 """
 
 import json
-import pathlib
 
-from cover_letter import llm_client
+from cover_letter import llm_client, prompt_budget, prompt_registry
 from cover_letter.db import get_conn as _get_conn
 
-_PROMPT_PATH = pathlib.Path(__file__).parent / "prompts" / "mapping_generate.txt"
-
 
 def generate_mapping(
     question_id: int,
@@ -43,18 +40,21 @@ def generate_mapping(
     if not experiences:
         return []
 
-    prompt_template = _PROMPT_PATH.read_text(encoding="utf-8")
-    system_part, user_part = prompt_template.split("## User\n", 1)
-    system_text = system_part.replace("## System\n", "", 1).strip()
-
-    user_text = user_part.format(
+    sections = prompt_budget.fit_sections(
+        "mapping_generate",
+        {
+            "culture_and_values": culture_and_values,
+            "experiences_json": json.dumps(experiences, ensure_ascii=False, indent=2),
+        },
+    )
+    system_text, user_text = prompt_registry.render(
+        "mapping_generate",
         question_text=question_text,
         measured_competencies=", ".join(measured_competencies),
         expected_level=expected_level,
         company_name=company_name,
         job_title=job_title,
-        culture_and_values=culture_and_values,
-        experiences_json=json.dumps(experiences, ensure_ascii=False, indent=2),
+        **sections,
     )
 
     try:
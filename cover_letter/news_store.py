@@ -0,0 +1,104 @@
+"""뉴스 기사 로컬 코퍼스 — news_article 테이블.
+
+일일 크롤러(db.db_news.save_news_articles)와 자소서 뉴스 수집이 함께 채우고,
+collect_news는 외부 API 호출 전에 여기서 최근 기사를 먼저 찾는다.
+"""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+from psycopg2.extras import execute_values
+
+from cover_letter.date_utils import parse_pub_date
+
+
+def save(conn, keyword: str, articles: list[dict]) -> int:
+    """기사 목록 저장 (링크 기준 중복 무시).
+
+    Args:
+        conn: psycopg2 Connection
+        keyword: 수집 검색어 (기업명)
+        articles: [{"title", "description", "pubDate", "link"}]
+
+    Returns:
+        저장 시도한 기사 수 (링크가 없는 기사 제외)
+    """
+    rows = [
+        (
+            keyword,
+            a.get("title", ""),
+            a.get("description", ""),
+            a["link"],
+            parse_pub_date(a.get("pubDate", "")) or datetime.now(timezone.utc),
+        )
+        for a in articles
+        if a.get("link")
+    ]
+    if not rows:
+        return 0
+    with conn, conn.cursor() as cur:
+        execute_values(
+            cur,
+            """
+            INSERT INTO news_article (keyword, title, description, link, pub_date)
+            VALUES %s
+            ON CONFLICT (link) DO NOTHING
+            """,
+            rows,
+        )
+    return len(rows)
+
+
+def search(
+    conn, company_name: str, job_title: str = "", max_age_days: int = 7, limit: int = 10
+) -> list[dict]:
+    """기업명(검색어 또는 제목 포함)으로 최근 기사 조회, 최신순.
+
+    Args:
+        conn: psycopg2 Connection
+        company_name: 기업명
+        job_title: 직무명 (지정 시 제목·요약에 포함된 기사만)
+        max_age_days: 이 기간 안에 발행된 기사만
+        limit: 최대 기사 수
+
+    Returns:
+        [{"title", "description", "pubDate", "link"}] (pubDate는 RFC 2822)
+    """
+    sql = """
+        SELECT title, description, link, pub_date
+        FROM news_article
+        WHERE (keyword = %(company)s OR title ILIKE %(company_pattern)s)
+          AND pub_date > NOW() - make_interval(days => %(days)s)
+    """
+    params = {
+        "company": company_name,
+        "company_pattern": _contains(company_name),
+        "days": max_age_days,
+        "limit": limit,
+    }
+    if job_title:
+        sql += """
+          AND (title ILIKE %(job_pattern)s OR description ILIKE %(job_pattern)s)
+        """
+        params["job_pattern"] = _contains(job_title)
+    sql += " ORDER BY pub_date DESC LIMIT %(limit)s"
+
+    with conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+
+    return [
+        {
+            "title": row[0],
+            "description": row[1] or "",
+            "pubDate": format_datetime(row[3]),
+            "link": row[2],
+        }
+        for row in rows
+    ]
+
+
+def _contains(text: str) -> str:
+    """ILIKE 부분 일치 패턴 (%, _ 이스케이프)."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
@@ -0,0 +1,170 @@
+"""기업·직무 분석 캐시 사전 적재 (pre-warm) 배치.
+
+채용 시즌 주요 기업 목록을 미리 분석해 두어, 사용자 요청이
+콜드 패스(3-소스 수집 + LLM 요약) 대신 캐시를 타도록 한다.
+
+    python -m cover_letter.prewarm
+
+환경 변수:
+    PREWARM_COMPANIES_FILE   기업명 목록 파일 (한 줄에 하나, # 주석 허용) — 필수
+    PREWARM_JOB_TITLES       함께 분석할 공통 직무 (쉼표 구분)
+    PREWARM_WORKERS          동시 분석 기업 수 (기본 4)
+    PREWARM_RATE_PER_MINUTE  분당 분석 시작 기업 수 상한 (기본 30)
+    PREWARM_CHECKPOINT       진행 상황 파일 (기본 logs/prewarm_checkpoint.json)
+
+중단되면 체크포인트에 기록된 완료 기업을 건너뛰고 이어서 실행한다.
+배치가 끝나면 완료 목록을 비우고 실패 기업만 남겨(실패가 없으면 삭제)
+다음 실행(예: 매일 스케줄)이 전체 기업을 다시 적재하게 한다.
+"""
+
+import json
+import logging
+import os
+import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from cover_letter import company_service
+from cover_letter.batch_utils import Throttle, load_companies
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_TITLES = "백엔드 개발자,프론트엔드 개발자,데이터 분석가,마케팅,영업,인사"
+
+
+class _Checkpoint:
+    """완료·실패 기업을 JSON 파일에 원자적으로 기록."""
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.done: set[str] = set()
+        self.failed: dict[str, str] = {}
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.done = set(data.get("done", []))
+            self.failed = dict(data.get("failed", {}))
+
+    def mark(self, company_name: str, error: str | None = None) -> None:
+        with self._lock:
+            if error is None:
+                self.done.add(company_name)
+                self.failed.pop(company_name, None)
+            else:
+                self.failed[company_name] = error
+            self._write()
+
+    def _write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps(
+                {"done": sorted(self.done), "failed": self.failed},
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+
+    def finish(self, failed: dict[str, str]) -> None:
+        """실행 종료: 완료 목록을 비우고 이번 실행의 실패만 남긴다."""
+        with self._lock:
+            self.done.clear()
+            self.failed = dict(failed)
+            if self.failed:
+                self._write()
+            else:
+                self.path.unlink(missing_ok=True)
+
+
+def prewarm(
+    companies: list[str],
+    job_titles: list[str],
+    workers: int = 4,
+    rate_per_minute: float = 30,
+    checkpoint_path: str | pathlib.Path = "logs/prewarm_checkpoint.json",
+) -> dict:
+    """기업 목록에 대해 기업 분석 + 공통 직무 분석을 미리 실행.
+
+    Args:
+        companies: 기업명 목록
+        job_titles: 기업마다 분석할 직무명 목록
+        workers: 동시 분석 기업 수
+        rate_per_minute: 분당 분석 시작 기업 수 상한 (0이면 제한 없음)
+        checkpoint_path: 체크포인트 파일 경로
+
+    Returns:
+        {"warmed": int, "skipped": int, "failed": {기업명: 오류}}
+    """
+    checkpoint = _Checkpoint(pathlib.Path(checkpoint_path))
+    pending = [name for name in companies if name not in checkpoint.done]
+    skipped = len(companies) - len(pending)
+    if skipped:
+        logger.info("prewarm resume: %d companies already done", skipped)
+
+    throttle = Throttle(rate_per_minute)
+
+    def _warm(company_name: str) -> bool:
+        throttle.wait()
+        try:
+            company = company_service.get_or_analyze_company(company_name)
+            for job_title in job_titles:
+                company_service.analyze_job(company["id"], job_title)
+        except Exception as e:
+            logger.exception("prewarm failed: company=%s", company_name)
+            checkpoint.mark(company_name, error=str(e) or type(e).__name__)
+            return False
+        checkpoint.mark(company_name)
+        logger.info("prewarm done: company=%s jobs=%d", company_name, len(job_titles))
+        return True
+
+    with ThreadPoolExecutor(
+        max_workers=max(workers, 1), thread_name_prefix="prewarm"
+    ) as pool:
+        warmed = sum(pool.map(_warm, pending))
+
+    failed = {
+        name: checkpoint.failed[name] for name in pending if name in checkpoint.failed
+    }
+    checkpoint.finish(failed)
+    return {"warmed": warmed, "skipped": skipped, "failed": failed}
+
+
+def main() -> None:
+    """메인 실행 함수"""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    companies_file = os.getenv("PREWARM_COMPANIES_FILE", "")
+    if not companies_file:
+        raise ValueError("PREWARM_COMPANIES_FILE 환경 변수가 설정되지 않았습니다.")
+    companies = load_companies(companies_file)
+    job_titles = [
+        title.strip()
+        for title in os.getenv("PREWARM_JOB_TITLES", DEFAULT_JOB_TITLES).split(",")
+        if title.strip()
+    ]
+
+    print("=== 기업·직무 분석 사전 적재 시작 ===")
+    print(f"기업: {len(companies)}개, 직무: {', '.join(job_titles)}")
+
+    result = prewarm(
+        companies,
+        job_titles,
+        workers=int(os.getenv("PREWARM_WORKERS", "4")),
+        rate_per_minute=float(os.getenv("PREWARM_RATE_PER_MINUTE", "30")),
+        checkpoint_path=os.getenv("PREWARM_CHECKPOINT", "logs/prewarm_checkpoint.json"),
+    )
+
+    print(
+        f"\n완료: {result['warmed']}개 적재, {result['skipped']}개 건너뜀, "
+        f"{len(result['failed'])}개 실패"
+    )
+    for name, error in result["failed"].items():
+        print(f"  실패 - {name}: {error}")
+
+
+if __name__ == "__main__":
+    main()
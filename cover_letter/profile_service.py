@@ -4,11 +4,9 @@ import io
 import json
 import pathlib
 
-from cover_letter import llm_client
+from cover_letter import llm_client, prompt_budget, prompt_registry
 from cover_letter.db import get_conn as _get_conn
 
-_PROMPT_PATH = pathlib.Path(__file__).parent / "prompts" / "profile_extract.txt"
-
 
 def parse_input(
     text: str | None,
@@ -64,17 +62,10 @@ def extract_profile(texts: list[str]) -> dict:
     Returns:
         {"experiences": [...], "competencies": [...], "writing_style": {...}}
     """
-    prompt_template = _PROMPT_PATH.read_text(encoding="utf-8")
-    combined_text = "\n\n---\n\n".join(texts)
-    prompt = prompt_template.replace("{texts}", combined_text)
-
-    # System / User 구분: 프롬프트 파일에서 ## System / ## User 섹션 분리
-    system = ""
-    user = prompt
-    if "## System\n" in prompt and "## User\n" in prompt:
-        parts = prompt.split("## User\n", 1)
-        system = parts[0].replace("## System\n", "").strip()
-        user = parts[1].strip()
+    combined_text = prompt_budget.fit_sections(
+        "profile_extract", {"texts": "\n\n---\n\n".join(texts)}
+    )["texts"]
+    system, user = prompt_registry.render("profile_extract", texts=combined_text)
 
     raw = llm_client.call(user, tier="flash", system=system, temperature=0.3)
 
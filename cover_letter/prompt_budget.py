@@ -0,0 +1,182 @@
+"""프롬프트 토큰 예산 관리 — 섹션별 예산 + 우선순위 기반 트리밍.
+
+템플릿 placeholder(섹션)마다 토큰 예산과 우선순위를 두고,
+  1. 각 섹션을 자기 예산 이내로 자르고
+  2. 합계가 템플릿 전체 예산을 넘으면 우선순위가 낮은 섹션부터 추가로 줄인다.
+
+토큰 수는 로컬 추정기로 계산하며, PROMPT_TOKEN_COUNTER=gemini이면
+최종 프롬프트 점검(preflight)에 Gemini count_tokens API를 사용한다.
+"""
+
+import logging
+import math
+import os
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+MAX_INPUT_TOKENS = int(os.getenv("PROMPT_MAX_INPUT_TOKENS", "8000"))
+_TRUNCATION_MARK = "\n…(이하 생략)"
+
+
+@dataclass(frozen=True)
+class SectionBudget:
+    """템플릿 섹션 1개의 토큰 예산.
+
+    priority가 작을수록 중요 (전체 예산 초과 시 큰 값부터 줄인다).
+    """
+
+    name: str
+    max_tokens: int
+    priority: int
+
+
+# 템플릿별 가변 섹션 예산 (고정 지시문은 예산 밖).
+# 섹션이 여러 개인 템플릿은 전체 예산을 섹션 상한 합보다 작게 잡아, 모든 섹션이
+# 상한 가까이 찼을 때 우선순위 트리밍이 동작하게 한다.
+TEMPLATE_BUDGETS: dict[str, tuple[int, list[SectionBudget]]] = {
+    "company_analysis": (
+        3600,
+        [
+            SectionBudget("dart_summary", 1800, priority=1),
+            SectionBudget("website_summary", 1500, priority=2),
+            SectionBudget("news_summary", 1200, priority=3),
+        ],
+    ),
+    "jd_competencies": (
+        2000,
+        [SectionBudget("jd_text", 2000, priority=1)],
+    ),
+    "profile_extract": (
+        6000,
+        [SectionBudget("texts", 6000, priority=1)],
+    ),
+    "mapping_generate": (
+        2600,
+        [
+            SectionBudget("experiences_json", 2500, priority=1),
+            SectionBudget("culture_and_values", 500, priority=2),
+        ],
+    ),
+    "answer_generate": (
+        3000,
+        [
+            SectionBudget("mapped_experiences_text", 2500, priority=1),
+            SectionBudget("culture_and_values", 500, priority=2),
+            SectionBudget("competitive_edge", 500, priority=3),
+        ],
+    ),
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """로컬 토큰 수 추정.
+
+    ASCII는 약 4자당 1토큰, 한글 등 비ASCII는 약 1.5자당 1토큰으로 계산한다.
+    """
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    other_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / 4 + other_chars / 1.5)
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """프롬프트 토큰 수. PROMPT_TOKEN_COUNTER=gemini면 API, 실패 시 로컬 추정."""
+    if os.getenv("PROMPT_TOKEN_COUNTER", "local") == "gemini":
+        try:
+            from cover_letter import llm_client, llm_router
+
+            client = llm_client._get_client()
+            response = client.models.count_tokens(
+                model=model or llm_router.model_for_tier("flash"), contents=text
+            )
+            return int(response.total_tokens)
+        except Exception:
+            logger.warning("count_tokens API 실패, 로컬 추정으로 대체")
+    return estimate_tokens(text)
+
+
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    """텍스트를 max_tokens 이내로 앞부분 유지하며 자른다.
+
+    가능하면 줄 경계에서 자르고 생략 표시를 붙인다.
+    """
+    if max_tokens <= 0:
+        return ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    mark_tokens = estimate_tokens(_TRUNCATION_MARK)
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) + mark_tokens <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+
+    cut = text[:lo]
+    newline = cut.rfind("\n")
+    if newline > len(cut) // 2:
+        cut = cut[:newline]
+    return cut.rstrip() + _TRUNCATION_MARK if cut.strip() else ""
+
+
+def fit_sections(template: str, values: dict[str, str]) -> dict[str, str]:
+    """템플릿 예산에 맞춰 섹션 값을 트리밍한 새 dict 반환.
+
+    Args:
+        template: TEMPLATE_BUDGETS 키 (예: "company_analysis")
+        values: placeholder → 값
+
+    Returns:
+        예산이 적용된 값 dict (예산 없는 키는 그대로)
+    """
+    if template not in TEMPLATE_BUDGETS:
+        return dict(values)
+
+    total_budget, sections = TEMPLATE_BUDGETS[template]
+    fitted = dict(values)
+    for section in sections:
+        if section.name in fitted:
+            fitted[section.name] = trim_to_tokens(
+                str(fitted[section.name]), section.max_tokens
+            )
+
+    used = {s.name: estimate_tokens(fitted.get(s.name, "")) for s in sections}
+    overflow = sum(used.values()) - total_budget
+    for section in sorted(sections, key=lambda s: s.priority, reverse=True):
+        if overflow <= 0:
+            break
+        if section.name not in fitted:
+            continue
+        keep = max(used[section.name] - overflow, 0)
+        fitted[section.name] = trim_to_tokens(fitted[section.name], keep)
+        overflow -= used[section.name] - estimate_tokens(fitted[section.name])
+
+    return fitted
+
+
+def preflight(prompt: str, system: str = "", model: str | None = None) -> int:
+    """조립된 프롬프트의 토큰 수 확인.
+
+    Returns:
+        system + prompt 토큰 수
+
+    Raises:
+        RuntimeError: MAX_INPUT_TOKENS 초과 (뒤쪽 지시문이 잘리지 않도록
+            자르지 않고 호출을 막는다)
+    """
+    tokens = count_tokens(f"{system}\n{prompt}" if system else prompt, model)
+    if tokens > MAX_INPUT_TOKENS:
+        logger.warning(
+            "프롬프트 토큰 예산 초과: tokens=%d limit=%d model=%s",
+            tokens,
+            MAX_INPUT_TOKENS,
+            model,
+        )
+        raise RuntimeError(
+            f"프롬프트 토큰 예산 초과: {tokens} > {MAX_INPUT_TOKENS} (model={model})"
+        )
+    return tokens
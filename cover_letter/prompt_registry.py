@@ -0,0 +1,185 @@
+"""프롬프트 템플릿 레지스트리 — prompts/*.txt 1회 로드·사전 파싱·검증.
+
+- 모듈 임포트 시 모든 템플릿을 읽어 ## System / ## User 섹션으로 분리
+- 템플릿별 placeholder 집합을 EXPECTED_PLACEHOLDERS와 대조해 불일치 시 즉시 실패
+- render()는 단일 패스 정규식 치환 ({name} 치환, {{ }} 이스케이프 해제)
+- PROMPT_HOT_RELOAD=true면 파일 mtime 변경 시 자동 재로드 (개발용)
+"""
+
+import os
+import pathlib
+import re
+import threading
+from dataclasses import dataclass
+
+_PROMPTS_DIR = pathlib.Path(__file__).parent / "prompts"
+_HOT_RELOAD = os.getenv("PROMPT_HOT_RELOAD", "false").lower() == "true"
+
+# {{ / }} 이스케이프 또는 {identifier} placeholder
+_TOKEN_RE = re.compile(r"\{\{|\}\}|\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+EXPECTED_PLACEHOLDERS: dict[str, frozenset[str]] = {
+    "answer_generate": frozenset(
+        {
+            "question_text",
+            "char_limit",
+            "target_char_min",
+            "target_char_max",
+            "measured_competencies",
+            "expected_level",
+            "company_name",
+            "job_title",
+            "culture_and_values",
+            "competitive_edge",
+            "name",
+            "sentence_length",
+            "tone",
+            "mapped_experiences_text",
+            "user_instruction_section",
+        }
+    ),
+    "company_analysis": frozenset(
+        {"company_name", "dart_summary", "news_summary", "website_summary"}
+    ),
+    "hallucination_check": frozenset({"experiences", "answer_text"}),
+    "jd_competencies": frozenset({"jd_text"}),
+    "job_analysis": frozenset(
+        {"company_name", "job_title", "overview", "industry_trends"}
+    ),
+    "mapping_generate": frozenset(
+        {
+            "question_text",
+            "measured_competencies",
+            "expected_level",
+            "company_name",
+            "job_title",
+            "culture_and_values",
+            "experiences_json",
+        }
+    ),
+    "profile_extract": frozenset({"texts"}),
+    "question_analysis": frozenset(
+        {"company_name", "job_title", "question_text", "char_limit"}
+    ),
+    "self_diagnosis": frozenset(
+        {
+            "question_text",
+            "target_char_min",
+            "target_char_max",
+            "measured_competencies",
+            "char_count",
+            "draft_text",
+        }
+    ),
+}
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """사전 파싱된 프롬프트 템플릿."""
+
+    name: str
+    system: str
+    user: str
+    placeholders: frozenset[str]
+    mtime: float
+
+
+_templates: dict[str, PromptTemplate] = {}
+_lock = threading.Lock()
+
+
+def _parse(path: pathlib.Path) -> PromptTemplate:
+    """템플릿 파일 1개를 읽어 System/User 분리 + placeholder 추출."""
+    raw = path.read_text(encoding="utf-8")
+    system, user = "", raw.strip()
+    if "## System\n" in raw and "## User\n" in raw:
+        system_part, user_part = raw.split("## User\n", 1)
+        system = system_part.replace("## System\n", "", 1).strip()
+        user = user_part.strip()
+
+    placeholders = frozenset(
+        m.group(1) for m in _TOKEN_RE.finditer(user) if m.group(1) is not None
+    )
+    return PromptTemplate(
+        name=path.stem,
+        system=system,
+        user=user,
+        placeholders=placeholders,
+        mtime=path.stat().st_mtime,
+    )
+
+
+def _validate(template: PromptTemplate) -> None:
+    expected = EXPECTED_PLACEHOLDERS.get(template.name)
+    if expected is None:
+        raise RuntimeError(
+            f"프롬프트 '{template.name}'의 placeholder 정의가 없습니다 "
+            "(prompt_registry.EXPECTED_PLACEHOLDERS에 추가하세요)."
+        )
+    missing = expected - template.placeholders
+    unknown = template.placeholders - expected
+    if missing or unknown:
+        raise RuntimeError(
+            f"프롬프트 '{template.name}' placeholder 불일치: "
+            f"누락={sorted(missing)}, 미정의={sorted(unknown)}"
+        )
+
+
+def load_all() -> None:
+    """prompts/*.txt 전체 로드·검증. 불일치 시 RuntimeError."""
+    loaded = {}
+    for path in sorted(_PROMPTS_DIR.glob("*.txt")):
+        template = _parse(path)
+        _validate(template)
+        loaded[template.name] = template
+    with _lock:
+        _templates.clear()
+        _templates.update(loaded)
+
+
+def get(name: str) -> PromptTemplate:
+    """이름으로 템플릿 조회. 핫 리로드 모드면 mtime 변경 시 재로드."""
+    with _lock:
+        template = _templates.get(name)
+    if template is None:
+        raise KeyError(f"프롬프트 템플릿 없음: {name}")
+
+    if _HOT_RELOAD:
+        path = _PROMPTS_DIR / f"{name}.txt"
+        if path.stat().st_mtime != template.mtime:
+            template = _parse(path)
+            _validate(template)
+            with _lock:
+                _templates[name] = template
+    return template
+
+
+def render(template_name: str, /, **values: object) -> tuple[str, str]:
+    """템플릿을 단일 패스로 렌더링.
+
+    Args:
+        template_name: 템플릿 이름 (파일명에서 .txt 제외)
+        **values: placeholder 값
+
+    Returns:
+        (system, user) 튜플
+
+    Raises:
+        ValueError: 필요한 placeholder 값이 누락된 경우
+    """
+    template = get(template_name)
+    missing = template.placeholders - values.keys()
+    if missing:
+        raise ValueError(f"프롬프트 '{template_name}' 값 누락: {sorted(missing)}")
+
+    def _replace(match: re.Match) -> str:
+        key = match.group(1)
+        if key is None:
+            return match.group(0)[0]
+        return str(values[key])
+
+    return template.system, _TOKEN_RE.sub(_replace, template.user)
+
+
+load_all()
@@ -1,13 +1,10 @@
 """문항 분석 서비스 — LLM 기반 문항 역량 분석 및 DB 저장."""
 
 import json
-import pathlib
 
-from cover_letter import llm_client
+from cover_letter import llm_client, prompt_registry
 from cover_letter.db import get_conn as _get_conn
 
-_PROMPT_PATH = pathlib.Path(__file__).parent / "prompts" / "question_analysis.txt"
-
 
 def analyze_question(
     job_analysis_id: int,
@@ -50,19 +47,12 @@ def analyze_question(
         job_title, company_name = row[0], row[1]
 
         # 프롬프트 빌드
-        prompt_template = _PROMPT_PATH.read_text(encoding="utf-8")
-        system = ""
-        user = prompt_template
-        if "## System\n" in prompt_template and "## User\n" in prompt_template:
-            parts = prompt_template.split("## User\n", 1)
-            system = parts[0].replace("## System\n", "").strip()
-            user = parts[1].strip()
-
-        user = (
-            user.replace("{company_name}", company_name)
-            .replace("{job_title}", job_title)
-            .replace("{question_text}", question_text)
-            .replace("{char_limit}", str(char_limit) if char_limit else "제한 없음")
+        system, user = prompt_registry.render(
+            "question_analysis",
+            company_name=company_name,
+            job_title=job_title,
+            question_text=question_text,
+            char_limit=str(char_limit) if char_limit else "제한 없음",
         )
 
         raw = llm_client.call(user, tier="flash", system=system)
@@ -0,0 +1,61 @@
+"""저장된 수집 원본(source_document)으로 기업 요약 일괄 재생성.
+
+프롬프트(prompts/company_analysis.txt)를 바꾼 뒤 외부 수집 API 호출 없이
+기존 기업 분석을 새 프롬프트로 백필할 때 사용한다.
+
+    python -m cover_letter.resummarize
+
+환경 변수:
+    RESUMMARIZE_COMPANIES  대상 기업명 (쉼표 구분, 미설정 시 원본이 있는 전체 기업)
+"""
+
+import logging
+import os
+
+from cover_letter import company_service, source_store
+from cover_letter.db import get_conn as _get_conn
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """메인 실행 함수"""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    companies = [
+        name.strip()
+        for name in os.getenv("RESUMMARIZE_COMPANIES", "").split(",")
+        if name.strip()
+    ]
+    if not companies:
+        conn = _get_conn()
+        try:
+            companies = source_store.list_companies(conn)
+        finally:
+            conn.close()
+
+    print("=== 저장된 원본으로 기업 요약 재생성 시작 ===")
+    print(f"대상 기업: {len(companies)}개")
+
+    success_count = 0
+    error_count = 0
+    for name in companies:
+        try:
+            result = company_service.resummarize_from_store(name)
+        except Exception as e:
+            error_count += 1
+            print(f"재생성 실패 - {name}: {e}")
+            continue
+        if result is None:
+            error_count += 1
+            print(f"원본 없음 - {name}")
+            continue
+        success_count += 1
+
+    print(f"\n재생성 완료: {success_count}개 성공, {error_count}개 실패")
+
+
+if __name__ == "__main__":
+    main()
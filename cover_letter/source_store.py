@@ -0,0 +1,113 @@
+"""수집 원본 저장소 — source_document 테이블 (zlib 압축 + sha256).
+
+DART·뉴스·홈페이지 수집 결과(payload)를 요약과 별개로 보관한다.
+같은 내용을 다시 수집하면 행을 추가하지 않고 fetched_at만 갱신하며,
+프롬프트를 바꿨을 때 외부 API 재호출 없이 저장된 원본으로 재요약할 수 있다.
+(기업, 소스)별로 최근 SOURCE_DOCUMENT_KEEP_VERSIONS개 버전만 남긴다.
+"""
+
+import hashlib
+import json
+import os
+import zlib
+
+SOURCES = ("dart", "news", "website")
+# (기업, 소스)별 보관 버전 수 — 저장할 때마다 오래된 버전 삭제
+_KEEP_VERSIONS = max(int(os.getenv("SOURCE_DOCUMENT_KEEP_VERSIONS", "5")), 1)
+
+
+def encode(payload) -> tuple[bytes, str]:
+    """payload를 정렬된 JSON으로 직렬화해 (zlib 압축 바이트, sha256) 반환."""
+    text = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    raw = text.encode("utf-8")
+    return zlib.compress(raw, 6), hashlib.sha256(raw).hexdigest()
+
+
+def decode(content) -> object:
+    """encode()의 역변환. BYTEA(memoryview)도 받는다."""
+    return json.loads(zlib.decompress(bytes(content)).decode("utf-8"))
+
+
+def save(conn, company_name: str, source: str, payload, url: str = "") -> str:
+    """수집 원본 1건 저장 후 같은 (기업, 소스)의 오래된 버전 정리.
+
+    Args:
+        conn: psycopg2 Connection
+        company_name: 기업명
+        source: "dart" | "news" | "website"
+        payload: 수집기 반환 data (JSON 직렬화 가능)
+        url: 원본 URL (있는 경우)
+
+    Returns:
+        payload sha256
+    """
+    if source not in SOURCES:
+        raise ValueError(f"알 수 없는 source: {source}")
+    content, digest = encode(payload)
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO source_document
+                (company_name, source, url, content, content_sha256, fetched_at)
+            VALUES (%s, %s, %s, %s, %s, NOW())
+            ON CONFLICT (company_name, source, content_sha256) DO UPDATE SET
+                fetched_at = NOW(),
+                url        = COALESCE(NULLIF(EXCLUDED.url, ''), source_document.url)
+            """,
+            (company_name, source, url, content, digest),
+        )
+        cur.execute(
+            """
+            DELETE FROM source_document
+            WHERE company_name = %s AND source = %s
+              AND id NOT IN (
+                  SELECT id FROM source_document
+                  WHERE company_name = %s AND source = %s
+                  ORDER BY fetched_at DESC
+                  LIMIT %s
+              )
+            """,
+            (company_name, source, company_name, source, _KEEP_VERSIONS),
+        )
+    return digest
+
+
+def load_latest(conn, company_name: str) -> dict[str, dict]:
+    """기업의 소스별 최신 원본 조회.
+
+    Returns:
+        {source: {"payload": Any, "url": str, "fetched_at": datetime,
+                  "sha256": str}}
+        저장된 원본이 없는 소스는 키가 없다.
+    """
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT DISTINCT ON (source)
+                   source, url, content, content_sha256, fetched_at
+            FROM source_document
+            WHERE company_name = %s
+            ORDER BY source, fetched_at DESC
+            """,
+            (company_name,),
+        )
+        rows = cur.fetchall()
+
+    return {
+        row[0]: {
+            "payload": decode(row[2]),
+            "url": row[1] or "",
+            "sha256": row[3],
+            "fetched_at": row[4],
+        }
+        for row in rows
+    }
+
+
+def list_companies(conn) -> list[str]:
+    """원본이 저장된 기업명 목록."""
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT DISTINCT company_name FROM source_document ORDER BY company_name"
+        )
+        return [row[0] for row in cur.fetchall()]
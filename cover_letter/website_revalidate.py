@@ -0,0 +1,135 @@
+"""기업 홈페이지 캐시 재검증 배치.
+
+company_website에서 마지막 확인 후 WEBSITE_REVALIDATE_DAYS가 지난 기업의 출처
+페이지를 조건부 GET(If-None-Match / If-Modified-Since)으로 확인한다.
+
+- 304 또는 본문 해시가 그대로면 Firecrawl 호출 없이 checked_at만 연장
+- 처음 확인하는 페이지는 검증값(ETag·Last-Modified·본문 해시)만 기록
+- 바뀌었거나 출처 URL이 없으면 Firecrawl로 다시 수집해 캐시 갱신
+- 페이지 확인 자체가 실패하면 그대로 두고 다음 실행에서 다시 시도
+
+    python -m cover_letter.website_revalidate
+
+환경 변수:
+    WEBSITE_REVALIDATE_DAYS   마지막 확인 후 이 기간이 지난 기업만 (기본 30)
+    WEBSITE_REVALIDATE_LIMIT  1회 실행 최대 기업 수 (기본 200)
+"""
+
+import hashlib
+import logging
+import os
+
+import requests
+
+from cover_letter import website_store
+from cover_letter.collectors import website_crawler
+from cover_letter.db import get_conn as _get_conn
+
+_USER_AGENT = "Mozilla/5.0 (compatible; TrendOpsBot/1.0)"
+
+
+def probe(url: str, etag: str = "", last_modified: str = "") -> dict:
+    """출처 페이지 조건부 GET.
+
+    Returns:
+        {"status": 304 | 200, "etag": str, "last_modified": str, "page_sha256": str}
+        304이면 page_sha256은 빈 문자열.
+
+    Raises:
+        requests.exceptions.RequestException: 요청 실패 또는 오류 응답
+    """
+    headers = {"User-Agent": _USER_AGENT}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    response = requests.get(url, headers=headers, timeout=10)
+    if response.status_code == 304:
+        return {
+            "status": 304,
+            "etag": etag,
+            "last_modified": last_modified,
+            "page_sha256": "",
+        }
+    response.raise_for_status()
+    return {
+        "status": 200,
+        "etag": response.headers.get("ETag", ""),
+        "last_modified": response.headers.get("Last-Modified", ""),
+        "page_sha256": hashlib.sha256(response.content).hexdigest(),
+    }
+
+
+def revalidate(older_than_days: int = 30, limit: int = 200) -> dict:
+    """확인 주기가 지난 기업 캐시 재검증.
+
+    Returns:
+        {"unchanged": int, "refreshed": int, "failed": {기업명: 사유}}
+    """
+    conn = _get_conn()
+    try:
+        rows = website_store.due_for_check(conn, older_than_days, limit)
+        counts = {"unchanged": 0, "refreshed": 0}
+        failed: dict[str, str] = {}
+
+        for row in rows:
+            company_name = row["company_name"]
+            page = None
+            if row["source_url"]:
+                try:
+                    page = probe(row["source_url"], row["etag"], row["last_modified"])
+                except requests.exceptions.RequestException as e:
+                    failed[company_name] = f"페이지 확인 실패: {e}"
+                    continue
+
+                if page["status"] == 304:
+                    page["page_sha256"] = row["page_sha256"]
+                # 검증값이 없던 페이지는 이번 응답을 기준으로 삼는다
+                if page["page_sha256"] == row["page_sha256"] or not row["page_sha256"]:
+                    _mark_checked(conn, company_name, page)
+                    counts["unchanged"] += 1
+                    continue
+
+            status = website_crawler.search_company_website(company_name)
+            if not status["success"]:
+                failed[company_name] = status["reason"]
+                continue
+            website_store.save(conn, company_name, status["data"])
+            if page is not None and status["data"]["source_url"] == row["source_url"]:
+                _mark_checked(conn, company_name, page)
+            counts["refreshed"] += 1
+    finally:
+        conn.close()
+
+    return {**counts, "failed": failed}
+
+
+def _mark_checked(conn, company_name: str, page: dict) -> None:
+    website_store.mark_checked(
+        conn, company_name, page["etag"], page["last_modified"], page["page_sha256"]
+    )
+
+
+def main() -> None:
+    """메인 실행 함수"""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    print("=== 기업 홈페이지 캐시 재검증 시작 ===")
+    result = revalidate(
+        older_than_days=int(os.getenv("WEBSITE_REVALIDATE_DAYS", "30")),
+        limit=int(os.getenv("WEBSITE_REVALIDATE_LIMIT", "200")),
+    )
+
+    print(
+        f"\n완료: {result['unchanged']}개 변경 없음, "
+        f"{result['refreshed']}개 재수집, {len(result['failed'])}개 실패"
+    )
+    for company_name, reason in result["failed"].items():
+        print(f"  실패 - {company_name}: {reason}")
+
+
+if __name__ == "__main__":
+    main()
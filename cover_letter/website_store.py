@@ -0,0 +1,133 @@
+"""기업 홈페이지(인재상·비전) 수집 캐시 — company_website 테이블.
+
+홈페이지 수집기(website_crawler)는 캐시가 유효하면 Firecrawl 검색을 건너뛰고,
+재검증 배치(website_revalidate)는 원본 페이지 검증값으로 캐시를 연장하거나 갱신한다.
+"""
+
+import hashlib
+
+
+def content_hash(data: dict) -> str:
+    """인재상·비전 본문의 sha256."""
+    text = f"{data.get('talent', '')}\n{data.get('vision', '')}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def save(conn, company_name: str, data: dict) -> bool:
+    """수집 결과 저장 (기존 행은 덮어씀).
+
+    출처 URL이 바뀌면 이전 페이지 검증값(ETag 등)은 지운다.
+
+    Args:
+        conn: psycopg2 Connection
+        company_name: 기업명
+        data: {"talent", "vision", "source_url"}
+
+    Returns:
+        내용이 새로 저장되거나 바뀌었으면 True
+    """
+    digest = content_hash(data)
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT content_sha256 FROM company_website WHERE company_name = %s",
+            (company_name,),
+        )
+        row = cur.fetchone()
+        cur.execute(
+            """
+            INSERT INTO company_website
+                (company_name, talent, vision, source_url, content_sha256,
+                 fetched_at, checked_at)
+            VALUES (%s, %s, %s, %s, %s, NOW(), NOW())
+            ON CONFLICT (company_name) DO UPDATE SET
+                talent         = EXCLUDED.talent,
+                vision         = EXCLUDED.vision,
+                source_url     = EXCLUDED.source_url,
+                content_sha256 = EXCLUDED.content_sha256,
+                etag           = CASE WHEN company_website.source_url
+                                           = EXCLUDED.source_url
+                                      THEN company_website.etag ELSE '' END,
+                last_modified  = CASE WHEN company_website.source_url
+                                           = EXCLUDED.source_url
+                                      THEN company_website.last_modified ELSE '' END,
+                page_sha256    = CASE WHEN company_website.source_url
+                                           = EXCLUDED.source_url
+                                      THEN company_website.page_sha256 ELSE '' END,
+                fetched_at     = CASE WHEN company_website.content_sha256
+                                           = EXCLUDED.content_sha256
+                                      THEN company_website.fetched_at ELSE NOW() END,
+                checked_at     = NOW()
+            """,
+            (
+                company_name,
+                data.get("talent", ""),
+                data.get("vision", ""),
+                data.get("source_url", ""),
+                digest,
+            ),
+        )
+    return row is None or row[0] != digest
+
+
+def load(conn, company_name: str, max_age_days: int) -> dict | None:
+    """유효한 캐시 {"talent", "vision", "source_url"}.
+
+    없거나 마지막 확인(checked_at)이 max_age_days보다 오래됐으면 None.
+    """
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT talent, vision, source_url
+            FROM company_website
+            WHERE company_name = %s
+              AND checked_at > NOW() - make_interval(days => %s)
+            """,
+            (company_name, max_age_days),
+        )
+        row = cur.fetchone()
+
+    if row is None or not row[0]:
+        return None
+    return {"talent": row[0], "vision": row[1], "source_url": row[2]}
+
+
+def due_for_check(conn, older_than_days: int, limit: int) -> list[dict]:
+    """마지막 확인이 older_than_days보다 오래된 행 (오래된 순).
+
+    Returns:
+        [{"company_name", "source_url", "etag", "last_modified", "page_sha256"}]
+    """
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT company_name, source_url, etag, last_modified, page_sha256
+            FROM company_website
+            WHERE checked_at <= NOW() - make_interval(days => %s)
+            ORDER BY checked_at
+            LIMIT %s
+            """,
+            (older_than_days, limit),
+        )
+        rows = cur.fetchall()
+
+    keys = ("company_name", "source_url", "etag", "last_modified", "page_sha256")
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def mark_checked(
+    conn,
+    company_name: str,
+    etag: str = "",
+    last_modified: str = "",
+    page_sha256: str = "",
+) -> None:
+    """재검증 결과 내용이 그대로임을 기록 (검증값 갱신 + checked_at 연장)."""
+    with conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE company_website
+            SET etag = %s, last_modified = %s, page_sha256 = %s, checked_at = NOW()
+            WHERE company_name = %s
+            """,
+            (etag, last_modified, page_sha256, company_name),
+        )
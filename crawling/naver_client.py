@@ -0,0 +1,262 @@
+"""
+Naver 검색 OpenAPI 공용 클라이언트
+
+일일 크롤러(NaverMCPCrawler)와 자소서 마법사(cover_letter naver_collector)가
+같은 클라이언트를 공유해 다음을 함께 쓴다.
+
+- 연결 풀: requests.Session (keep-alive)
+- 호출 속도 제한: 공용 토큰 버킷 rate_limiter "naver" (429 응답은 백오프 후 재시도,
+  NAVER_MAX_RETRIES 기본 2회)
+- 응답 캐시: 디스크 영속 response_cache, (query, display, start, sort) 키
+  유효 시간은 sort=date NAVER_CACHE_TTL_DATE_SECONDS (기본 300초),
+  sort=sim NAVER_CACHE_TTL_SIM_SECONDS (기본 3600초)
+- 호출량 집계: 날짜별 API 호출 수 / 캐시 적중 수 (usage())
+"""
+
+import logging
+import os
+import re
+import threading
+from datetime import date
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from crawling import rate_limiter, response_cache
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://openapi.naver.com/v1/search/news.json"
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_HTML_ENTITIES = {"&quot;": '"', "&amp;": "&", "&lt;": "<", "&gt;": ">"}
+
+
+def clean_html(text: str) -> str:
+    """HTML 태그 제거 + 주요 HTML 엔티티 변환"""
+    # <b>, </b> 등 HTML 태그 제거
+    clean = _HTML_TAG_RE.sub("", text)
+    for entity, char in _HTML_ENTITIES.items():
+        clean = clean.replace(entity, char)
+    return clean.strip()
+
+
+def clean_item(item: dict) -> dict[str, str]:
+    """검색 결과 1건을 title, link, description, pubDate만 남기고 정리"""
+    return {
+        "title": clean_html(item.get("title", "")),
+        "link": item.get("link", ""),
+        "description": clean_html(item.get("description", "")),
+        "pubDate": item.get("pubDate", ""),
+    }
+
+
+class NaverClient:
+    """연결 풀·속도 제한·응답 캐시를 갖춘 Naver 뉴스 검색 클라이언트"""
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        cache: Optional[response_cache.ResponseCache] = None,
+    ):
+        """
+        Args:
+            client_id: Naver OpenAPI Client ID
+            client_secret: Naver OpenAPI Client Secret
+            cache: 응답 캐시 (기본: 프로세스 공용 디스크 캐시)
+        """
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=16))
+        self._session.headers.update(
+            {
+                "X-Naver-Client-Id": client_id,
+                "X-Naver-Client-Secret": client_secret,
+            }
+        )
+
+        self._max_retries = int(os.getenv("NAVER_MAX_RETRIES", "2"))
+        self._usage_lock = threading.Lock()
+
+        self._cache = cache or response_cache.get_cache()
+        # 최신순 결과는 금방 바뀌고, 정확도순 결과는 오래 유지된다
+        self._cache_ttls = {
+            "date": float(os.getenv("NAVER_CACHE_TTL_DATE_SECONDS", "300")),
+            "sim": float(os.getenv("NAVER_CACHE_TTL_SIM_SECONDS", "3600")),
+        }
+
+        self._usage_date = date.today()
+        self._calls = 0
+        self._cache_hits = 0
+
+    def search_news(
+        self,
+        query: str,
+        display: int = 10,
+        start: int = 1,
+        sort: str = "date",
+    ) -> Any:
+        """
+        Naver 뉴스 검색 (원본 JSON)
+
+        Args:
+            query: 검색 키워드
+            display: 한 번에 표시할 검색 결과 개수 (최대 100)
+            start: 검색 시작 위치 (1부터 시작)
+            sort: 정렬 옵션 ('date': 날짜순, 'sim': 정확도순)
+
+        Returns:
+            검색 결과 딕셔너리
+
+        Raises:
+            ValueError: 잘못된 파라미터, 인증 실패, 호출 한도 초과
+            requests.exceptions.RequestException: API 호출 실패 시
+        """
+        if not query:
+            raise ValueError("검색 키워드는 필수입니다.")
+
+        if display < 1 or display > 100:
+            raise ValueError("display는 1~100 사이의 값이어야 합니다.")
+
+        if sort not in ["date", "sim"]:
+            raise ValueError("sort는 'date' 또는 'sim'이어야 합니다.")
+
+        params = {"query": query, "display": display, "start": start, "sort": sort}
+        cached = self._cache.get("naver", params)
+        if cached is not None:
+            self._count_call(cache_hit=True)
+            return cached
+
+        for attempt in range(self._max_retries + 1):
+            rate_limiter.acquire("naver")
+            self._count_call()
+            response = self._session.get(
+                BASE_URL,
+                params=params,
+                timeout=10,
+            )
+            if response.status_code != 429 or attempt == self._max_retries:
+                break
+            # 한도 초과: 공용 버킷을 비워 다른 호출자도 함께 늦춘 뒤 재시도
+            delay = rate_limiter.retry_delay(
+                attempt, response.headers.get("Retry-After")
+            )
+            logger.warning("Naver 429, %.1f초 후 재시도 (%d회)", delay, attempt + 1)
+            rate_limiter.penalize("naver", delay)
+
+        # 에러 상태 코드 체크
+        if response.status_code == 401:
+            raise ValueError(
+                "Naver OpenAPI 인증 실패. Client ID와 Secret을 확인하세요."
+            )
+        elif response.status_code == 429:
+            raise ValueError("API 호출 한도를 초과했습니다. 잠시 후 다시 시도하세요.")
+
+        response.raise_for_status()
+        data = response.json()
+        self._cache.put("naver", params, data, ttl=self._cache_ttls[sort])
+        return data
+
+    def crawl_news(
+        self,
+        query: str,
+        max_pages: int = 3,
+        display: int = 10,
+        sort: str = "date",
+    ) -> list[dict[str, str]]:
+        """
+        여러 페이지의 뉴스를 HTML 정리 후 반환. 페이지 오류 시 그때까지의 결과 반환.
+
+        Args:
+            query: 검색 키워드
+            max_pages: 조회할 최대 페이지 수
+            display: 페이지당 기사 수 (최대 100)
+            sort: 정렬 방식 ('date' 또는 'sim')
+
+        Returns:
+            뉴스 기사 목록 (title, link, description, pubDate 포함)
+        """
+        all_news: list[dict[str, str]] = []
+
+        for page in range(max_pages):
+            start = page * display + 1
+            try:
+                result = self.search_news(
+                    query=query, display=display, start=start, sort=sort
+                )
+            except Exception as e:
+                logger.warning("Naver 뉴스 %d페이지 조회 실패: %s", page + 1, e)
+                break
+
+            items = result.get("items", [])
+            if not items:
+                break
+            all_news.extend(clean_item(item) for item in items)
+            logger.info("Naver 뉴스 %d페이지: %d개 기사", page + 1, len(items))
+
+            if len(items) < display:
+                break
+
+        return all_news
+
+    def usage(self) -> dict[str, Any]:
+        """오늘의 API 호출 수와 캐시 적중 수"""
+        with self._usage_lock:
+            self._roll_usage_date()
+            return {
+                "date": self._usage_date.isoformat(),
+                "calls": self._calls,
+                "cache_hits": self._cache_hits,
+            }
+
+    def _count_call(self, cache_hit: bool = False) -> None:
+        with self._usage_lock:
+            self._roll_usage_date()
+            if cache_hit:
+                self._cache_hits += 1
+            else:
+                self._calls += 1
+
+    def _roll_usage_date(self) -> None:
+        today = date.today()
+        if today != self._usage_date:
+            self._usage_date = today
+            self._calls = 0
+            self._cache_hits = 0
+
+
+_clients: dict[tuple[str, str], NaverClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(
+    client_id: Optional[str] = None,
+    client_secret: Optional[str] = None,
+) -> NaverClient:
+    """
+    자격증명별 프로세스 공용 클라이언트
+
+    Raises:
+        ValueError: 자격증명이 없는 경우
+    """
+    client_id = client_id or os.getenv("NAVER_CLIENT_ID")
+    client_secret = client_secret or os.getenv("NAVER_CLIENT_SECRET")
+    if not client_id or not client_secret:
+        raise ValueError(
+            "Naver OpenAPI credentials are required. "
+            "Set NAVER_CLIENT_ID and NAVER_CLIENT_SECRET environment variables."
+        )
+
+    with _clients_lock:
+        client = _clients.get((client_id, client_secret))
+        if client is None:
+            client = NaverClient(client_id, client_secret)
+            _clients[(client_id, client_secret)] = client
+        return client
+
+
+def reset() -> None:
+    """공용 클라이언트 초기화 (테스트용)"""
+    with _clients_lock:
+        _clients.clear()
@@ -2,18 +2,20 @@
 Naver MCP 기반 뉴스 크롤링 모듈
 
 Naver OpenAPI를 사용하여 뉴스를 검색하고 크롤링합니다.
+API 호출은 연결 풀·속도 제한·응답 캐시를 갖춘 공용 클라이언트
+(crawling.naver_client)를 통해 이루어집니다.
 """
 
 import os
 from typing import Any, Optional
 
-import requests
+from crawling import naver_client
 
 
 class NaverMCPCrawler:
     """Naver OpenAPI를 사용한 뉴스 크롤러"""
 
-    BASE_URL = "https://openapi.naver.com/v1/search/news.json"
+    BASE_URL = naver_client.BASE_URL
 
     def __init__(
         self,
@@ -36,6 +38,8 @@ class NaverMCPCrawler:
                 "Set NAVER_CLIENT_ID and NAVER_CLIENT_SECRET environment variables."
             )
 
+        self._client = naver_client.get_client(self.client_id, self.client_secret)
+
     def search_news(
         self,
         query: str,
@@ -58,58 +62,9 @@ class NaverMCPCrawler:
         Raises:
             requests.exceptions.RequestException: API 호출 실패 시
         """
-        if not query:
-            raise ValueError("검색 키워드는 필수입니다.")
-
-        if display < 1 or display > 100:
-            raise ValueError("display는 1~100 사이의 값이어야 합니다.")
-
-        if sort not in ["date", "sim"]:
-            raise ValueError("sort는 'date' 또는 'sim'이어야 합니다.")
-
-        headers = {
-            "X-Naver-Client-Id": self.client_id,
-            "X-Naver-Client-Secret": self.client_secret,
-        }
-
-        params: dict[str, str | int] = {
-            "query": query,
-            "display": display,
-            "start": start,
-            "sort": sort,
-        }
-
-        try:
-            response = requests.get(
-                self.BASE_URL,
-                headers=headers,
-                params=params,
-                timeout=10,
-            )
-
-            # 에러 상태 코드 체크
-            if response.status_code == 401:
-                raise ValueError(
-                    "Naver OpenAPI 인증 실패. Client ID와 Secret을 확인하세요."
-                )
-            elif response.status_code == 429:
-                raise ValueError(
-                    "API 호출 한도를 초과했습니다. 잠시 후 다시 시도하세요."
-                )
-
-            response.raise_for_status()
-            return response.json()
-
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
-                raise ValueError(
-                    "Naver OpenAPI 인증 실패. Client ID와 Secret을 확인하세요."
-                ) from e
-            elif e.response.status_code == 429:
-                raise ValueError(
-                    "API 호출 한도를 초과했습니다. 잠시 후 다시 시도하세요."
-                ) from e
-            raise
+        return self._client.search_news(
+            query=query, display=display, start=start, sort=sort
+        )
 
     def crawl_news(
         self,
@@ -128,58 +83,14 @@ class NaverMCPCrawler:
         Returns:
             뉴스 기사 목록 (title, link, description, pubDate 포함)
         """
-        all_news = []
-
-        for page in range(max_pages):
-            start = page * 10 + 1
-            print(f"페이지 {page + 1} 크롤링 중... (start={start})")
-
-            try:
-                result = self.search_news(
-                    query=keyword,
-                    display=10,
-                    start=start,
-                    sort=sort,
-                )
-
-                items = result.get("items", [])
-                if not items:
-                    print(f"페이지 {page + 1}에서 더 이상 기사를 찾을 수 없습니다.")
-                    break
-
-                # HTML 태그 제거 및 데이터 정리
-                for item in items:
-                    cleaned_item = {
-                        "title": self._remove_html_tags(item.get("title", "")),
-                        "link": item.get("link", ""),
-                        "description": self._remove_html_tags(
-                            item.get("description", "")
-                        ),
-                        "pubDate": item.get("pubDate", ""),
-                    }
-                    all_news.append(cleaned_item)
-
-                print(f"페이지 {page + 1}: {len(items)}개 기사 수집 완료")
-
-            except Exception as e:
-                print(f"페이지 {page + 1} 크롤링 중 오류 발생: {e}")
-                break
-
-        return all_news
+        return self._client.crawl_news(
+            query=keyword, max_pages=max_pages, display=10, sort=sort
+        )
 
     @staticmethod
     def _remove_html_tags(text: str) -> str:
         """HTML 태그 제거"""
-        import re
-
-        # <b>, </b> 등 HTML 태그 제거
-        clean = re.sub(r"<[^>]+>", "", text)
-        # &quot;, &amp; 등 HTML 엔티티 변환
-        clean = clean.replace("&quot;", '"')
-        clean = clean.replace("&amp;", "&")
-        clean = clean.replace("&lt;", "<")
-        clean = clean.replace("&gt;", ">")
-        return clean.strip()
+        return naver_client.clean_html(text)
 
 
 def main():
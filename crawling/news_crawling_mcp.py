@@ -6,8 +6,9 @@ Naver OpenAPI를 사용하여 뉴스를 크롤링하고 PostgreSQL 데이터베
 
 import os
 
+from crawling import response_cache
 from crawling.naver_mcp_crawler import NaverMCPCrawler
-from db.db_news import create_new_news, get_connection
+from db.db_news import create_new_news, get_connection, save_news_articles
 
 
 def main():
@@ -59,6 +60,15 @@ def main():
                 print(f"저장 실패 - {news['title']}: {e}")
 
         print(f"\n저장 완료: {success_count}개 성공, {error_count}개 실패")
+
+        # 자소서 뉴스 수집이 먼저 조회하는 로컬 코퍼스 (키워드·발행일 색인)
+        save_news_articles(keyword, news_list)
+
+        for namespace, stats in response_cache.get_cache().stats().items():
+            print(
+                f"응답 캐시 [{namespace}]: 적중 {stats['hits']}회, "
+                f"미적중 {stats['misses']}회 (적중률 {stats['hit_rate']:.0%})"
+            )
         print("=== 크롤링 및 DB 저장 완료 ===")
 
     except ValueError as e:
@@ -0,0 +1,244 @@
+"""
+외부 API 공용 호출 속도 제한 (제공자별 토큰 버킷)
+
+Naver·Firecrawl·DART·Gemini 호출 전에 acquire(provider)로 토큰을 예약하고,
+토큰이 모자라면 실패하는 대신 다음 토큰이 생길 때까지 기다린다.
+429 응답을 받으면 penalize(provider, seconds)로 버킷을 비워
+같은 제공자를 쓰는 모든 호출자가 함께 속도를 늦춘다.
+
+버킷 상태 저장소 (RATE_LIMIT_BACKEND):
+- memory   (기본) 프로세스 내부
+- sqlite   같은 호스트의 여러 프로세스가 파일로 공유 (Redis 대용)
+           RATE_LIMIT_PATH, 기본 $TRENDOPS_CACHE_DIR/rate_limit.sqlite3
+- postgres 여러 호스트가 rate_limit_bucket 테이블로 공유 (POSTGRES_* 접속 정보)
+공유 저장소를 쓸 수 없으면 경고 후 memory로 대체한다.
+
+제공자별 설정: RATE_LIMIT_<PROVIDER>_PER_SECOND, RATE_LIMIT_<PROVIDER>_BURST
+(PER_SECOND가 0이면 제한 없음)
+"""
+
+import logging
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# provider → (초당 토큰, 버킷 크기)
+DEFAULT_LIMITS: dict[str, tuple[float, float]] = {
+    "naver": (10.0, 10.0),
+    "firecrawl": (1.0, 5.0),
+    "dart": (5.0, 10.0),
+    "gemini": (5.0, 10.0),
+}
+
+
+def _limit_for(provider: str) -> tuple[float, float]:
+    rate, burst = DEFAULT_LIMITS.get(provider, (0.0, 1.0))
+    prefix = f"RATE_LIMIT_{provider.upper()}"
+    rate = float(os.getenv(f"{prefix}_PER_SECOND", str(rate)))
+    burst = float(os.getenv(f"{prefix}_BURST", str(burst)))
+    return rate, max(burst, 1.0)
+
+
+class _MemoryStore:
+    """프로세스 내부 버킷 상태"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def reserve(self, provider: str, rate: float, burst: float, tokens: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            available, updated = self._buckets.get(provider, (burst, now))
+            available = min(burst, available + (now - updated) * rate) - tokens
+            self._buckets[provider] = (available, now)
+            return available
+
+
+class _SQLiteStore:
+    """같은 호스트의 프로세스 간 공유 버킷 (SQLite 파일 잠금)"""
+
+    def __init__(self, path: pathlib.Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, timeout=5, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rate_limit_bucket (
+                    provider    TEXT PRIMARY KEY,
+                    tokens      REAL NOT NULL,
+                    updated_at  REAL NOT NULL
+                )
+                """
+            )
+
+    def reserve(self, provider: str, rate: float, burst: float, tokens: float) -> float:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM rate_limit_bucket "
+                    "WHERE provider = ?",
+                    (provider,),
+                ).fetchone()
+                available, updated = row if row else (burst, now)
+                available = min(burst, available + (now - updated) * rate) - tokens
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_limit_bucket VALUES (?, ?, ?)",
+                    (provider, available, now),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return available
+
+
+class _PostgresStore:
+    """여러 호스트가 공유하는 버킷 (rate_limit_bucket 행 잠금, DB 시각 기준)"""
+
+    def __init__(self):
+        import psycopg2
+
+        self._conn = psycopg2.connect(
+            host=os.getenv("POSTGRES_HOST", "localhost"),
+            database=os.getenv("POSTGRES_DB", "postgres"),
+            user=os.getenv("POSTGRES_USER", "postgres"),
+            password=os.getenv("POSTGRES_PASSWORD", ""),
+            port=int(os.getenv("POSTGRES_PORT", "5432")),
+            connect_timeout=10,
+        )
+        self._conn.autocommit = True
+        self._lock = threading.Lock()
+
+    def reserve(self, provider: str, rate: float, burst: float, tokens: float) -> float:
+        with self._lock, self._conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO rate_limit_bucket (provider, tokens, updated_at)
+                VALUES (%(provider)s, %(burst)s - %(tokens)s, clock_timestamp())
+                ON CONFLICT (provider) DO UPDATE SET
+                    tokens = LEAST(
+                        %(burst)s,
+                        rate_limit_bucket.tokens + %(rate)s * EXTRACT(
+                            EPOCH FROM clock_timestamp() - rate_limit_bucket.updated_at
+                        )
+                    ) - %(tokens)s,
+                    updated_at = clock_timestamp()
+                RETURNING tokens
+                """,
+                {"provider": provider, "rate": rate, "burst": burst, "tokens": tokens},
+            )
+            return float(cur.fetchone()[0])
+
+
+class RateLimiter:
+    """제공자별 토큰 버킷 (예약 방식: 토큰을 먼저 차감하고 부족분만큼 대기)"""
+
+    def __init__(self, store=None):
+        self._store = store or _MemoryStore()
+        self._fallback: Optional[_MemoryStore] = None
+
+    def acquire(self, provider: str, tokens: float = 1.0) -> float:
+        """
+        토큰 예약 후 필요한 만큼 대기
+
+        Returns:
+            대기한 시간(초)
+        """
+        rate, burst = _limit_for(provider)
+        if rate <= 0:
+            return 0.0
+        available = self._reserve(provider, rate, burst, tokens)
+        wait = max(0.0, -available / rate)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, provider: str, seconds: float) -> None:
+        """429 등 한도 초과 신호: seconds 동안 해당 제공자의 새 호출을 막는다"""
+        rate, burst = _limit_for(provider)
+        if rate > 0 and seconds > 0:
+            self._reserve(provider, rate, burst, seconds * rate)
+
+    def _reserve(self, provider: str, rate: float, burst: float, tokens: float):
+        if self._fallback is None:
+            try:
+                return self._store.reserve(provider, rate, burst, tokens)
+            except Exception:
+                logger.warning(
+                    "공유 속도 제한 저장소 사용 불가, 프로세스 내부로 대체",
+                    exc_info=True,
+                )
+                self._fallback = _MemoryStore()
+        return self._fallback.reserve(provider, rate, burst, tokens)
+
+
+def retry_delay(attempt: int, retry_after: object = None) -> float:
+    """재시도 대기 시간: Retry-After(초)가 있으면 그 값, 없으면 지수 백오프"""
+    try:
+        return max(float(retry_after), 0.0)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        base = float(os.getenv("RATE_LIMIT_RETRY_BASE_SECONDS", "1"))
+        return min(base * (2**attempt), 30.0)
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> RateLimiter:
+    """프로세스 공용 속도 제한기 (RATE_LIMIT_BACKEND에 따라 저장소 선택)"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter(_make_store())
+        return _limiter
+
+
+def _make_store():
+    backend = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+    try:
+        if backend == "sqlite":
+            path = os.getenv("RATE_LIMIT_PATH")
+            if not path:
+                base = os.getenv("TRENDOPS_CACHE_DIR") or (
+                    pathlib.Path.home() / ".cache/trendops"
+                )
+                path = str(pathlib.Path(base) / "rate_limit.sqlite3")
+            return _SQLiteStore(pathlib.Path(path))
+        if backend == "postgres":
+            return _PostgresStore()
+    except Exception:
+        logger.warning(
+            "속도 제한 저장소(%s) 초기화 실패, 프로세스 내부로 대체",
+            backend,
+            exc_info=True,
+        )
+    return _MemoryStore()
+
+
+def acquire(provider: str, tokens: float = 1.0) -> float:
+    """공용 속도 제한기로 토큰 예약 후 대기. 대기한 시간(초) 반환"""
+    return get_limiter().acquire(provider, tokens)
+
+
+def penalize(provider: str, seconds: float) -> None:
+    """공용 속도 제한기에 한도 초과 신호 전달"""
+    get_limiter().penalize(provider, seconds)
+
+
+def reset() -> None:
+    """공용 속도 제한기 초기화 (테스트용)"""
+    global _limiter
+    with _limiter_lock:
+        _limiter = None
@@ -0,0 +1,153 @@
+"""
+외부 검색 API 응답 캐시 (SQLite 디스크 영속)
+
+Naver 뉴스 검색과 Firecrawl 검색 응답을 정규화된 요청 파라미터로 키잉해
+프로세스 재시작·Streamlit 재실행 사이에도 재사용한다.
+유효 시간은 호출하는 쪽이 정한다 (예: Naver sort=date는 짧게, sort=sim은 길게).
+
+- 위치: RESPONSE_CACHE_PATH (기본 $TRENDOPS_CACHE_DIR/response_cache.sqlite3,
+  TRENDOPS_CACHE_DIR 기본 ~/.cache/trendops)
+- 적중률: stats() — 네임스페이스별 hits / misses / hit_rate (프로세스 단위)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_params(params: dict[str, Any]) -> str:
+    """요청 파라미터를 키 문자열로 정규화 (문자열은 공백 정리 + 소문자, 키 정렬)"""
+    normalized = {
+        key: " ".join(value.split()).casefold() if isinstance(value, str) else value
+        for key, value in params.items()
+    }
+    return json.dumps(normalized, ensure_ascii=False, sort_keys=True)
+
+
+def default_path() -> pathlib.Path:
+    path = os.getenv("RESPONSE_CACHE_PATH")
+    if path:
+        return pathlib.Path(path)
+    base = os.getenv("TRENDOPS_CACHE_DIR") or pathlib.Path.home() / ".cache/trendops"
+    return pathlib.Path(base) / "response_cache.sqlite3"
+
+
+class ResponseCache:
+    """네임스페이스 + 정규화 파라미터 → JSON 응답 (만료 시각 포함)"""
+
+    def __init__(self, path: Optional[pathlib.Path | str] = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:"면 메모리 전용)
+        """
+        path = str(path or default_path())
+        if path != ":memory:":
+            pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, int]] = {}
+        with self._lock, self._conn:
+            # 여러 프로세스(앱·크롤러)가 같은 파일을 써도 읽기가 막히지 않도록 WAL
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS response_cache (
+                    key         TEXT PRIMARY KEY,
+                    namespace   TEXT NOT NULL,
+                    value       TEXT NOT NULL,
+                    expires_at  REAL NOT NULL
+                )
+                """
+            )
+
+    def get(self, namespace: str, params: dict[str, Any]) -> Any:
+        """유효한 캐시 응답. 없거나 만료됐으면 None"""
+        key = self._key(namespace, params)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            hit = row is not None and row[1] > time.time()
+            counts = self._stats.setdefault(namespace, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += 1
+        return json.loads(row[0]) if hit else None
+
+    def put(
+        self, namespace: str, params: dict[str, Any], value: Any, ttl: float
+    ) -> None:
+        """응답 저장 (ttl초 후 만료). ttl이 0 이하면 저장하지 않음"""
+        if ttl <= 0:
+            return
+        key = self._key(namespace, params)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    namespace,
+                    json.dumps(value, ensure_ascii=False),
+                    time.time() + ttl,
+                ),
+            )
+
+    def purge_expired(self) -> int:
+        """만료된 응답 삭제. 삭제한 행 수 반환"""
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "DELETE FROM response_cache WHERE expires_at <= ?", (time.time(),)
+            )
+            return cur.rowcount
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """네임스페이스별 적중 통계 {namespace: {hits, misses, hit_rate}}"""
+        with self._lock:
+            return {
+                namespace: {
+                    **counts,
+                    "hit_rate": round(
+                        counts["hits"] / max(counts["hits"] + counts["misses"], 1), 4
+                    ),
+                }
+                for namespace, counts in self._stats.items()
+            }
+
+    @staticmethod
+    def _key(namespace: str, params: dict[str, Any]) -> str:
+        digest = hashlib.sha256(normalize_params(params).encode("utf-8")).hexdigest()
+        return f"{namespace}:{digest}"
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache:
+    """프로세스 공용 캐시. 디스크 파일을 열 수 없으면 메모리 캐시로 대체"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = ResponseCache()
+                # 프로세스 시작 시 한 번 만료 항목 정리
+                _cache.purge_expired()
+            except (OSError, sqlite3.Error):
+                logger.warning(
+                    "응답 캐시 파일 사용 불가, 메모리 캐시 사용", exc_info=True
+                )
+                _cache = ResponseCache(":memory:")
+        return _cache
+
+
+def reset() -> None:
+    """공용 캐시 초기화 (테스트용)"""
+    global _cache
+    with _cache_lock:
+        _cache = None
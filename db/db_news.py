@@ -95,6 +95,63 @@ def create_new_news(title: str, url: str):
             conn.close()
 
 
+def save_news_articles(keyword: str, news_list: list[dict]) -> int:
+    """
+    Save crawled articles to the news_article corpus (duplicate links ignored)
+
+    Returns:
+        Number of articles submitted
+    """
+    from email.utils import parsedate_to_datetime
+
+    from psycopg2.extras import execute_values
+
+    rows = []
+    for news in news_list:
+        if not news.get("link"):
+            continue
+        try:
+            pub_date = parsedate_to_datetime(news.get("pubDate", ""))
+        except (TypeError, ValueError):
+            pub_date = None
+        rows.append(
+            (
+                keyword,
+                news.get("title", ""),
+                news.get("description", ""),
+                news["link"],
+                pub_date,
+            )
+        )
+    if not rows:
+        return 0
+
+    conn = None
+    try:
+        conn = get_connection()
+        cur = conn.cursor()
+
+        execute_values(
+            cur,
+            "INSERT INTO news_article (keyword, title, description, link, pub_date) "
+            "VALUES %s ON CONFLICT (link) DO NOTHING;",
+            rows,
+            template="(%s, %s, %s, %s, COALESCE(%s, NOW()))",
+        )
+
+        conn.commit()
+        print(f"Saved {len(rows)} articles to news_article (keyword: {keyword}).")
+        cur.close()
+        return len(rows)
+
+    except Exception as e:
+        print(f"Failed to save news articles: {e}")
+        return 0
+    finally:
+        if conn:
+            conn.close()
+
+
 def get_news(news_id: int):
     """
     Retrieve news information by ID
@@ -0,0 +1,14 @@
+-- Migration 003: company_analysis 소스별 신선도 추적
+-- 날짜: 2026-10-19
+-- 분석 만료 시 TTL이 지난 소스(dart/website/news)만 재수집하고,
+-- 내용 해시가 바뀐 경우에만 LLM 요약을 다시 만든다.
+
+-- source_state 구조 (요약에 사용한 소스별 입력, 원문은 source_document에 보관):
+-- {
+--   "dart":    {"hash": "<sha256>", "fetched_at": "<ISO8601>", "status": "ok"},
+--   "website": {...},
+--   "news":    {...}
+-- }
+-- status: "ok" | "timeout" (원문 없이 시간 초과 → 다음 요청에서 재수집)
+ALTER TABLE company_analysis
+    ADD COLUMN IF NOT EXISTS source_state JSONB NOT NULL DEFAULT '{}';
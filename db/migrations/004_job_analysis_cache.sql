@@ -0,0 +1,15 @@
+-- Migration 004: job_analysis 캐시 조회용 정규화 직무명 + 기업 컨텍스트 해시
+-- 날짜: 2026-10-19
+-- "백엔드 개발자" / "백엔드개발자" 처럼 표기만 다른 직무명을 같은 캐시로 취급하고,
+-- 기업 개요·업계 동향이 바뀌면(context_hash 불일치) 직무 분석을 다시 만든다.
+
+ALTER TABLE job_analysis
+    ADD COLUMN IF NOT EXISTS job_title_key VARCHAR(200)
+        GENERATED ALWAYS AS (lower(regexp_replace(job_title, '\s+', '', 'g'))) STORED;
+
+ALTER TABLE job_analysis
+    ADD COLUMN IF NOT EXISTS context_hash VARCHAR(64);
+    -- sha256(overview + industry_trends) — 분석 당시 기업 컨텍스트
+
+CREATE INDEX IF NOT EXISTS idx_job_analysis_title_key
+    ON job_analysis(company_analysis_id, job_title_key);
@@ -0,0 +1,21 @@
+-- Migration 005: 수집 원본 저장소
+-- 날짜: 2026-10-19
+-- DART·뉴스·홈페이지 수집 payload를 요약과 별개로 보관해
+-- 프롬프트 변경 시 외부 API 재호출 없이 재요약(백필)할 수 있게 한다.
+
+CREATE TABLE IF NOT EXISTS source_document (
+    id              BIGSERIAL PRIMARY KEY,
+    company_name    VARCHAR(200) NOT NULL,
+    source          VARCHAR(20) NOT NULL,
+    -- 'dart' | 'news' | 'website'
+    url             TEXT DEFAULT '',
+    content         BYTEA NOT NULL,
+    -- zlib 압축된 JSON payload
+    content_sha256  CHAR(64) NOT NULL,
+    -- 압축 전 JSON의 sha256 (같은 내용 재수집 시 fetched_at만 갱신)
+    fetched_at      TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE (company_name, source, content_sha256)
+);
+
+CREATE INDEX IF NOT EXISTS idx_source_document_latest
+    ON source_document(company_name, source, fetched_at DESC);
@@ -0,0 +1,23 @@
+-- Migration 006: DART 사업보고서 일괄 적재
+-- 날짜: 2026-10-19
+-- 오프라인 일괄 수집(python -m cover_letter.dart_bulk)으로 기업코드별 최신
+-- 사업보고서 주요 섹션을 미리 적재한다. 행 자체가 진행 상황이므로
+-- 중단 후 다시 실행하면 최근 적재된 기업코드는 건너뛴다.
+
+CREATE TABLE IF NOT EXISTS dart_report (
+    corp_code           VARCHAR(8) PRIMARY KEY,
+    corp_name           VARCHAR(200) DEFAULT '',
+    status              VARCHAR(20) NOT NULL,
+    -- 'ok' | 'no_report' | 'failed'
+    rcept_no            VARCHAR(20) DEFAULT '',
+    report_nm           VARCHAR(200) DEFAULT '',
+    rcept_dt            VARCHAR(8) DEFAULT '',
+    products            TEXT DEFAULT '',
+    market_conditions   TEXT DEFAULT '',
+    r_and_d             TEXT DEFAULT '',
+    error               TEXT DEFAULT '',
+    fetched_at          TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_dart_report_status
+    ON dart_report(status, fetched_at);
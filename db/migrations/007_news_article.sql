@@ -0,0 +1,25 @@
+-- Migration 007: 뉴스 기사 로컬 코퍼스
+-- 날짜: 2026-10-19
+-- 일일 크롤러와 자소서 뉴스 수집 결과를 키워드(기업명)·발행일 기준으로 저장해
+-- collect_news가 Naver/Firecrawl 호출 전에 최근 기사를 로컬에서 먼저 찾는다.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE TABLE IF NOT EXISTS news_article (
+    id              BIGSERIAL PRIMARY KEY,
+    keyword         VARCHAR(200) NOT NULL,
+    -- 수집 검색어 (자소서 수집은 DART 기준 기업명)
+    title           TEXT NOT NULL,
+    description     TEXT DEFAULT '',
+    link            TEXT NOT NULL UNIQUE,
+    pub_date        TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    -- 발행일을 알 수 없으면 수집 시각
+    collected_at    TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_news_article_keyword_date
+    ON news_article(keyword, pub_date DESC);
+
+-- 키워드가 다르게 수집된 기사도 제목의 기업명으로 찾기 위한 트라이그램 인덱스
+CREATE INDEX IF NOT EXISTS idx_news_article_title_trgm
+    ON news_article USING GIN (title gin_trgm_ops);
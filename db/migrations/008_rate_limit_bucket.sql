@@ -0,0 +1,11 @@
+-- Migration 008: 외부 API 공용 속도 제한 버킷
+-- 날짜: 2026-10-19
+-- RATE_LIMIT_BACKEND=postgres일 때 여러 호스트(앱·크롤러·스케줄러)가
+-- 제공자별(naver, firecrawl, dart, gemini) 토큰 버킷 상태를 공유한다.
+
+CREATE TABLE IF NOT EXISTS rate_limit_bucket (
+    provider    VARCHAR(40) PRIMARY KEY,
+    tokens      DOUBLE PRECISION NOT NULL,
+    -- 음수면 이미 예약된 토큰 (다음 호출은 그만큼 대기)
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
+);
@@ -0,0 +1,24 @@
+-- Migration 009: 기업 홈페이지(인재상·비전) 수집 캐시
+-- 날짜: 2026-10-19
+-- 인재상·기업문화 페이지는 거의 바뀌지 않으므로 Firecrawl 검색 결과를 기업별로
+-- 오래 보관한다. 재검증 배치(python -m cover_letter.website_revalidate)가
+-- 원본 페이지의 ETag·Last-Modified·본문 해시로 변경 여부만 싸게 확인하고,
+-- 바뀐 경우에만 Firecrawl로 다시 수집한다.
+
+CREATE TABLE IF NOT EXISTS company_website (
+    company_name    VARCHAR(200) PRIMARY KEY,
+    talent          TEXT NOT NULL DEFAULT '',
+    vision          TEXT NOT NULL DEFAULT '',
+    source_url      TEXT NOT NULL DEFAULT '',
+    content_sha256  CHAR(64) NOT NULL,
+    -- 원본 페이지 검증값 (재검증 배치가 기록)
+    etag            TEXT NOT NULL DEFAULT '',
+    last_modified   TEXT NOT NULL DEFAULT '',
+    page_sha256     VARCHAR(64) NOT NULL DEFAULT '',
+    fetched_at      TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    -- 마지막으로 내용이 유효하다고 확인된 시각 (수집 또는 재검증)
+    checked_at      TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_company_website_checked_at
+    ON company_website(checked_at);
@@ -0,0 +1,13 @@
+-- Migration 010: JD 요구 역량 추출 캐시 (본문 해시 기준)
+-- 날짜: 2026-10-19
+-- 같은 채용공고를 다른 사용자·세션이 다시 수집해도 LLM 역량 추출을 반복하지 않도록
+-- 정규화한 JD 본문의 sha256(jd_service.content_hash)으로 추출 결과를 보관한다.
+-- 프롬프트(jd_competencies)가 바뀌면 prompt_sha256이 달라져 다시 추출한다.
+
+CREATE TABLE IF NOT EXISTS jd_competency_cache (
+    content_sha256          VARCHAR(64) PRIMARY KEY,
+    prompt_sha256           VARCHAR(64) NOT NULL,
+    required_competencies   TEXT[] NOT NULL DEFAULT '{}',
+    created_at              TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_used_at            TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -3,6 +3,7 @@
 import streamlit as st
 
 from cover_letter import (
+    company_resolver,
     company_service,
     generation_service,
     jd_service,
@@ -221,6 +222,23 @@ def render_step1() -> None:
     company_name = col1.text_input("기업명", placeholder="예: 카카오, 당근마켓")
     job_title = col2.text_input("지원 직무", placeholder="예: 백엔드 개발자")
 
+    # DART 등록 기업명 제안 (입력값과 다른 후보가 있을 때만)
+    if company_name:
+        suggestions = [
+            c.display_name
+            for c in company_resolver.resolve(company_name, limit=5)
+            if c.display_name != company_name
+        ]
+        if suggestions:
+            company_name = st.selectbox(
+                "DART 등록 기업명",
+                [company_name, *dict.fromkeys(suggestions)],
+                format_func=lambda n, typed=company_name: (
+                    f"{n} (입력값 그대로)" if n == typed else n
+                ),
+                key="company_name_choice",
+            )
+
     if st.button(
         "🔍 기업·직무 분석 시작",
         type="primary",
@@ -252,6 +270,7 @@ def render_step1() -> None:
                 "success": bool(jd_result.get("success")),
                 "reason": jd_result.get("error_reason", ""),
             }
+            st.session_state["jd_alternates"] = jd_result.get("alternates", [])
             if jd_result.get("success") and jd_result.get("text"):
                 jd_service.save_jd(job_analysis["id"], jd_result)
                 st.session_state["jd_data"] = jd_service.load_jd(job_analysis["id"])
@@ -265,6 +284,7 @@ def render_step1() -> None:
         source_status = company_analysis.get("source_status", {}) or {}
         source_labels = {
             "dart": "DART 사업보고서",
+            "news": "뉴스",
             "website": "인재상/기업문화",
         }
         for key, label in source_labels.items():
@@ -290,6 +310,13 @@ def _render_company_job_editor(ca: dict, ja: dict) -> None:
     st.divider()
     st.subheader(f"📊 {ca['company_name']} 분석 결과")
 
+    # 캐시 히트 시 백그라운드에서 갱신된 뉴스 반영
+    # (ca는 single-flight로 다른 세션과 공유될 수 있으므로 복사본을 바꾼다)
+    refreshed_news = company_service.get_refreshed_news(ca["id"])
+    if refreshed_news is not None and refreshed_news != ca.get("news_summary"):
+        ca = {**ca, "news_summary": refreshed_news}
+        st.session_state["company_analysis"] = ca
+
     with st.expander("기업 개요", expanded=True):
         overview = st.text_area(
             "기업 개요", value=ca.get("overview", ""), height=100, key="ca_overview"
@@ -309,6 +336,10 @@ def _render_company_job_editor(ca: dict, ja: dict) -> None:
         dart = st.text_area(
             "DART 요약", value=ca.get("dart_summary", ""), height=80, key="ca_dart"
         )
+    with st.expander("최근 뉴스"):
+        if company_service.is_news_refreshing(ca["id"]):
+            st.caption("🔄 최신 뉴스를 백그라운드에서 갱신 중입니다.")
+        st.text(ca.get("news_summary") or "수집된 뉴스가 없습니다.")
     with st.expander("직무 분석"):
         responsibilities = st.text_area(
             "주요 업무", value=ja.get("responsibilities", ""), height=80, key="ja_resp"
@@ -344,6 +375,21 @@ def _render_company_job_editor(ca: dict, ja: dict) -> None:
                 height=150,
                 key="jd_raw",
             )
+            alternates = st.session_state.get("jd_alternates") or []
+            if alternates:
+                st.caption("다른 JD 후보 — 자동 선택이 엉뚱하면 교체하세요.")
+            for i, alt in enumerate(alternates):
+                label = alt.get("title") or alt.get("source_url") or f"후보 {i + 1}"
+                if st.button(
+                    f"🔁 {label} (점수 {alt.get('score', 0):.2f})", key=f"jd_alt_{i}"
+                ):
+                    jd_service.select_candidate(ja["id"], alt)
+                    # 선택한 후보는 목록에서 뺀다
+                    st.session_state["jd_alternates"] = [
+                        a for j, a in enumerate(alternates) if j != i
+                    ]
+                    st.session_state["jd_data"] = jd_service.load_jd(ja["id"])
+                    st.rerun()
         else:
             st.info("JD 자동 수집에 실패했습니다. 직접 입력하거나 생략할 수 있습니다.")
             jd_status = st.session_state.get("jd_collect_status") or {}
@@ -37,6 +37,14 @@ def main() -> None:
     try:
         apply_migration(conn, "/app/db/migrations/001_cover_letter_schema.sql")
         apply_migration(conn, "/app/db/migrations/002_add_jd_entity.sql")
+        apply_migration(conn, "/app/db/migrations/003_company_source_state.sql")
+        apply_migration(conn, "/app/db/migrations/004_job_analysis_cache.sql")
+        apply_migration(conn, "/app/db/migrations/005_source_document.sql")
+        apply_migration(conn, "/app/db/migrations/006_dart_report.sql")
+        apply_migration(conn, "/app/db/migrations/007_news_article.sql")
+        apply_migration(conn, "/app/db/migrations/008_rate_limit_bucket.sql")
+        apply_migration(conn, "/app/db/migrations/009_company_website.sql")
+        apply_migration(conn, "/app/db/migrations/010_jd_competency_cache.sql")
     finally:
         conn.close()
 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
-뉴스 크롤링을 주기적으로 실행하는 스케줄러입니다.
+뉴스 크롤링, 기업 분석 사전 적재(pre-warm), 기업 홈페이지 캐시 재검증을
+주기적으로 실행하는 스케줄러입니다.
 """
 
 import logging
@@ -19,6 +20,14 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# cover_letter 패키지는 import 시 이 키들이 없으면 바로 실패한다
+_COVER_LETTER_KEYS = ("GEMINI_API_KEY", "DART_API_KEY", "FIRECRAWL_API_KEY")
+
+
+def _missing_cover_letter_keys() -> list[str]:
+    """cover_letter 작업 실행에 필요한데 설정되지 않은 API 키 목록."""
+    return [key for key in _COVER_LETTER_KEYS if not os.getenv(key)]
+
 
 def run_crawler():
     """크롤러를 실행합니다."""
@@ -43,6 +52,52 @@ def run_crawler():
         logger.error(f"Error running crawler: {e}")
 
 
+def run_prewarm():
+    """주요 기업 분석 캐시를 사전 적재합니다."""
+    try:
+        logger.info("Starting company prewarm...")
+        result = subprocess.run(
+            ["python", "-m", "cover_letter.prewarm"],
+            cwd="/app",
+            capture_output=True,
+            text=True,
+            timeout=6 * 3600,  # 6시간 타임아웃 (중단 시 다음 실행에서 이어서 진행)
+        )
+
+        if result.returncode == 0:
+            logger.info(f"Prewarm completed successfully: {result.stdout}")
+        else:
+            logger.error(f"Prewarm failed with error: {result.stderr}")
+
+    except subprocess.TimeoutExpired:
+        logger.error("Prewarm timed out after 6 hours")
+    except Exception as e:
+        logger.error(f"Error running prewarm: {e}")
+
+
+def run_website_revalidate():
+    """확인 주기가 지난 기업 홈페이지 캐시를 재검증합니다."""
+    try:
+        logger.info("Starting website cache revalidation...")
+        result = subprocess.run(
+            ["python", "-m", "cover_letter.website_revalidate"],
+            cwd="/app",
+            capture_output=True,
+            text=True,
+            timeout=3600,  # 1시간 타임아웃
+        )
+
+        if result.returncode == 0:
+            logger.info(f"Website revalidation completed: {result.stdout}")
+        else:
+            logger.error(f"Website revalidation failed with error: {result.stderr}")
+
+    except subprocess.TimeoutExpired:
+        logger.error("Website revalidation timed out after 1 hour")
+    except Exception as e:
+        logger.error(f"Error running website revalidation: {e}")
+
+
 def main():
     """메인 스케줄러 함수"""
     # 환경 변수에서 스케줄 설정 가져오기
@@ -53,6 +108,31 @@ def main():
     # 매일 지정된 시간에 크롤러 실행
     schedule.every().day.at(schedule_time).do(run_crawler)
 
+    # 기업 목록 파일이 지정된 경우에만 사전 적재 실행
+    if os.getenv("PREWARM_COMPANIES_FILE"):
+        prewarm_time = os.getenv("PREWARM_SCHEDULE", "04:00")
+        logger.info(f"Will run company prewarm daily at {prewarm_time}")
+        schedule.every().day.at(prewarm_time).do(run_prewarm)
+
+    # 기업 홈페이지 캐시 재검증 (확인 주기가 지난 기업만 조건부 요청)
+    # WEBSITE_REVALIDATE_ENABLED=true이고 cover_letter API 키가 있을 때만 실행
+    if os.getenv("WEBSITE_REVALIDATE_ENABLED", "false").lower() == "true":
+        missing = _missing_cover_letter_keys()
+        if missing:
+            logger.warning(
+                f"Skipping website cache revalidation: missing {', '.join(missing)}"
+            )
+        else:
+            revalidate_time = os.getenv("WEBSITE_REVALIDATE_SCHEDULE", "03:00")
+            logger.info(
+                f"Will run website cache revalidation daily at {revalidate_time}"
+            )
+            schedule.every().day.at(revalidate_time).do(run_website_revalidate)
+    else:
+        logger.info(
+            "Website cache revalidation disabled (WEBSITE_REVALIDATE_ENABLED=false)"
+        )
+
     # 즉시 한 번 실행 (선택적)
     if os.getenv("RUN_ON_START", "false").lower() == "true":
         logger.info("Running crawler immediately on startup...")
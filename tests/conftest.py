@@ -0,0 +1,35 @@
+"""공용 pytest 설정 — 테스트가 실제 디스크 캐시를 건드리지 않도록 격리."""
+
+import sys
+
+import pytest
+
+# 응답 캐시를 붙잡고 있는 프로세스 공용 싱글턴 (import된 경우에만 초기화)
+_SINGLETON_MODULES = (
+    "crawling.response_cache",
+    "crawling.naver_client",
+    "crawling.rate_limiter",
+    "cover_letter.collectors.firecrawl_client",
+)
+
+
+def _reset_singletons() -> None:
+    for name in _SINGLETON_MODULES:
+        module = sys.modules.get(name)
+        if module is not None:
+            module.reset()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """응답 캐시·속도 제한 파일을 테스트별 임시 디렉터리로 돌린다.
+
+    가짜 응답이 ~/.cache/trendops의 실제 캐시에 저장돼 사용자에게 제공되는 것을 막는다.
+    """
+    cache_dir = tmp_path / "trendops-cache"
+    monkeypatch.setenv("TRENDOPS_CACHE_DIR", str(cache_dir))
+    monkeypatch.setenv("RESPONSE_CACHE_PATH", str(cache_dir / "response_cache.sqlite3"))
+    monkeypatch.setenv("RATE_LIMIT_PATH", str(cache_dir / "rate_limit.sqlite3"))
+    _reset_singletons()
+    yield
+    _reset_singletons()
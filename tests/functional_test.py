@@ -22,7 +22,7 @@ def test_basic_functionality():
     print("1. 기본 기능 테스트 (Mock 데이터 사용)")
     print("=" * 60)
 
-    with patch("crawling.naver_mcp_crawler.requests.get") as mock_get:
+    with patch("crawling.naver_client.requests.Session.get") as mock_get:
         # Mock 응답 설정
         mock_response = Mock()
         mock_response.status_code = 200
@@ -111,7 +111,7 @@ def test_multi_page_crawling():
     print("3. 다중 페이지 크롤링 테스트")
     print("=" * 60)
 
-    with patch("crawling.naver_mcp_crawler.requests.get") as mock_get:
+    with patch("crawling.naver_client.requests.Session.get") as mock_get:
 
         def mock_response_side_effect(*args, **kwargs):
             start = kwargs["params"]["start"]
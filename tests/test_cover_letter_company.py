@@ -1,12 +1,18 @@
 """company_service, collectors 단위 테스트."""
 
 import json
+import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from cover_letter.collectors import dart_collector, naver_collector, website_crawler
+from cover_letter.collectors import (
+    dart_collector,
+    firecrawl_client,
+    naver_collector,
+    website_crawler,
+)
 
 
 # ============================================================
@@ -30,10 +36,300 @@ class TestDartCollector:
         assert result == {}
 
 
+# ============================================================
+# DART 기업코드 인덱스 테스트
+# ============================================================
+class TestDartCorpIndex:
+    @pytest.fixture(autouse=True)
+    def _isolated_cache(self, tmp_path, monkeypatch):
+        from cover_letter.collectors import dart_corp_index
+
+        monkeypatch.setenv("TRENDOPS_CACHE_DIR", str(tmp_path))
+        dart_corp_index.reset()
+        yield
+        dart_corp_index.reset()
+
+    @staticmethod
+    def _records():
+        from cover_letter.collectors.dart_corp_index import CorpRecord
+
+        return [
+            CorpRecord("00000001", "카카오", ""),
+            CorpRecord("00258801", "(주)카카오", "035720"),
+            CorpRecord("00000002", "카카오뱅크", "323410"),
+        ]
+
+    def test_normalize_strips_corporate_suffixes(self):
+        from cover_letter.collectors.dart_corp_index import normalize_corp_name
+
+        assert normalize_corp_name("(주)카카오") == "카카오"
+        assert normalize_corp_name("주식회사 카카오") == "카카오"
+        assert normalize_corp_name("㈜ LG 화학") == "lg화학"
+
+    def test_downloads_once_then_serves_from_memory_and_disk(self):
+        from cover_letter.collectors import dart_corp_index
+
+        with patch.object(
+            dart_corp_index, "_download_corp_codes", return_value=self._records()
+        ) as mock_download:
+            first = dart_corp_index.get_index()
+            second = dart_corp_index.get_index()
+            assert first is second
+
+            # 새 프로세스: 디스크 캐시에서 로드, 재다운로드 없음
+            dart_corp_index.reset()
+            reloaded = dart_corp_index.get_index()
+
+        mock_download.assert_called_once()
+        assert dart_corp_index.cache_path().exists()
+        assert len(reloaded) == 3
+        assert reloaded.records == self._records()
+
+    def test_stale_index_is_rebuilt_and_kept_on_download_failure(self):
+        from cover_letter.collectors import dart_corp_index
+
+        path = dart_corp_index.cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        built_at = datetime.now(timezone.utc) - timedelta(days=2)
+        path.write_text(
+            json.dumps(
+                {
+                    "built_at": built_at.isoformat(),
+                    "corps": [{"corp_code": "1", "corp_name": "카카오"}],
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        with patch.object(
+            dart_corp_index, "_download_corp_codes", side_effect=OSError("네트워크")
+        ):
+            index = dart_corp_index.get_index()
+        assert [r.corp_code for r in index.records] == ["1"]
+
+        dart_corp_index.reset()
+        with patch.object(
+            dart_corp_index, "_download_corp_codes", return_value=self._records()
+        ):
+            index = dart_corp_index.get_index()
+        assert len(index) == 3
+
+    def test_no_index_and_download_failure_raises(self):
+        from cover_letter.collectors import dart_corp_index
+
+        with patch.object(
+            dart_corp_index, "_download_corp_codes", side_effect=OSError("네트워크")
+        ):
+            with pytest.raises(RuntimeError):
+                dart_corp_index.get_index()
+
+
+# ============================================================
+# 기업명 해석기(company_resolver) 테스트
+# ============================================================
+class TestCompanyResolver:
+    @staticmethod
+    def _resolver(aliases=None):
+        from cover_letter.collectors.dart_corp_index import CorpRecord
+        from cover_letter.company_resolver import CompanyResolver
+
+        return CompanyResolver(
+            [
+                CorpRecord("001", "카카오", "035720", "Kakao Corp."),
+                CorpRecord("002", "카카오뱅크", "323410", "KakaoBank Corp."),
+                CorpRecord("003", "카카오모빌리티", "", "Kakao Mobility Corp."),
+                CorpRecord("004", "(주)카카오게임즈", "293490"),
+                CorpRecord("005", "NAVER", "035420", "NAVER Corp."),
+                CorpRecord(
+                    "006", "삼성전자", "005930", "Samsung Electronics Co., Ltd."
+                ),
+            ],
+            aliases=aliases,
+        )
+
+    def test_exact_match_on_korean_english_and_alias(self):
+        resolver = self._resolver(aliases={"네이버": "NAVER"})
+
+        assert resolver.resolve("(주)카카오")[0].corp_code == "001"
+        assert resolver.resolve("Kakao Corp")[0].corp_code == "001"
+        assert resolver.resolve("samsung electronics")[0].corp_code == "006"
+        top = resolver.resolve("네이버")[0]
+        assert (top.corp_code, top.matched_on, top.score) == ("005", "exact", 1.0)
+
+    def test_prefix_ranks_parent_before_subsidiaries(self):
+        ranked = self._resolver().resolve("카카오", limit=5)
+
+        assert [c.corp_code for c in ranked][:1] == ["001"]
+        assert {c.corp_code for c in ranked} == {"001", "002", "003", "004"}
+        # 접두사 후보끼리는 상장사 우선
+        assert ranked[-1].corp_code == "003"
+
+    def test_trigram_tolerates_spacing_and_typos(self):
+        resolver = self._resolver()
+
+        assert resolver.resolve("카카오 게임즈")[0].corp_code == "004"
+        typo = resolver.resolve("카카오뱅그")
+        assert typo and typo[0].corp_code == "002"
+        assert typo[0].matched_on in {"prefix", "trigram"}
+        assert resolver.resolve("전혀다른회사") == []
+
+    def test_display_name_strips_corporate_marker(self):
+        top = self._resolver().resolve("카카오게임즈")[0]
+
+        assert top.display_name == "카카오게임즈"
+
+    def test_canonical_name_without_index_returns_input(self, tmp_path, monkeypatch):
+        from cover_letter import company_resolver
+        from cover_letter.collectors import dart_corp_index
+
+        monkeypatch.setenv("TRENDOPS_CACHE_DIR", str(tmp_path))
+        dart_corp_index.reset()
+        company_resolver.reset()
+
+        assert company_resolver.resolve("카카오") == []
+        assert company_resolver.canonical_name("kakao") == "kakao"
+
+    def test_canonical_name_uses_exact_match_only(self):
+        from cover_letter import company_resolver
+
+        with patch.object(
+            company_resolver, "get_resolver", return_value=self._resolver()
+        ):
+            assert company_resolver.canonical_name("Kakao Corp.") == "카카오"
+            assert company_resolver.canonical_name("카카오뱅") == "카카오뱅"
+
+    def test_dart_collector_uses_resolver_top_candidate(self, tmp_path, monkeypatch):
+        import sys
+        import types
+
+        from cover_letter import company_resolver
+
+        fake_dart = types.ModuleType("dart_fss")
+        fake_dart.set_api_key = MagicMock()
+        fake_dart.api = MagicMock(spec=["filings"])
+        fake_dart.api.filings = MagicMock(spec=["search_filings"])
+        fake_dart.api.filings.search_filings.return_value = {
+            "list": [{"rcept_no": "2026", "report_nm": "사업보고서", "rcept_dt": ""}]
+        }
+        monkeypatch.setitem(sys.modules, "dart_fss", fake_dart)
+        monkeypatch.setenv("DART_API_KEY", "test-key")
+        monkeypatch.setenv("TRENDOPS_CACHE_DIR", str(tmp_path))
+
+        with patch.object(
+            company_resolver, "get_resolver", return_value=self._resolver()
+        ):
+            ok = dart_collector.collect_dart_reports_with_status("kakao corp")
+            missing = dart_collector.collect_dart_reports_with_status("전혀다른회사")
+
+        assert ok["success"] is True
+        kwargs = fake_dart.api.filings.search_filings.call_args.kwargs
+        assert kwargs["corp_code"] == "001"
+        assert missing["success"] is False
+        assert "기업코드 미발견" in missing["reason"]
+
+
+# ============================================================
+# DART 공시·본문 캐시 테스트
+# ============================================================
+class TestDartFilingCache:
+    @pytest.fixture(autouse=True)
+    def _isolated_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TRENDOPS_CACHE_DIR", str(tmp_path))
+
+    @staticmethod
+    def _fake_dart(rcept_dt):
+        dart = MagicMock()
+        dart.api.filings = MagicMock(spec=["search_filings"])
+        dart.api.filings.search_filings.return_value = {
+            "list": [
+                {"rcept_no": "R1", "report_nm": "사업보고서", "rcept_dt": rcept_dt}
+            ]
+        }
+        dart.api.document.get_document.return_value = {
+            "list": [
+                {"title": "II. 사업의 내용", "sub_docs": [{"text_content": "개요"}]},
+                {
+                    "title": "2. 주요 제품 및 서비스",
+                    "sub_docs": [{"text_content": "메신저"}],
+                },
+                {"title": "4. 시장현황", "sub_docs": [{"text_content": "점유율"}]},
+                {"title": "6. 연구개발", "sub_docs": [{"text_content": "AI"}]},
+            ]
+        }
+        return dart
+
+    def test_document_fetched_once_for_all_sections_and_reused(self):
+        recent = datetime.now().strftime("%Y%m%d")
+        dart = self._fake_dart(recent)
+
+        first = dart_collector.collect_by_corp_code(dart, "001", 3)
+        second = dart_collector.collect_by_corp_code(dart, "001", 3)
+
+        assert first["data"] == {
+            "products": "메신저",
+            "market_conditions": "점유율",
+            "r_and_d": "AI",
+        }
+        assert second == first
+        dart.api.document.get_document.assert_called_once_with("R1")
+        dart.api.filings.search_filings.assert_called_once()
+
+    def test_old_annual_report_triggers_filing_recheck(self):
+        from cover_letter.collectors import dart_filing_cache
+
+        old = (datetime.now() - timedelta(days=400)).strftime("%Y%m%d")
+        recent = datetime.now().strftime("%Y%m%d")
+        dart_filing_cache.save_latest_filing(
+            "001", {"rcept_no": "R0", "report_nm": "사업보고서", "rcept_dt": recent}
+        )
+        assert dart_filing_cache.load_latest_filing("001")["rcept_no"] == "R0"
+
+        dart_filing_cache.save_latest_filing(
+            "002", {"rcept_no": "R0", "report_nm": "사업보고서", "rcept_dt": old}
+        )
+        # 하루 안에는 재조회하지 않음
+        assert dart_filing_cache.load_latest_filing("002") is not None
+
+        # 이틀 뒤: 400일 지난 사업보고서만 새 보고서 확인 대상
+        with patch.object(dart_filing_cache, "datetime") as fake_datetime:
+            fake_datetime.now.return_value = datetime.now(timezone.utc) + timedelta(
+                days=2
+            )
+            fake_datetime.fromisoformat = datetime.fromisoformat
+            fake_datetime.strptime = datetime.strptime
+            assert dart_filing_cache.load_latest_filing("002") is None
+            assert dart_filing_cache.load_latest_filing("001") is not None
+
+    def test_missing_document_api_returns_no_sections_uncached(self):
+        from cover_letter.collectors import dart_filing_cache
+
+        dart = self._fake_dart(datetime.now().strftime("%Y%m%d"))
+        dart.api = MagicMock(spec=["filings"])
+        dart.api.filings = MagicMock(spec=["search_filings"])
+        dart.api.filings.search_filings.return_value = {
+            "list": [{"rcept_no": "R1", "report_nm": "사업보고서", "rcept_dt": ""}]
+        }
+
+        result = dart_collector.collect_by_corp_code(dart, "001", 3)
+
+        assert result["success"] is True
+        assert result["data"] == {}
+        assert result["filing"]["rcept_no"] == "R1"
+        assert dart_filing_cache.load_sections("R1") is None
+
+
 # ============================================================
 # naver_collector 테스트
 # ============================================================
 class TestNaverCollector:
+    @pytest.fixture(autouse=True)
+    def _fresh_history(self, monkeypatch):
+        # 로컬 코퍼스 조회는 별도 테스트에서만 (DB 연결 방지)
+        monkeypatch.setattr(naver_collector, "_LOCAL_FIRST", False)
+        naver_collector.reset()
+        yield
+        naver_collector.reset()
+
     def test_returns_empty_list_when_no_credentials(self, monkeypatch):
         monkeypatch.delenv("NAVER_CLIENT_ID", raising=False)
         monkeypatch.delenv("NAVER_CLIENT_SECRET", raising=False)
@@ -100,14 +396,259 @@ class TestNaverCollector:
         mock_firecrawl.assert_not_called()
         assert result == []
 
+    def test_fetch_naver_news_uses_shared_client(self, monkeypatch):
+        from crawling import naver_client
+
+        client = MagicMock()
+        client.crawl_news.return_value = [{"title": "뉴스", "link": "http://a.com"}]
+        with patch.object(naver_client, "get_client", return_value=client):
+            result = naver_collector._fetch_naver_news("카카오", display=10)
+
+        assert result == [{"title": "뉴스", "link": "http://a.com"}]
+        client.crawl_news.assert_called_once_with(
+            "카카오", max_pages=1, display=10, sort="date"
+        )
+
+    def test_local_corpus_serves_without_external_calls(self, monkeypatch):
+        monkeypatch.setattr(naver_collector, "_LOCAL_FIRST", True)
+        local = self._articles("l", 5)
+
+        with (
+            patch.object(naver_collector, "_search_local", return_value=local),
+            patch.object(naver_collector, "_fetch_naver_news") as mock_naver,
+            patch.object(naver_collector, "_fetch_firecrawl") as mock_firecrawl,
+        ):
+            result = naver_collector.collect_news("카카오")
+
+        assert result == local
+        mock_naver.assert_not_called()
+        mock_firecrawl.assert_not_called()
+
+    def test_thin_local_corpus_fetches_and_stores_remote(self, monkeypatch):
+        monkeypatch.setattr(naver_collector, "_LOCAL_FIRST", True)
+        monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
+        remote = self._articles("n", 5)
+
+        with (
+            patch.object(
+                naver_collector,
+                "_search_local",
+                return_value=self._articles("l", 2) + [remote[0]],
+            ) as mock_local,
+            patch.object(naver_collector, "_fetch_naver_news", return_value=remote),
+            patch.object(naver_collector, "_save_local") as mock_save,
+        ):
+            result = naver_collector.collect_news("카카오", "백엔드 개발자")
+
+        mock_local.assert_called_once_with("카카오", "백엔드 개발자")
+        mock_save.assert_called_once_with("카카오", remote)
+        assert [a["link"] for a in result] == ["n0", "n1", "n2", "n3", "n4", "l0", "l1"]
+
+    def test_refresh_skips_local_corpus_and_stores_remote(self, monkeypatch):
+        monkeypatch.setattr(naver_collector, "_LOCAL_FIRST", True)
+        monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
+        remote = self._articles("n", 5)
+
+        with (
+            patch.object(
+                naver_collector, "_search_local", return_value=self._articles("l", 5)
+            ) as mock_local,
+            patch.object(naver_collector, "_fetch_naver_news", return_value=remote),
+            patch.object(naver_collector, "_save_local") as mock_save,
+        ):
+            result = naver_collector.collect_news("카카오", local_first=False)
+
+        mock_local.assert_not_called()
+        mock_save.assert_called_once_with("카카오", remote)
+        assert result == remote
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service.naver_collector.collect_news")
+    def test_background_refresh_fetches_remote_only(self, mock_collect, mock_conn):
+        from cover_letter import company_service
+
+        mock_collect.return_value = []
+
+        assert company_service._refresh_news(1, "카카오") is None
+
+        mock_collect.assert_called_once_with("카카오", "", local_first=False)
+        # 외부에서 받은 기사가 없으면 news_updated_at을 건드리지 않는다
+        mock_conn.assert_not_called()
+
+    def test_firecrawl_results_are_cached(self, tmp_path, monkeypatch):
+        from crawling import response_cache
+
+        monkeypatch.setenv("RESPONSE_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        response_cache.reset()
+        firecrawl_client.reset()
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"data": [{"title": "뉴스", "url": "http://a"}]}
+
+        with patch("requests.Session.post", return_value=response) as mock_post:
+            first = naver_collector._fetch_firecrawl("카카오", "key")
+            second = naver_collector._fetch_firecrawl(" 카카오", "key")
+        response_cache.reset()
+        firecrawl_client.reset()
+
+        assert first == second
+        assert first[0]["link"] == "http://a"
+        mock_post.assert_called_once()
+
+    @staticmethod
+    def _articles(prefix, n):
+        return [
+            {
+                "title": f"{prefix}{i}",
+                "description": "",
+                "pubDate": "",
+                "link": f"{prefix}{i}",
+            }
+            for i in range(n)
+        ]
+
+    def test_hedges_firecrawl_when_naver_is_slow(self, monkeypatch):
+        monkeypatch.setenv("FIRECRAWL_API_KEY", "test_key")
+
+        def _slow_naver(query, display=10):
+            time.sleep(0.3)
+            return self._articles("n", 2)
+
+        with (
+            patch.object(naver_collector, "_HEDGE_DELAY", 0.05),
+            patch.object(naver_collector, "_fetch_naver_news", side_effect=_slow_naver),
+            patch.object(
+                naver_collector, "_fetch_firecrawl", return_value=self._articles("f", 3)
+            ) as mock_firecrawl,
+        ):
+            started = time.monotonic()
+            result = naver_collector.collect_news("카카오")
+            elapsed = time.monotonic() - started
+
+        mock_firecrawl.assert_called_once()
+        assert [a["link"] for a in result] == ["f0", "f1", "f2", "n0", "n1"]
+        assert elapsed < 0.6  # 순차 실행이 아니라 겹쳐서 실행
+
+    def test_thin_history_launches_firecrawl_immediately(self, monkeypatch):
+        monkeypatch.setenv("FIRECRAWL_API_KEY", "test_key")
+        launched_before_naver = []
+
+        def _naver(query, display=10):
+            time.sleep(0.1)
+            launched_before_naver.append(mock_firecrawl.called)
+            return self._articles("n", 1)
+
+        with (
+            patch.object(naver_collector, "_HEDGE_DELAY", 5.0),
+            patch.object(naver_collector, "_fetch_naver_news", side_effect=_naver),
+            patch.object(
+                naver_collector, "_fetch_firecrawl", return_value=self._articles("f", 1)
+            ) as mock_firecrawl,
+        ):
+            naver_collector.collect_news("소규모기업")  # 이력: 1건
+            naver_collector.collect_news("소규모기업")
+
+        assert launched_before_naver == [False, True]
+        assert mock_firecrawl.call_count == 2
+
+    def test_deadline_returns_articles_collected_so_far(self, monkeypatch):
+        monkeypatch.setenv("FIRECRAWL_API_KEY", "test_key")
+
+        def _hanging_firecrawl(query, api_key):
+            time.sleep(1.0)
+            return self._articles("f", 5)
+
+        with (
+            patch.object(naver_collector, "_DEADLINE", 0.2),
+            patch.object(
+                naver_collector,
+                "_fetch_naver_news",
+                return_value=self._articles("n", 2),
+            ),
+            patch.object(
+                naver_collector, "_fetch_firecrawl", side_effect=_hanging_firecrawl
+            ),
+        ):
+            started = time.monotonic()
+            result = naver_collector.collect_news("카카오")
+
+        assert time.monotonic() - started < 0.5
+        assert [a["link"] for a in result] == ["n0", "n1"]
+
+
+# ============================================================
+# 뉴스 코퍼스 저장소 테스트
+# ============================================================
+class TestNewsStore:
+    def test_parse_pub_date_accepts_naver_and_iso_formats(self):
+        from cover_letter import date_utils
+
+        naver = date_utils.parse_pub_date("Mon, 09 Feb 2026 10:00:00 +0900")
+        iso = date_utils.parse_pub_date("2026-02-09T01:00:00Z")
+
+        assert naver == iso
+        assert date_utils.parse_pub_date("") is None
+        assert date_utils.parse_pub_date("어제") is None
+
+    def test_search_filters_by_company_and_job_title(self):
+        from cover_letter import news_store
+
+        conn = MagicMock()
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchall.return_value = [
+            (
+                "카카오 백엔드 채용",
+                "",
+                "http://a.com",
+                datetime(2026, 2, 9, tzinfo=timezone.utc),
+            )
+        ]
+
+        result = news_store.search(conn, "카카오", "백엔드", max_age_days=7)
+
+        sql, params = cur.execute.call_args.args
+        assert "job_pattern" in sql
+        assert params["company_pattern"] == "%카카오%"
+        assert params["job_pattern"] == "%백엔드%"
+        assert result == [
+            {
+                "title": "카카오 백엔드 채용",
+                "description": "",
+                "pubDate": "Mon, 09 Feb 2026 00:00:00 +0000",
+                "link": "http://a.com",
+            }
+        ]
+
+    def test_save_skips_articles_without_link(self):
+        from cover_letter import news_store
+
+        conn = MagicMock()
+        with patch.object(news_store, "execute_values") as mock_execute:
+            saved = news_store.save(
+                conn,
+                "카카오",
+                [
+                    {"title": "a", "link": "http://a.com", "pubDate": ""},
+                    {"title": "b", "link": ""},
+                ],
+            )
+
+        assert saved == 1
+        rows = mock_execute.call_args.args[2]
+        assert [row[3] for row in rows] == ["http://a.com"]
+
 
 # ============================================================
 # website_crawler 테스트
 # ============================================================
 class TestWebsiteCrawler:
+    @pytest.fixture(autouse=True)
+    def _no_cache(self, monkeypatch):
+        monkeypatch.setattr(website_crawler, "_CACHE_ENABLED", False)
+
     def test_returns_none_when_no_naver_credentials(self, monkeypatch):
         monkeypatch.delenv("NAVER_CLIENT_ID", raising=False)
         monkeypatch.delenv("NAVER_CLIENT_SECRET", raising=False)
+        monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
         result = website_crawler.crawl_company_website("카카오")
         assert result is None
 
@@ -141,16 +682,258 @@ class TestWebsiteCrawler:
         assert result is not None
         assert "talent" in result
 
+    @patch("cover_letter.collectors.website_crawler.firecrawl_client.get_client")
+    def test_joins_result_texts_with_first_url(self, mock_get_client):
+        mock_get_client.return_value.search.return_value = [
+            firecrawl_client.SearchResult(url="", description=" "),
+            firecrawl_client.SearchResult(url="https://a", content="인재상"),
+            firecrawl_client.SearchResult(url="https://b", description="핵심가치"),
+        ]
+
+        result = website_crawler.crawl_company_website("카카오")
+
+        assert result == {
+            "talent": "인재상\n\n핵심가치",
+            "vision": "",
+            "source_url": "https://a",
+        }
+
+    def test_cache_hit_skips_firecrawl(self, monkeypatch):
+        monkeypatch.setattr(website_crawler, "_CACHE_ENABLED", True)
+        cached = {"talent": "인재상", "vision": "", "source_url": "https://a"}
+        with (
+            patch.object(website_crawler, "_load_cached", return_value=cached),
+            patch.object(website_crawler, "search_company_website") as mock_search,
+        ):
+            result = website_crawler.crawl_company_website_with_status("카카오")
+
+        assert result == {"success": True, "data": cached, "reason": ""}
+        mock_search.assert_not_called()
+
+    def test_cache_miss_saves_successful_search(self, monkeypatch):
+        monkeypatch.setattr(website_crawler, "_CACHE_ENABLED", True)
+        fetched = {
+            "success": True,
+            "data": {"talent": "인재상", "vision": "", "source_url": "https://a"},
+            "reason": "",
+        }
+        with (
+            patch.object(website_crawler, "_load_cached", return_value=None),
+            patch.object(
+                website_crawler, "search_company_website", return_value=fetched
+            ),
+            patch.object(website_crawler, "_save_cached") as mock_save,
+        ):
+            result = website_crawler.crawl_company_website_with_status("카카오")
+
+        assert result == fetched
+        mock_save.assert_called_once_with("카카오", fetched["data"])
+
+
+class TestWebsiteStore:
+    def test_save_reports_whether_content_changed(self):
+        from cover_letter import website_store
+
+        data = {"talent": "인재상", "vision": "", "source_url": "https://a"}
+        conn = MagicMock()
+        cur = conn.cursor.return_value.__enter__.return_value
+
+        cur.fetchone.return_value = None
+        assert website_store.save(conn, "카카오", data) is True
+        cur.fetchone.return_value = (website_store.content_hash(data),)
+        assert website_store.save(conn, "카카오", data) is False
+
+    def test_load_ignores_empty_talent(self):
+        from cover_letter import website_store
+
+        conn = MagicMock()
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchone.return_value = ("", "", "https://a")
+
+        assert website_store.load(conn, "카카오", 365) is None
+
+
+class TestWebsiteRevalidate:
+    @staticmethod
+    def _row(**overrides):
+        return {
+            "company_name": "카카오",
+            "source_url": "https://a",
+            "etag": '"v1"',
+            "last_modified": "",
+            "page_sha256": "old",
+            **overrides,
+        }
+
+    def _run(self, rows, page=None, search=None):
+        from cover_letter import website_revalidate
+
+        with (
+            patch.object(website_revalidate, "_get_conn"),
+            patch.object(
+                website_revalidate.website_store, "due_for_check", return_value=rows
+            ),
+            patch.object(website_revalidate.website_store, "mark_checked") as checked,
+            patch.object(website_revalidate.website_store, "save") as saved,
+            patch.object(website_revalidate, "probe", return_value=page) as probe,
+            patch.object(
+                website_revalidate.website_crawler,
+                "search_company_website",
+                return_value=search,
+            ) as searched,
+        ):
+            result = website_revalidate.revalidate()
+        return result, probe, checked, saved, searched
+
+    def test_not_modified_extends_without_firecrawl(self):
+        page = {"status": 304, "etag": '"v1"', "last_modified": "", "page_sha256": ""}
+
+        result, probe, checked, saved, searched = self._run([self._row()], page)
+
+        probe.assert_called_once_with("https://a", '"v1"', "")
+        assert checked.call_args.args[1:] == ("카카오", '"v1"', "", "old")
+        searched.assert_not_called()
+        assert result["unchanged"] == 1
+
+    def test_changed_page_refetches_and_saves(self):
+        page = {
+            "status": 200,
+            "etag": '"v2"',
+            "last_modified": "",
+            "page_sha256": "new",
+        }
+        data = {"talent": "새 인재상", "vision": "", "source_url": "https://a"}
+        search = {"success": True, "data": data, "reason": ""}
+
+        result, _, checked, saved, searched = self._run([self._row()], page, search)
+
+        searched.assert_called_once_with("카카오")
+        assert saved.call_args.args[1:] == ("카카오", data)
+        assert checked.call_args.args[1:] == ("카카오", '"v2"', "", "new")
+        assert result["refreshed"] == 1
+
+    def test_first_check_records_baseline(self):
+        page = {"status": 200, "etag": "", "last_modified": "", "page_sha256": "h"}
+
+        result, _, checked, _, searched = self._run([self._row(page_sha256="")], page)
+
+        assert checked.call_args.args[1:] == ("카카오", "", "", "h")
+        searched.assert_not_called()
+        assert result["unchanged"] == 1
+
+    def test_probe_failure_is_retried_later(self):
+        import requests
+
+        from cover_letter import website_revalidate
+
+        with (
+            patch.object(website_revalidate, "_get_conn"),
+            patch.object(
+                website_revalidate.website_store,
+                "due_for_check",
+                return_value=[self._row()],
+            ),
+            patch.object(website_revalidate.website_store, "mark_checked") as checked,
+            patch.object(
+                website_revalidate,
+                "probe",
+                side_effect=requests.exceptions.ConnectionError("down"),
+            ),
+        ):
+            result = website_revalidate.revalidate()
+
+        checked.assert_not_called()
+        assert list(result["failed"]) == ["카카오"]
+
+
+# ============================================================
+# firecrawl_client 테스트
+# ============================================================
+class TestFirecrawlClient:
+    @pytest.fixture(autouse=True)
+    def _fresh(self, tmp_path, monkeypatch):
+        from crawling import rate_limiter, response_cache
+
+        monkeypatch.setenv("RESPONSE_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        monkeypatch.setenv("RATE_LIMIT_FIRECRAWL_PER_SECOND", "1000")
+        monkeypatch.setenv("RATE_LIMIT_RETRY_BASE_SECONDS", "0.01")
+        for module in (firecrawl_client, response_cache, rate_limiter):
+            module.reset()
+        yield
+        for module in (firecrawl_client, response_cache, rate_limiter):
+            module.reset()
+
+    def test_normalizes_response_shapes(self):
+        entry = {"url": "https://a", "title": "t", "markdown": "본문"}
+        page = MagicMock(spec=["model_dump"])
+        page.model_dump.return_value = {"metadata": {"sourceURL": "https://b"}}
+        grouped = MagicMock(web=[page], news=[])
+
+        assert firecrawl_client.normalize_items({"data": [entry]}) == [
+            firecrawl_client.SearchResult(url="https://a", title="t", content="본문")
+        ]
+        assert firecrawl_client.normalize_items({"data": {"web": [entry]}})[0].url == (
+            "https://a"
+        )
+        assert firecrawl_client.normalize_items(grouped)[0].url == "https://b"
+        assert firecrawl_client.normalize_items(None) == []
+
+    def test_shares_client_and_session_per_key(self, monkeypatch):
+        monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
+
+        assert firecrawl_client.get_client("k") is firecrawl_client.get_client("k")
+        with pytest.raises(ValueError):
+            firecrawl_client.get_client()
+
+    def test_retries_once_after_429_and_caches(self):
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "0"})
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {"data": [{"url": "https://a", "description": "d"}]}
+        client = firecrawl_client.get_client("k")
+
+        with patch("requests.Session.post", side_effect=[throttled, ok]) as mock_post:
+            first = client.search("카카오 인재상", limit=3)
+            second = client.search("카카오  인재상", limit=3)
+
+        assert (
+            first
+            == second
+            == [firecrawl_client.SearchResult(url="https://a", description="d")]
+        )
+        assert mock_post.call_count == 2
+
 
 # ============================================================
 # get_or_analyze_company 테스트
 # ============================================================
 class TestGetOrAnalyzeCompany:
+    @pytest.fixture(autouse=True)
+    def _no_refreshes(self):
+        from cover_letter import company_service
+
+        company_service._news_refreshes.clear()
+        company_service._refreshed_news.clear()
+        yield
+        company_service._news_refreshes.clear()
+        company_service._refreshed_news.clear()
+
+    @staticmethod
+    def _wait_refreshed(company_analysis_id: int) -> None:
+        from cover_letter import company_service
+
+        deadline = time.monotonic() + 5
+        while company_service.is_news_refreshing(company_analysis_id):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
     @patch("cover_letter.company_service._get_conn")
     @patch("cover_letter.company_service._full_analysis")
     def test_cache_miss_calls_full_analysis(self, mock_full, mock_conn):
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = None
+        mock_cursor.fetchone.side_effect = [
+            None,  # company_analysis 조회 → 없음
+            (True,),  # advisory lock 획득
+        ]
         mock_cursor.__enter__ = MagicMock(return_value=mock_cursor)
         mock_cursor.__exit__ = MagicMock(return_value=False)
         mock_c = MagicMock()
@@ -168,12 +951,8 @@ class TestGetOrAnalyzeCompany:
         mock_full.assert_called_once()
         assert result["company_name"] == "카카오"
 
-    @patch("cover_letter.company_service._get_conn")
-    @patch("cover_letter.company_service._summarize_news")
-    def test_cache_hit_refreshes_news(self, mock_news, mock_conn):
-        # analyzed_at이 오늘 (캐시 히트)
-        recent = datetime.now(timezone.utc)
-
+    @staticmethod
+    def _cached_conn(analyzed_at, news_updated_at):
         mock_cursor = MagicMock()
         mock_cursor.fetchone.return_value = (
             1,
@@ -184,7 +963,9 @@ class TestGetOrAnalyzeCompany:
             "특장점",
             "뉴스",
             "DART요약",
-            recent,
+            analyzed_at,
+            {},
+            news_updated_at,
             {},
         )
         mock_cursor.__enter__ = MagicMock(return_value=mock_cursor)
@@ -193,15 +974,56 @@ class TestGetOrAnalyzeCompany:
         mock_c.__enter__ = MagicMock(return_value=mock_c)
         mock_c.__exit__ = MagicMock(return_value=False)
         mock_c.cursor.return_value = mock_cursor
-        mock_conn.return_value = mock_c
+        return mock_c
 
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service._summarize_news")
+    def test_cache_hit_serves_cached_and_refreshes_news_in_background(
+        self, mock_news, mock_conn
+    ):
+        # analyzed_at은 오늘 (캐시 히트), 뉴스는 하루 전 (갱신 대상)
+        now = datetime.now(timezone.utc)
+        mock_conn.return_value = self._cached_conn(now, now - timedelta(days=1))
         mock_news.return_value = "새 뉴스"
 
         from cover_letter import company_service
 
         result = company_service.get_or_analyze_company("카카오")
 
-        assert result["news_summary"] == "새 뉴스"
+        # 응답은 캐시된 뉴스로 즉시 반환
+        assert result["news_summary"] == "뉴스"
+
+        self._wait_refreshed(1)
+        assert company_service.get_refreshed_news(1) == "새 뉴스"
+        # 결과를 소비하지 않으므로 다른 세션도 같은 결과를 받는다
+        assert company_service.get_refreshed_news(1) == "새 뉴스"
+        # 완료된 갱신은 진행 중 목록에서 빠진다
+        assert 1 not in company_service._news_refreshes
+        mock_news.assert_called_once_with("카카오", "")
+
+    def test_refreshed_news_expires(self, monkeypatch):
+        from cover_letter import company_service
+
+        monkeypatch.setattr(company_service, "_NEWS_FRESH_MINUTES", 1)
+        finished_at = time.monotonic() - 61
+        company_service._refreshed_news[1] = ("새 뉴스", finished_at)
+
+        assert company_service.get_refreshed_news(1) is None
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service._summarize_news")
+    def test_cache_hit_with_fresh_news_skips_refresh(self, mock_news, mock_conn):
+        now = datetime.now(timezone.utc)
+        mock_conn.return_value = self._cached_conn(now, now)
+
+        from cover_letter import company_service
+
+        result = company_service.get_or_analyze_company("카카오")
+
+        assert result["news_summary"] == "뉴스"
+        assert not company_service.is_news_refreshing(1)
+        assert company_service.get_refreshed_news(1) is None
+        mock_news.assert_not_called()
 
     @patch("cover_letter.company_service._get_conn")
     @patch("cover_letter.company_service._full_analysis")
@@ -221,6 +1043,8 @@ class TestGetOrAnalyzeCompany:
             "DART요약",
             old,
             {},
+            old,
+            {},
         )
         mock_cursor.__enter__ = MagicMock(return_value=mock_cursor)
         mock_cursor.__exit__ = MagicMock(return_value=False)
@@ -271,6 +1095,7 @@ class TestGetOrAnalyzeCompany:
         mock_cursor = MagicMock()
         mock_cursor.fetchone.side_effect = [
             None,  # company_analysis 조회 → 없음
+            (True,),  # advisory lock 획득
             (1, datetime.now(timezone.utc)),  # INSERT RETURNING
         ]
         mock_cursor.__enter__ = MagicMock(return_value=mock_cursor)
@@ -287,3 +1112,852 @@ class TestGetOrAnalyzeCompany:
 
         assert result is not None
         mock_llm.assert_called_once()
+
+
+# ============================================================
+# 소스별 TTL + 부분 재분석 테스트
+# ============================================================
+class TestPartialReanalysis:
+    @staticmethod
+    def _state(now, news_hash):
+        from cover_letter import company_service
+
+        fresh = now.isoformat()
+        stale = (now - timedelta(days=30)).isoformat()
+        return {
+            "dart": {
+                "hash": company_service._content_hash("DART 원문"),
+                "fetched_at": fresh,
+                "status": "ok",
+            },
+            "website": {
+                "hash": company_service._content_hash("인재상 원문"),
+                "fetched_at": fresh,
+                "status": "ok",
+            },
+            "news": {"hash": news_hash, "fetched_at": stale, "status": "ok"},
+        }
+
+    @staticmethod
+    def _conn(row, *returning):
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.side_effect = [row, (True,), *returning]
+        mock_cursor.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_cursor.__exit__ = MagicMock(return_value=False)
+        mock_c = MagicMock()
+        mock_c.__enter__ = MagicMock(return_value=mock_c)
+        mock_c.__exit__ = MagicMock(return_value=False)
+        mock_c.cursor.return_value = mock_cursor
+        return mock_c
+
+    @staticmethod
+    def _row(analyzed_at, state):
+        return (
+            1,
+            "카카오",
+            "개요",
+            "문화",
+            "동향",
+            "특장점",
+            "옛 뉴스",
+            "DART요약",
+            analyzed_at,
+            {},
+            analyzed_at,
+            state,
+        )
+
+    def test_stale_sources_uses_per_source_ttl(self):
+        from cover_letter import company_service
+
+        now = datetime.now(timezone.utc)
+        state = self._state(now, "x")
+
+        assert company_service._stale_sources(None) == ("dart", "news", "website")
+        assert company_service._stale_sources({"source_state": state}) == ("news",)
+        assert company_service._stale_sources({"source_state": {}}) == (
+            "dart",
+            "news",
+            "website",
+        )
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service.source_store.load_latest")
+    @patch("cover_letter.company_service._collect_sources")
+    @patch("cover_letter.company_service.llm_client.call")
+    def test_changed_source_is_resummarized_with_cached_others(
+        self, mock_llm, mock_collect, mock_load, mock_conn
+    ):
+        now = datetime.now(timezone.utc)
+        expired = now - timedelta(days=8)
+        mock_c = self._conn(self._row(expired, self._state(now, "old-hash")), (1, now))
+        mock_conn.return_value = mock_c
+        articles = [{"title": "새 뉴스", "description": "", "pubDate": "", "link": ""}]
+        mock_collect.return_value = {
+            "news": {"success": True, "data": articles, "reason": "", "latency_ms": 5}
+        }
+        mock_llm.return_value = json.dumps({"overview": "새 개요"})
+        fetched = now - timedelta(days=1)
+        mock_load.return_value = {
+            "dart": {"payload": {"products": "DART 원문"}, "fetched_at": fetched},
+            "website": {"payload": {"talent": "인재상 원문"}, "fetched_at": fetched},
+        }
+
+        from cover_letter import company_service
+
+        result = company_service.get_or_analyze_company("카카오")
+
+        mock_collect.assert_called_once_with(
+            "카카오", ("news",), collectors=company_service._REFRESH_COLLECTORS
+        )
+        mock_llm.assert_called_once()
+        prompt = mock_llm.call_args[0][0]
+        assert "DART 원문" in prompt and "인재상 원문" in prompt
+        assert "새 뉴스" in prompt
+        assert result["overview"] == "새 개요"
+        assert result["source_status"]["dart"]["cached"] is True
+        # source_state에는 원문 없이 해시·시각·상태만 남는다
+        assert set(result["source_state"]["dart"]) == {"hash", "fetched_at", "status"}
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service._collect_sources")
+    @patch("cover_letter.company_service.llm_client.call")
+    def test_unchanged_content_skips_llm(self, mock_llm, mock_collect, mock_conn):
+        from cover_letter import company_service
+
+        articles = [{"title": "옛", "description": "", "pubDate": "", "link": ""}]
+        news_hash = company_service._content_hash(
+            company_service._format_news(articles)
+        )
+        now = datetime.now(timezone.utc)
+        expired = now - timedelta(days=8)
+        mock_conn.return_value = self._conn(
+            self._row(expired, self._state(now, news_hash)), (now,)
+        )
+        mock_collect.return_value = {
+            "news": {"success": True, "data": articles, "reason": "", "latency_ms": 5}
+        }
+
+        result = company_service.get_or_analyze_company("카카오")
+
+        mock_llm.assert_not_called()
+        assert result["overview"] == "개요"
+        assert result["analyzed_at"] == now.isoformat()
+        assert (
+            result["source_state"]["news"]["fetched_at"]
+            > (now - timedelta(days=1)).isoformat()
+        )
+
+
+# ============================================================
+# 수집 원본 저장소(source_document) 테스트
+# ============================================================
+class TestSourceStore:
+    def test_encode_roundtrip_and_stable_hash(self):
+        from cover_letter import source_store
+
+        payload = {"talent": "도전" * 100, "source_url": "https://a.com"}
+        content, digest = source_store.encode(payload)
+
+        assert source_store.decode(memoryview(content)) == payload
+        assert len(content) < len(json.dumps(payload, ensure_ascii=False))
+        # 키 순서가 달라도 같은 해시
+        assert source_store.encode(dict(reversed(payload.items())))[1] == digest
+
+    def test_save_rejects_unknown_source(self):
+        from cover_letter import source_store
+
+        with pytest.raises(ValueError):
+            source_store.save(MagicMock(), "카카오", "blog", {})
+
+    def test_save_prunes_old_versions(self, monkeypatch):
+        from cover_letter import source_store
+
+        monkeypatch.setattr(source_store, "_KEEP_VERSIONS", 3)
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_cursor.__exit__ = MagicMock(return_value=False)
+        conn = MagicMock()
+        conn.__enter__ = MagicMock(return_value=conn)
+        conn.__exit__ = MagicMock(return_value=False)
+        conn.cursor.return_value = mock_cursor
+
+        source_store.save(conn, "카카오", "news", [{"title": "기사"}])
+
+        insert, prune = mock_cursor.execute.call_args_list
+        assert "INSERT INTO source_document" in insert.args[0]
+        assert "DELETE FROM source_document" in prune.args[0]
+        assert prune.args[1] == ("카카오", "news", "카카오", "news", 3)
+
+    @patch("cover_letter.company_service.source_store.save")
+    @patch("cover_letter.company_service._summarize_and_store")
+    @patch("cover_letter.company_service._collect_sources")
+    def test_full_analysis_stores_successful_payloads(
+        self, mock_collect, mock_summarize, mock_save
+    ):
+        from cover_letter import company_service
+
+        website = {"talent": "인재상", "vision": "", "source_url": "https://k.com"}
+        mock_collect.return_value = {
+            "dart": {"success": False, "data": {}, "reason": "실패"},
+            "news": {"success": True, "data": [{"title": "뉴스"}], "reason": ""},
+            "website": {"success": True, "data": website, "reason": ""},
+        }
+        mock_save.side_effect = [RuntimeError("DB 오류"), "sha"]
+        conn = MagicMock()
+
+        company_service._full_analysis("카카오", conn)
+
+        saved = [(c.args[2], c.kwargs["url"]) for c in mock_save.call_args_list]
+        assert saved == [("news", ""), ("website", "https://k.com")]
+        # 저장 실패해도 요약은 계속
+        mock_summarize.assert_called_once()
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service.source_store.load_latest")
+    @patch("cover_letter.company_service._summarize_and_store")
+    @patch("cover_letter.company_service._collect_sources")
+    def test_resummarize_from_store_uses_stored_payloads_only(
+        self, mock_collect, mock_summarize, mock_load, mock_conn
+    ):
+        from cover_letter import company_service
+
+        fetched = datetime(2026, 9, 1, tzinfo=timezone.utc)
+        mock_load.return_value = {
+            "dart": {
+                "payload": {"products": "플랫폼"},
+                "url": "",
+                "sha256": "a",
+                "fetched_at": fetched,
+            },
+        }
+        mock_summarize.return_value = {"id": 1}
+
+        assert company_service.resummarize_from_store("카카오") == {"id": 1}
+
+        mock_collect.assert_not_called()
+        results = mock_summarize.call_args.args[2]
+        assert results["dart"]["data"] == {"products": "플랫폼"}
+        assert results["dart"]["fetched_at"] == fetched.isoformat()
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service.source_store.load_latest")
+    def test_resummarize_without_documents_returns_none(self, mock_load, mock_conn):
+        from cover_letter import company_service
+
+        mock_load.return_value = {}
+
+        assert company_service.resummarize_from_store("카카오") is None
+
+
+# ============================================================
+# single-flight 동시 분석 합치기 테스트
+# ============================================================
+class TestSingleFlight:
+    @staticmethod
+    def _conn(fetchone):
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.side_effect = fetchone
+        mock_cursor.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_cursor.__exit__ = MagicMock(return_value=False)
+        mock_c = MagicMock()
+        mock_c.__enter__ = MagicMock(return_value=mock_c)
+        mock_c.__exit__ = MagicMock(return_value=False)
+        mock_c.cursor.return_value = mock_cursor
+        return mock_c
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service._full_analysis")
+    def test_concurrent_requests_share_one_analysis(self, mock_full, mock_conn):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from cover_letter import company_service
+
+        def _miss_conn():
+            # 캐시 조회는 항상 미스, advisory lock은 항상 획득
+            mock_c = self._conn(None)
+            cursor = mock_c.cursor.return_value
+            cursor.fetchone.side_effect = lambda: (
+                (True,) if "advisory" in cursor.execute.call_args[0][0] else None
+            )
+            return mock_c
+
+        def _slow_analysis(name, conn):
+            time.sleep(0.2)
+            return {"id": 1, "company_name": name}
+
+        mock_conn.side_effect = _miss_conn
+        mock_full.side_effect = _slow_analysis
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(
+                    lambda _: company_service.get_or_analyze_company("카카오"),
+                    range(4),
+                )
+            )
+
+        mock_full.assert_called_once()
+        assert all(r == {"id": 1, "company_name": "카카오"} for r in results)
+        assert company_service._inflight == {}
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service._full_analysis")
+    def test_lock_waiter_reuses_cache_written_by_other_process(
+        self, mock_full, mock_conn
+    ):
+        now = datetime.now(timezone.utc)
+        cached_row = (1, "카카오", "개요", "문화", "", "", "뉴스", "", now, {}, now, {})
+        mock_conn.return_value = self._conn(
+            [
+                None,  # 최초 캐시 조회 → 없음
+                (False,),  # 다른 프로세스가 분석 중 → 락 획득 실패
+                cached_row,  # 락 대기 후 재조회 → 방금 저장된 캐시
+            ]
+        )
+
+        from cover_letter import company_service
+
+        result = company_service.get_or_analyze_company("카카오")
+
+        mock_full.assert_not_called()
+        assert result["id"] == 1
+        assert result["overview"] == "개요"
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service._full_analysis")
+    def test_lock_wait_is_bounded_by_lock_timeout(self, mock_full, mock_conn):
+        import psycopg2.errors
+
+        mock_c = self._conn([None, (False,)])
+        cursor = mock_c.cursor.return_value
+
+        def _execute(sql, params=None):
+            if sql.startswith("SELECT pg_advisory_lock"):
+                raise psycopg2.errors.LockNotAvailable("lock timeout")
+
+        cursor.execute.side_effect = _execute
+        mock_conn.return_value = mock_c
+
+        from cover_letter import company_service
+
+        with pytest.raises(RuntimeError, match="진행 중"):
+            company_service.get_or_analyze_company("카카오")
+
+        executed = [c.args[0] for c in cursor.execute.call_args_list]
+        assert any("lock_timeout" in sql for sql in executed)
+        assert not any("pg_advisory_unlock" in sql for sql in executed)
+        mock_full.assert_not_called()
+        assert company_service._inflight == {}
+
+    def test_in_process_waiter_timeout_raises_runtime_error(self, monkeypatch):
+        from concurrent.futures import Future
+
+        from cover_letter import company_service
+
+        monkeypatch.setattr(company_service, "_SINGLE_FLIGHT_TIMEOUT", 0.05)
+        monkeypatch.setitem(company_service._inflight, "카카오", Future())
+
+        with pytest.raises(RuntimeError, match="진행 중"):
+            company_service._analyze_single_flight("카카오", MagicMock(), None)
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service._full_analysis")
+    def test_leader_failure_propagates_and_clears_inflight(self, mock_full, mock_conn):
+        mock_conn.return_value = self._conn([None, (True,)])
+        mock_full.side_effect = RuntimeError("LLM 실패")
+
+        from cover_letter import company_service
+
+        with pytest.raises(RuntimeError):
+            company_service.get_or_analyze_company("카카오")
+        assert company_service._inflight == {}
+
+
+# ============================================================
+# _collect_sources 병렬 수집 테스트
+# ============================================================
+class TestCollectSources:
+    @staticmethod
+    def _slow(delay: float, result: dict):
+        def _collector(company_name: str) -> dict:
+            time.sleep(delay)
+            return result
+
+        return _collector
+
+    def test_sources_run_concurrently(self, monkeypatch):
+        from cover_letter import company_service
+
+        ok = {"success": True, "data": {}, "reason": ""}
+        monkeypatch.setattr(
+            company_service,
+            "_COLLECTORS",
+            {source: self._slow(0.3, ok) for source in ("dart", "news", "website")},
+        )
+
+        started = time.monotonic()
+        results = company_service._collect_sources("카카오")
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.8
+        assert set(results) == {"dart", "news", "website"}
+        assert all(r["latency_ms"] >= 250 for r in results.values())
+
+    def test_slow_source_times_out_without_blocking_others(self, monkeypatch):
+        from cover_letter import company_service
+
+        ok = {"success": True, "data": {}, "reason": ""}
+        monkeypatch.setattr(
+            company_service,
+            "_COLLECTORS",
+            {
+                "dart": self._slow(2.0, ok),
+                "news": self._slow(0.0, ok),
+                "website": self._slow(0.0, ok),
+            },
+        )
+        monkeypatch.setitem(company_service._SOURCE_TIMEOUTS, "dart", 0.2)
+
+        started = time.monotonic()
+        results = company_service._collect_sources("카카오")
+
+        assert time.monotonic() - started < 1.0
+        assert results["dart"]["success"] is False
+        assert "시간 초과" in results["dart"]["reason"]
+        assert results["news"]["success"] is True
+        assert results["dart"]["timed_out"] is True
+
+    def test_concurrent_analyses_do_not_queue_behind_each_other(self, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from cover_letter import company_service
+
+        ok = {"success": True, "data": {}, "reason": ""}
+        monkeypatch.setattr(
+            company_service,
+            "_COLLECTORS",
+            {source: self._slow(0.3, ok) for source in ("dart", "news", "website")},
+        )
+        for source in ("dart", "news", "website"):
+            monkeypatch.setitem(company_service._SOURCE_TIMEOUTS, source, 0.6)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            runs = list(
+                pool.map(lambda _: company_service._collect_sources("카카오"), range(4))
+            )
+
+        assert all(r["success"] for results in runs for r in results.values())
+
+    @staticmethod
+    def _timeout_cache(timed_out_ago: timedelta, attempts: int) -> dict:
+        now = datetime.now(timezone.utc)
+        state = {
+            "dart": {"hash": "", "fetched_at": now.isoformat()},
+            "news": {"hash": "", "fetched_at": now.isoformat()},
+            "website": {
+                "hash": "",
+                "fetched_at": (now - timed_out_ago).isoformat(),
+                "status": "timeout",
+                "attempts": attempts,
+            },
+        }
+        return {"analyzed_at": now, "source_state": state}
+
+    def test_timed_out_source_served_fresh_during_backoff(self, monkeypatch):
+        from cover_letter import company_service
+
+        monkeypatch.setattr(company_service, "_TIMEOUT_BACKOFF_MINUTES", 30)
+        cached = self._timeout_cache(timedelta(minutes=10), attempts=1)
+
+        assert company_service._is_fresh(cached) is True
+        assert company_service._stale_sources(cached) == ()
+
+    def test_timed_out_source_retried_after_backoff(self, monkeypatch):
+        from cover_letter import company_service
+
+        monkeypatch.setattr(company_service, "_TIMEOUT_BACKOFF_MINUTES", 30)
+        cached = self._timeout_cache(timedelta(minutes=31), attempts=1)
+
+        assert company_service._is_fresh(cached) is False
+        assert company_service._stale_sources(cached) == ("website",)
+
+    def test_timeout_backoff_doubles_per_attempt(self, monkeypatch):
+        from cover_letter import company_service
+
+        monkeypatch.setattr(company_service, "_TIMEOUT_BACKOFF_MINUTES", 30)
+        # 3번째 연속 시간 초과 → 120분 대기
+        assert company_service._is_fresh(
+            self._timeout_cache(timedelta(minutes=90), attempts=3)
+        )
+        assert not company_service._is_fresh(
+            self._timeout_cache(timedelta(minutes=121), attempts=3)
+        )
+
+    def test_repeated_timeout_increments_attempts(self):
+        from cover_letter import company_service
+
+        state: dict = {}
+        company_service._mark_timeout(state, "website", "2026-01-01T00:00:00+00:00")
+        company_service._mark_timeout(state, "website", "2026-01-01T01:00:00+00:00")
+
+        assert state["website"]["attempts"] == 2
+        assert state["website"]["fetched_at"] == "2026-01-01T01:00:00+00:00"
+
+    def test_timeout_keeps_previous_ok_source(self):
+        from cover_letter import company_service
+
+        state = {"news": {"hash": "abc", "fetched_at": "t", "status": "ok"}}
+        company_service._mark_timeout(state, "news", "2026-01-01T00:00:00+00:00")
+
+        assert state["news"] == {"hash": "abc", "fetched_at": "t", "status": "ok"}
+
+    def test_collector_exception_is_isolated(self, monkeypatch):
+        from cover_letter import company_service
+
+        def _boom(company_name: str) -> dict:
+            raise RuntimeError("boom")
+
+        ok = {"success": True, "data": {}, "reason": ""}
+        monkeypatch.setattr(
+            company_service,
+            "_COLLECTORS",
+            {"dart": _boom, "news": self._slow(0.0, ok), "website": self._slow(0, ok)},
+        )
+
+        results = company_service._collect_sources("카카오")
+
+        assert results["dart"]["success"] is False
+        assert results["website"]["success"] is True
+
+
+# ============================================================
+# analyze_job 캐시 테스트
+# ============================================================
+class TestAnalyzeJobCache:
+    @staticmethod
+    def _conn(*fetchone):
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.side_effect = list(fetchone)
+        mock_cursor.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_cursor.__exit__ = MagicMock(return_value=False)
+        mock_c = MagicMock()
+        mock_c.__enter__ = MagicMock(return_value=mock_c)
+        mock_c.__exit__ = MagicMock(return_value=False)
+        mock_c.cursor.return_value = mock_cursor
+        return mock_c
+
+    @staticmethod
+    def _job_row(analyzed_at, context_hash):
+        return (
+            7,
+            "백엔드 개발자",
+            "API 개발",
+            "트래픽 급증",
+            ["Python"],
+            "플랫폼화",
+            analyzed_at,
+            context_hash,
+        )
+
+    def test_normalize_job_title(self):
+        from cover_letter import company_service
+
+        assert company_service.normalize_job_title(
+            "백엔드 개발자"
+        ) == company_service.normalize_job_title("백엔드개발자")
+        assert company_service.normalize_job_title(" Backend  Engineer ") == (
+            "backendengineer"
+        )
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service.llm_client.call")
+    def test_fresh_cache_skips_llm(self, mock_llm, mock_conn):
+        from cover_letter import company_service
+
+        context_hash = company_service._content_hash("개요\n동향")
+        mock_c = self._conn(
+            ("카카오", "개요", "동향"),
+            self._job_row(datetime.now(timezone.utc), context_hash),
+        )
+        mock_conn.return_value = mock_c
+
+        result = company_service.analyze_job(1, "백엔드개발자")
+
+        mock_llm.assert_not_called()
+        assert result["id"] == 7
+        assert result["job_title"] == "백엔드 개발자"
+        assert result["expected_competencies"] == ["Python"]
+        lookup_params = mock_c.cursor.return_value.execute.call_args_list[1][0][1]
+        assert lookup_params == (1, "백엔드개발자")
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service.llm_client.call")
+    def test_company_refresh_invalidates_and_updates_same_row(
+        self, mock_llm, mock_conn
+    ):
+        from cover_letter import company_service
+
+        mock_c = self._conn(
+            ("카카오", "새 개요", "동향"),
+            self._job_row(datetime.now(timezone.utc), "이전-해시"),
+            (7,),
+        )
+        mock_conn.return_value = mock_c
+        mock_llm.return_value = json.dumps({"responsibilities": "새 업무"})
+
+        result = company_service.analyze_job(1, "백엔드개발자")
+
+        mock_llm.assert_called_once()
+        sql = mock_c.cursor.return_value.execute.call_args_list[2][0][0]
+        assert "UPDATE job_analysis" in sql
+        assert result["id"] == 7
+        assert result["job_title"] == "백엔드 개발자"
+        assert result["responsibilities"] == "새 업무"
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service.llm_client.call")
+    def test_expired_cache_reruns_llm(self, mock_llm, mock_conn):
+        from cover_letter import company_service
+
+        context_hash = company_service._content_hash("개요\n동향")
+        expired = datetime.now(timezone.utc) - timedelta(days=31)
+        mock_conn.return_value = self._conn(
+            ("카카오", "개요", "동향"), self._job_row(expired, context_hash), (7,)
+        )
+        mock_llm.return_value = "{}"
+
+        company_service.analyze_job(1, "백엔드 개발자")
+
+        mock_llm.assert_called_once()
+
+    @patch("cover_letter.company_service._get_conn")
+    @patch("cover_letter.company_service.llm_client.call")
+    def test_cache_miss_inserts(self, mock_llm, mock_conn):
+        from cover_letter import company_service
+
+        mock_c = self._conn(("카카오", "개요", "동향"), None, (9,))
+        mock_conn.return_value = mock_c
+        mock_llm.return_value = "{}"
+
+        result = company_service.analyze_job(1, "데이터 분석가")
+
+        sql = mock_c.cursor.return_value.execute.call_args_list[2][0][0]
+        assert "INSERT INTO job_analysis" in sql
+        assert result["id"] == 9
+        assert result["job_title"] == "데이터 분석가"
+
+
+# ============================================================
+# 기업 분석 사전 적재(prewarm) 테스트
+# ============================================================
+class TestPrewarm:
+    def test_load_companies_skips_comments_and_duplicates(self, tmp_path):
+        from cover_letter import batch_utils
+
+        path = tmp_path / "companies.txt"
+        path.write_text("# 상위 채용 기업\n카카오\n\n네이버  # 포털\n카카오\n", "utf-8")
+
+        assert batch_utils.load_companies(path) == ["카카오", "네이버"]
+
+    @patch("cover_letter.company_service.analyze_job")
+    @patch("cover_letter.company_service.get_or_analyze_company")
+    def test_warms_company_and_jobs_then_clears_checkpoint(
+        self, mock_company, mock_job, tmp_path
+    ):
+        from cover_letter import prewarm
+
+        mock_company.side_effect = lambda name: {"id": hash(name), "company_name": name}
+        checkpoint = tmp_path / "ckpt.json"
+
+        result = prewarm.prewarm(
+            ["카카오", "네이버"],
+            ["백엔드 개발자", "데이터 분석가"],
+            workers=2,
+            rate_per_minute=0,
+            checkpoint_path=checkpoint,
+        )
+
+        assert result == {"warmed": 2, "skipped": 0, "failed": {}}
+        assert mock_job.call_count == 4
+        assert not checkpoint.exists()
+
+    @patch("cover_letter.company_service.analyze_job")
+    @patch("cover_letter.company_service.get_or_analyze_company")
+    def test_resume_skips_done_and_keeps_checkpoint_on_failure(
+        self, mock_company, mock_job, tmp_path
+    ):
+        from cover_letter import prewarm
+
+        checkpoint = tmp_path / "ckpt.json"
+        checkpoint.write_text(json.dumps({"done": ["카카오"], "failed": {}}), "utf-8")
+
+        def _analyze(name):
+            if name == "토스":
+                raise RuntimeError("DART 타임아웃")
+            return {"id": 1, "company_name": name}
+
+        mock_company.side_effect = _analyze
+
+        result = prewarm.prewarm(
+            ["카카오", "네이버", "토스"],
+            ["백엔드 개발자"],
+            rate_per_minute=0,
+            checkpoint_path=checkpoint,
+        )
+
+        called = {c.args[0] for c in mock_company.call_args_list}
+        assert called == {"네이버", "토스"}
+        assert result["warmed"] == 1
+        assert result["skipped"] == 1
+        assert result["failed"] == {"토스": "DART 타임아웃"}
+        # 실행이 끝나면 완료 목록은 비우고 실패만 남긴다
+        saved = json.loads(checkpoint.read_text("utf-8"))
+        assert saved["done"] == []
+        assert saved["failed"] == {"토스": "DART 타임아웃"}
+
+    @patch("cover_letter.company_service.analyze_job")
+    @patch("cover_letter.company_service.get_or_analyze_company")
+    def test_next_run_rewarms_successes_despite_permanent_failure(
+        self, mock_company, mock_job, tmp_path
+    ):
+        from cover_letter import prewarm
+
+        checkpoint = tmp_path / "ckpt.json"
+
+        def _analyze(name):
+            if name == "토스":
+                raise RuntimeError("DART 타임아웃")
+            return {"id": 1, "company_name": name}
+
+        mock_company.side_effect = _analyze
+        companies = ["카카오", "네이버", "토스"]
+
+        first = prewarm.prewarm(
+            companies, [], rate_per_minute=0, checkpoint_path=checkpoint
+        )
+        mock_company.reset_mock()
+        second = prewarm.prewarm(
+            companies, [], rate_per_minute=0, checkpoint_path=checkpoint
+        )
+
+        called = {c.args[0] for c in mock_company.call_args_list}
+        assert called == {"카카오", "네이버", "토스"}
+        assert first["warmed"] == second["warmed"] == 2
+        assert second["skipped"] == 0
+        assert second["failed"] == {"토스": "DART 타임아웃"}
+
+    def test_throttle_spaces_starts(self):
+        from cover_letter import batch_utils
+
+        throttle = batch_utils.Throttle(rate_per_minute=600)  # 0.1초 간격
+        started = time.monotonic()
+        for _ in range(3):
+            throttle.wait()
+
+        assert time.monotonic() - started >= 0.18
+
+
+# ============================================================
+# DART 일괄 적재 테스트
+# ============================================================
+class TestDartBulk:
+    @pytest.fixture
+    def fake_dart(self, monkeypatch):
+        import sys
+        import types
+
+        module = types.ModuleType("dart_fss")
+        module.set_api_key = MagicMock()
+        monkeypatch.setitem(sys.modules, "dart_fss", module)
+        return module
+
+    def test_skips_loaded_codes_and_records_each_outcome(self, fake_dart):
+        from cover_letter import dart_bulk
+
+        def _collect(dart, corp_code, years, before_request=None):
+            before_request()
+            if corp_code == "003":
+                raise RuntimeError("DART 응답 오류")
+            if corp_code == "002":
+                return {"success": False, "data": {}, "reason": "없음", "filing": {}}
+            return {
+                "success": True,
+                "data": {"products": "메신저"},
+                "reason": "",
+                "filing": {"rcept_no": "R1"},
+            }
+
+        with (
+            patch.object(dart_bulk, "_get_conn"),
+            patch.object(dart_bulk, "_corp_names", return_value={"001": "카카오"}),
+            patch.object(
+                dart_bulk.dart_report_store, "completed", return_value={"000"}
+            ),
+            patch.object(dart_bulk.dart_report_store, "save") as mock_save,
+            patch.object(dart_bulk.dart_report_store, "mark_failed") as mock_failed,
+            patch.object(
+                dart_bulk.dart_collector, "collect_by_corp_code", side_effect=_collect
+            ) as mock_collect,
+        ):
+            result = dart_bulk.ingest(
+                ["000", "001", "002", "003", "001"], rate_per_minute=0
+            )
+
+        assert {c.args[1] for c in mock_collect.call_args_list} == {
+            "001",
+            "002",
+            "003",
+        }
+        assert result == {
+            "ok": 1,
+            "no_report": 1,
+            "skipped": 1,
+            "failed": {"003": "DART 응답 오류"},
+        }
+        saved = {c.args[1]: c for c in mock_save.call_args_list}
+        assert saved["001"].args[2:] == ("ok", "카카오")
+        assert saved["001"].kwargs["sections"] == {"products": "메신저"}
+        assert saved["002"].args[2] == "no_report"
+        assert mock_failed.call_args.args[1:] == ("003", "", "DART 응답 오류")
+
+    def test_collect_dart_prefers_bulk_loaded_sections(self):
+        from cover_letter import company_service
+
+        corp = MagicMock(corp_code="001")
+        with (
+            patch.object(
+                company_service.dart_collector, "resolve_corp", return_value=corp
+            ),
+            patch.object(company_service, "_get_conn"),
+            patch.object(
+                company_service.dart_report_store,
+                "load_sections",
+                return_value={"products": "메신저"},
+            ),
+            patch.object(
+                company_service.dart_collector, "collect_dart_reports_with_status"
+            ) as mock_api,
+        ):
+            result = company_service._collect_dart("카카오")
+
+        assert result == {"success": True, "data": {"products": "메신저"}, "reason": ""}
+        mock_api.assert_not_called()
+
+    def test_collect_dart_falls_back_to_api_without_index(self):
+        from cover_letter import company_service
+
+        with (
+            patch.object(
+                company_service.dart_collector,
+                "resolve_corp",
+                side_effect=RuntimeError("인덱스 없음"),
+            ),
+            patch.object(
+                company_service.dart_collector,
+                "collect_dart_reports_with_status",
+                return_value={"success": False, "data": {}, "reason": "x"},
+            ) as mock_api,
+        ):
+            company_service._collect_dart("카카오")
+
+        mock_api.assert_called_once_with("카카오")
@@ -7,22 +7,26 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from cover_letter import jd_service
-from cover_letter.collectors import jd_crawler
+from cover_letter.collectors import (
+    firecrawl_client,
+    jd_crawler,
+    jd_ranker,
+    pdf_extractor,
+)
 
 
 # ============================================================
 # jd_crawler.crawl_jd 테스트
 # ============================================================
 class TestCrawlJD:
-    def _make_firecrawl_app(self, items: list[dict]) -> MagicMock:
-        app = MagicMock()
-        app.search.return_value = items
-        return app
-
-    @patch("cover_letter.collectors.jd_crawler.os.getenv", return_value="fake-key")
-    @patch("cover_letter.collectors.jd_crawler.FirecrawlApp", create=True)
-    def test_firecrawl_success_returns_text(self, mock_fc_cls, mock_getenv):
-        mock_fc_cls.return_value = self._make_firecrawl_app(
+    def _make_client(self, items: list[dict]) -> MagicMock:
+        client = MagicMock()
+        client.search.return_value = firecrawl_client.normalize_items(items)
+        return client
+
+    @patch("cover_letter.collectors.jd_crawler.firecrawl_client.get_client")
+    def test_firecrawl_success_returns_text(self, mock_get_client):
+        mock_get_client.return_value = self._make_client(
             [
                 {
                     "url": "https://example.com/job",
@@ -31,20 +35,16 @@ class TestCrawlJD:
             ]
         )
 
-        with patch.dict(
-            "sys.modules", {"firecrawl": MagicMock(FirecrawlApp=mock_fc_cls)}
-        ):
-            result = jd_crawler.crawl_jd("카카오", "백엔드 개발자")
+        result = jd_crawler.crawl_jd("카카오", "백엔드 개발자")
 
         assert result["success"] is True
         assert result["source_type"] == "firecrawl"
         assert result["text"] is not None
 
-    @patch("cover_letter.collectors.jd_crawler.os.getenv", return_value="fake-key")
-    @patch("cover_letter.collectors.jd_crawler.FirecrawlApp", create=True)
-    def test_pdf_url_triggers_pdfminer_fallback(self, mock_fc_cls, mock_getenv):
+    @patch("cover_letter.collectors.jd_crawler.firecrawl_client.get_client")
+    def test_pdf_url_triggers_pdfminer_fallback(self, mock_get_client):
         """PDF URL 감지 시 pdfminer fallback이 호출된다."""
-        mock_fc_cls.return_value = self._make_firecrawl_app(
+        mock_get_client.return_value = self._make_client(
             [{"url": "https://example.com/jd.pdf", "markdown": ""}]
         )
 
@@ -52,43 +52,221 @@ class TestCrawlJD:
             "cover_letter.collectors.jd_crawler._extract_pdf_from_url"
         ) as mock_pdf:
             mock_pdf.return_value = "PDF에서 추출된 직무기술서 내용"
-            with patch.dict(
-                "sys.modules", {"firecrawl": MagicMock(FirecrawlApp=mock_fc_cls)}
-            ):
-                result = jd_crawler.crawl_jd("삼성", "SW 개발자")
+            result = jd_crawler.crawl_jd("삼성", "SW 개발자")
 
         assert result["success"] is True
         assert result["source_type"] == "pdf"
 
-    @patch("cover_letter.collectors.jd_crawler.os.getenv", return_value="")
-    def test_missing_api_key_returns_manual(self, mock_getenv):
+    def test_missing_api_key_returns_manual(self, monkeypatch):
         """FIRECRAWL_API_KEY 없으면 manual 반환."""
+        monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
         result = jd_crawler.crawl_jd("당근마켓", "iOS 개발자")
         assert result["success"] is False
         assert result["source_type"] == "manual"
         assert result["text"] is None
 
-    @patch("cover_letter.collectors.jd_crawler.os.getenv", return_value="fake-key")
-    @patch("cover_letter.collectors.jd_crawler.FirecrawlApp", create=True)
-    def test_firecrawl_exception_returns_manual(self, mock_fc_cls, mock_getenv):
+    @patch("cover_letter.collectors.jd_crawler.firecrawl_client.get_client")
+    def test_firecrawl_exception_returns_manual(self, mock_get_client):
         """Firecrawl 예외 시 manual 반환."""
-        mock_app = MagicMock()
-        mock_app.search.side_effect = Exception("네트워크 오류")
-        mock_fc_cls.return_value = mock_app
+        mock_get_client.return_value.search.side_effect = Exception("네트워크 오류")
 
-        with patch.dict(
-            "sys.modules", {"firecrawl": MagicMock(FirecrawlApp=mock_fc_cls)}
-        ):
-            result = jd_crawler.crawl_jd("네이버", "데이터 분석가")
+        result = jd_crawler.crawl_jd("네이버", "데이터 분석가")
 
         assert result["success"] is False
         assert result["source_type"] == "manual"
 
+    @patch("cover_letter.collectors.jd_crawler.firecrawl_client.get_client")
+    def test_ranks_candidates_and_returns_alternates(self, mock_get_client):
+        """첫 결과가 무관한 페이지여도 채용공고다운 후보를 고르고 나머지를 함께 반환."""
+        mock_get_client.return_value = self._make_client(
+            [
+                {
+                    "url": "https://blog.example.com/review",
+                    "markdown": "맛집 후기 " * 50,
+                },
+                {
+                    "url": "https://careers.kakao.com/jobs/1",
+                    "title": "카카오 백엔드 개발자 채용",
+                    "markdown": "카카오 백엔드 개발자\n주요업무 API 개발\n"
+                    "자격요건 Java 3년\n우대사항 Kotlin " + "상세 " * 100,
+                },
+                {
+                    "url": "https://news.example.com/kakao",
+                    "markdown": "카카오 실적 " * 50,
+                },
+            ]
+        )
+
+        result = jd_crawler.crawl_jd("카카오", "백엔드 개발자")
+
+        assert result["source_url"] == "https://careers.kakao.com/jobs/1"
+        assert [a["source_url"] for a in result["alternates"]] == [
+            "https://news.example.com/kakao",
+            "https://blog.example.com/review",
+        ]
+        assert result["score"] > result["alternates"][0]["score"]
+
+
+# ============================================================
+# jd_ranker 테스트
+# ============================================================
+class TestJDRanker:
+    def test_section_markers_and_job_words_raise_score(self):
+        posting = jd_ranker.JDCandidate(
+            url="https://a",
+            title="카카오 백엔드 개발자",
+            text="카카오 백엔드개발자 담당 업무 ... 자격 요건 ... 우대사항 ...",
+        )
+        unrelated = jd_ranker.JDCandidate(url="https://b", text="카카오 주가 전망")
+
+        jd_ranker.score(posting, "카카오", "백엔드 개발자")
+        jd_ranker.score(unrelated, "카카오", "백엔드 개발자")
+
+        assert posting.features["job"] == 1.0
+        assert posting.features["sections"] == 1.0
+        assert unrelated.features["sections"] == 0.0
+        assert posting.score > unrelated.score
+
+    def test_recency_prefers_recent_postings(self):
+        from datetime import datetime, timezone
+
+        now = datetime(2026, 10, 19, tzinfo=timezone.utc)
+        fresh = jd_ranker.JDCandidate(
+            url="a", text="", published_date="2026-10-01T00:00:00Z"
+        )
+        stale = jd_ranker.JDCandidate(
+            url="b", text="", published_date="2024-10-01T00:00:00Z"
+        )
+        unknown = jd_ranker.JDCandidate(url="c", text="")
+
+        for candidate in (fresh, stale, unknown):
+            jd_ranker.score(candidate, "카카오", "백엔드", now)
+
+        assert fresh.features["recency"] == 1.0
+        assert stale.features["recency"] == 0.0
+        assert unknown.features["recency"] == 0.5
+
+
+# ============================================================
+# pdf_extractor 테스트
+# ============================================================
+class TestPdfExtractor:
+    @staticmethod
+    def _response(chunks: list[bytes], content_length: str = "") -> MagicMock:
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.headers = {"Content-Length": content_length}
+        response.iter_content.return_value = iter(chunks)
+        return response
+
+    def test_download_streams_within_cap(self):
+        response = self._response([b"%PDF", b"-1.7"])
+        with patch.object(pdf_extractor.requests, "get", return_value=response):
+            assert pdf_extractor.download("https://a/jd.pdf", max_bytes=8) == (
+                b"%PDF-1.7"
+            )
+
+    def test_download_rejects_declared_or_streamed_oversize(self):
+        declared = self._response([b"x"], content_length="100")
+        streamed = self._response([b"x" * 6, b"x" * 6])
+        with patch.object(
+            pdf_extractor.requests, "get", side_effect=[declared, streamed]
+        ):
+            with pytest.raises(ValueError):
+                pdf_extractor.download("https://a/jd.pdf", max_bytes=10)
+            with pytest.raises(ValueError):
+                pdf_extractor.download("https://a/jd.pdf", max_bytes=10)
+
+    def test_extract_text_stops_once_enough_text(self):
+        class _Text:
+            def __init__(self, text):
+                self.text = text
+
+            def get_text(self):
+                return self.text
+
+        consumed = []
+
+        def _pages(*args, **kwargs):
+            for i in range(10):
+                consumed.append(i)
+                yield [_Text("가" * 30)]
+
+        fake = MagicMock()
+        fake.high_level.extract_pages = _pages
+        fake.layout.LTTextContainer = _Text
+        with patch.dict(
+            "sys.modules",
+            {
+                "pdfminer": fake,
+                "pdfminer.high_level": fake.high_level,
+                "pdfminer.layout": fake.layout,
+            },
+        ):
+            text = pdf_extractor._extract_text(b"%PDF", max_pages=10, max_chars=50)
+
+        assert text == "가" * 50
+        assert consumed == [0, 1]
+
+    @pytest.fixture
+    def idle_workers(self, monkeypatch):
+        monkeypatch.setattr(pdf_extractor, "_idle", [])
+        yield pdf_extractor._idle
+        pdf_extractor.reset()
+
+    def test_timeout_kills_only_the_worker_running_the_job(self, idle_workers):
+        other, running = MagicMock(), MagicMock()
+        running.call.side_effect = TimeoutError("초과")
+        idle_workers.extend([other, running])  # 마지막 유휴 워커부터 사용
+
+        with patch.object(pdf_extractor, "download", return_value=b"%PDF"):
+            assert pdf_extractor.extract_text_from_url("https://a/jd.pdf") is None
+
+        running.kill.assert_called_once()
+        other.kill.assert_not_called()
+        assert idle_workers == [other]
+
+    def test_parse_error_keeps_worker_for_reuse(self, idle_workers):
+        worker = MagicMock()
+        worker.call.return_value = (False, "PDFSyntaxError: 손상된 파일")
+        idle_workers.append(worker)
+
+        with patch.object(pdf_extractor, "download", return_value=b"%PDF"):
+            assert pdf_extractor.extract_text_from_url("https://a/jd.pdf") is None
+
+        worker.kill.assert_not_called()
+        assert idle_workers == [worker]
+
+    def test_worker_process_roundtrip(self, idle_workers):
+        # 실제 spawn 워커: 깨진 PDF는 워커 안에서 실패로 보고되고 워커는 재사용된다
+        with pytest.raises(RuntimeError):
+            pdf_extractor._run_in_worker(b"not a pdf")
+
+        assert len(idle_workers) == 1
+        assert idle_workers[0].alive()
+
+    def test_download_failure_skips_parsing(self):
+        with (
+            patch.object(pdf_extractor, "download", side_effect=ValueError("크기")),
+            patch.object(pdf_extractor, "_run_in_worker") as mock_run,
+        ):
+            assert pdf_extractor.extract_text_from_url("https://a/jd.pdf") is None
+        mock_run.assert_not_called()
+
 
 # ============================================================
 # jd_service.extract_required_competencies 테스트
 # ============================================================
 class TestExtractRequiredCompetencies:
+    @pytest.fixture(autouse=True)
+    def _no_cache(self):
+        with (
+            patch.object(jd_service, "_load_cached_competencies", return_value=None),
+            patch.object(jd_service, "_save_cached_competencies") as mock_save,
+        ):
+            self.mock_save = mock_save
+            yield
+
     @patch("cover_letter.jd_service.llm_client.call")
     def test_returns_list_from_json_array(self, mock_call):
         mock_call.return_value = '["Python", "문제해결력", "팀워크"]'
@@ -107,6 +285,36 @@ class TestExtractRequiredCompetencies:
         mock_call.return_value = "이건 JSON이 아님"
         result = jd_service.extract_required_competencies("JD 텍스트")
         assert result == []
+        self.mock_save.assert_not_called()
+
+    @patch("cover_letter.jd_service.llm_client.call")
+    def test_cache_hit_skips_llm(self, mock_call):
+        with patch.object(
+            jd_service, "_load_cached_competencies", return_value=["Python"]
+        ) as mock_load:
+            result = jd_service.extract_required_competencies("Python  필수\n")
+
+        assert result == ["Python"]
+        mock_call.assert_not_called()
+        digest, prompt_digest = mock_load.call_args.args
+        assert digest == jd_service.content_hash("Python 필수")
+        assert prompt_digest == jd_service._prompt_hash()
+
+    @patch("cover_letter.jd_service.llm_client.call")
+    def test_cache_miss_stores_extracted_competencies(self, mock_call):
+        mock_call.return_value = '["협업"]'
+
+        jd_service.extract_required_competencies("JD 텍스트")
+
+        self.mock_save.assert_called_once_with(
+            jd_service.content_hash("JD 텍스트"), jd_service._prompt_hash(), ["협업"]
+        )
+
+    def test_content_hash_ignores_whitespace_differences(self):
+        assert jd_service.content_hash(" 자격요건\n Java ") == (
+            jd_service.content_hash("자격요건 Java")
+        )
+        assert jd_service.content_hash("Java") != jd_service.content_hash("Kotlin")
 
 
 # ============================================================
@@ -140,6 +348,26 @@ class TestSaveLoadJD:
         assert "ON CONFLICT" in sql
         assert result_id == 42
 
+    @patch("cover_letter.jd_service.save_jd", return_value=7)
+    @patch(
+        "cover_letter.jd_service.extract_required_competencies",
+        return_value=["Java"],
+    )
+    def test_select_candidate_saves_with_fresh_competencies(self, _, mock_save):
+        alternate = {
+            "text": "Java 백엔드",
+            "source_url": "https://b",
+            "source_type": "firecrawl",
+            "title": "",
+            "score": 0.4,
+        }
+
+        assert jd_service.select_candidate(1, alternate) == 7
+
+        saved = mock_save.call_args.args[1]
+        assert saved["source_url"] == "https://b"
+        assert saved["required_competencies"] == ["Java"]
+
     @patch("cover_letter.jd_service._get_conn")
     def test_load_jd_returns_none_when_no_row(self, mock_get_conn):
         mock_conn = MagicMock()
@@ -0,0 +1,301 @@
+"""llm_router, llm_client, prompt_budget, prompt_registry 단위 테스트."""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from cover_letter import llm_client, llm_router, prompt_budget, prompt_registry
+from crawling import rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def _reset_telemetry():
+    llm_router.reset()
+    yield
+    llm_router.reset()
+
+
+# ============================================================
+# llm_router 테스트
+# ============================================================
+class TestLLMRouter:
+    def test_thinking_budget_scales_with_input(self):
+        small = llm_router.thinking_budget_for(100)
+        large = llm_router.thinking_budget_for(3000)
+        assert small == llm_router.THINKING_BUDGET_MIN
+        assert small < large <= llm_router.THINKING_BUDGET_MAX
+
+    def test_thinking_budget_capped_at_max(self):
+        assert (
+            llm_router.thinking_budget_for(1_000_000) == llm_router.THINKING_BUDGET_MAX
+        )
+
+    def test_no_downgrade_without_telemetry(self):
+        route = llm_router.resolve("pro", prompt_chars=500, critical=False)
+        assert route.tier == "pro"
+        assert route.downgraded is False
+
+    def test_latency_breach_downgrades_non_critical_pro_to_flash(self):
+        model = llm_router.model_for_tier("pro")
+        for _ in range(10):
+            llm_router.record(model, "pro", 999.0, ok=True)
+
+        route = llm_router.resolve("pro", prompt_chars=500, critical=False)
+
+        assert route.tier == "flash"
+        assert route.model == llm_router.model_for_tier("flash")
+        assert route.downgraded is True
+
+    def test_latency_breach_shrinks_thinking_budget(self):
+        model = llm_router.model_for_tier("pro-thinking")
+        for _ in range(10):
+            llm_router.record(model, "pro-thinking", 999.0, ok=True)
+
+        route = llm_router.resolve("pro-thinking", prompt_chars=4000, critical=False)
+
+        assert route.tier == "pro-thinking"
+        assert route.thinking_budget == llm_router.THINKING_BUDGET_MIN
+
+    def test_error_breach_downgrades_to_flash(self):
+        model = llm_router.model_for_tier("pro-thinking")
+        for _ in range(10):
+            llm_router.record(model, "pro-thinking", 1.0, ok=False)
+
+        route = llm_router.resolve("pro-thinking", prompt_chars=500, critical=False)
+
+        assert route.tier == "flash"
+        assert route.thinking_budget is None
+
+    def test_critical_call_never_downgraded(self):
+        model = llm_router.model_for_tier("pro")
+        for _ in range(10):
+            llm_router.record(model, "pro", 999.0, ok=False)
+
+        route = llm_router.resolve("pro", prompt_chars=500, critical=True)
+
+        assert route.tier == "pro"
+        assert route.downgraded is False
+
+    def test_pro_thinking_latency_does_not_downgrade_pro(self):
+        model = llm_router.model_for_tier("pro-thinking")
+        for _ in range(10):
+            llm_router.record(model, "pro-thinking", 999.0, ok=True)
+
+        route = llm_router.resolve("pro", prompt_chars=500, critical=False)
+
+        assert route.tier == "pro"
+        assert route.downgraded is False
+
+
+# ============================================================
+# llm_client 헤지 요청 테스트
+# ============================================================
+class TestHedgedRequests:
+    def _make_client(self, delays: list[float]) -> MagicMock:
+        """호출 순서대로 delays[i]초 후 f"응답{i}"를 반환하는 가짜 클라이언트."""
+        calls = {"n": 0}
+        lock = threading.Lock()
+
+        def _generate_content(**kwargs):
+            with lock:
+                idx = calls["n"]
+                calls["n"] += 1
+            time.sleep(delays[idx])
+            return MagicMock(text=f"응답{idx}")
+
+        client = MagicMock()
+        client.models.generate_content.side_effect = _generate_content
+        return client
+
+    def _warm_up(self, route, latency: float, calls: int = 20) -> None:
+        for _ in range(calls):
+            llm_router.record(route.model, route.tier, latency, ok=True)
+            llm_router.note_call()
+
+    def test_hedge_fires_when_primary_exceeds_p90(self):
+        route = llm_router.resolve("pro")
+        self._warm_up(route, 0.01)
+        client = self._make_client([1.0, 0.0])
+
+        text = llm_client._generate_hedged(client, route, "프롬프트", config=None)
+
+        assert text == "응답1"
+        assert client.models.generate_content.call_count == 2
+
+    def test_no_hedge_without_telemetry(self):
+        route = llm_router.resolve("pro")
+        client = self._make_client([0.05])
+
+        text = llm_client._generate_hedged(client, route, "프롬프트", config=None)
+
+        assert text == "응답0"
+        assert client.models.generate_content.call_count == 1
+
+    def test_primary_does_not_wait_in_hedge_pool(self, monkeypatch):
+        route = llm_router.resolve("pro")
+        self._warm_up(route, 0.5)
+        executor = MagicMock()
+        monkeypatch.setattr(llm_client, "_HEDGE_EXECUTOR", executor)
+        client = self._make_client([0.01])
+
+        text = llm_client._generate_hedged(client, route, "프롬프트", config=None)
+
+        assert text == "응답0"
+        executor.submit.assert_not_called()
+
+    def test_no_hedge_when_budget_exhausted(self):
+        route = llm_router.resolve("pro")
+        for _ in range(20):
+            llm_router.record(route.model, route.tier, 0.01, ok=True)
+        # note_call 없이 예산 0 → 헤지 불가
+        client = self._make_client([0.2, 0.0])
+
+        text = llm_client._generate_hedged(client, route, "프롬프트", config=None)
+
+        assert text == "응답0"
+        assert client.models.generate_content.call_count == 1
+
+
+class TestRateLimitRetry:
+    @pytest.fixture(autouse=True)
+    def _fast_backoff(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_RETRY_BASE_SECONDS", "0.01")
+        monkeypatch.setenv("RATE_LIMIT_GEMINI_PER_SECOND", "1000")
+        rate_limiter.reset()
+        yield
+        rate_limiter.reset()
+
+    def test_retries_after_resource_exhausted(self):
+        client = MagicMock()
+        client.models.generate_content.side_effect = [
+            RuntimeError("429 RESOURCE_EXHAUSTED"),
+            MagicMock(text="응답"),
+        ]
+        route = llm_router.resolve("flash")
+
+        text = llm_client._generate_once(client, route, "프롬프트", config=None)
+
+        assert text == "응답"
+        assert client.models.generate_content.call_count == 2
+        stats = llm_router._get_stats(route.model, route.tier)
+        assert [ok for _, ok in stats.snapshot()] == [True]
+
+    def test_other_errors_are_not_retried(self):
+        client = MagicMock()
+        client.models.generate_content.side_effect = RuntimeError("500 INTERNAL")
+
+        with pytest.raises(RuntimeError):
+            llm_client._generate_once(
+                client, llm_router.resolve("flash"), "프롬프트", config=None
+            )
+        assert client.models.generate_content.call_count == 1
+
+
+# ============================================================
+# prompt_budget 테스트
+# ============================================================
+class TestPromptBudget:
+    def test_short_text_untouched(self):
+        assert prompt_budget.trim_to_tokens("짧은 텍스트", 100) == "짧은 텍스트"
+
+    def test_trim_respects_token_limit(self):
+        text = "\n".join(f"{i}번째 줄의 긴 한국어 문장입니다." for i in range(500))
+        trimmed = prompt_budget.trim_to_tokens(text, 200)
+        assert prompt_budget.estimate_tokens(trimmed) <= 200
+        assert trimmed.startswith("0번째 줄")
+        assert trimmed.endswith("(이하 생략)")
+
+    def test_fit_sections_trims_low_priority_first(self):
+        big = "가" * 10000
+        fitted = prompt_budget.fit_sections(
+            "company_analysis",
+            {"dart_summary": big, "website_summary": big, "news_summary": big},
+        )
+        total_budget, sections = prompt_budget.TEMPLATE_BUDGETS["company_analysis"]
+        used = {
+            name: prompt_budget.estimate_tokens(fitted[name])
+            for name in ("dart_summary", "website_summary", "news_summary")
+        }
+        assert sum(used.values()) <= total_budget
+        assert used["dart_summary"] > used["news_summary"]
+
+    def test_fit_sections_trims_total_when_sections_under_caps(self):
+        total_budget, sections = prompt_budget.TEMPLATE_BUDGETS["company_analysis"]
+        # 각 섹션은 자기 상한보다 100토큰 작다 ("가" 3자 = 2토큰)
+        values = {s.name: "가" * ((s.max_tokens - 100) * 3 // 2) for s in sections}
+        assert sum(prompt_budget.estimate_tokens(v) for v in values.values()) > (
+            total_budget
+        )
+
+        fitted = prompt_budget.fit_sections("company_analysis", values)
+
+        used = {s.name: prompt_budget.estimate_tokens(fitted[s.name]) for s in sections}
+        assert sum(used.values()) <= total_budget
+        assert fitted["dart_summary"] == values["dart_summary"]
+        assert used["news_summary"] < prompt_budget.estimate_tokens(
+            values["news_summary"]
+        )
+
+    def test_preflight_rejects_prompt_over_limit(self, monkeypatch):
+        monkeypatch.setattr(prompt_budget, "MAX_INPUT_TOKENS", 100)
+        assert prompt_budget.preflight("가" * 30, system="시스템") < 100
+        with pytest.raises(RuntimeError):
+            prompt_budget.preflight("가" * 300)
+
+    def test_unknown_template_passthrough(self):
+        values = {"a": "가" * 10000}
+        assert prompt_budget.fit_sections("unknown", values) == values
+
+
+# ============================================================
+# prompt_registry 테스트
+# ============================================================
+class TestPromptRegistry:
+    def test_all_prompt_files_loaded(self):
+        for name in prompt_registry.EXPECTED_PLACEHOLDERS:
+            assert prompt_registry.get(name).name == name
+
+    def test_render_splits_system_and_user(self):
+        system, user = prompt_registry.render("profile_extract", texts="자료 본문")
+        assert system.startswith("당신은 한국 취업 전문가")
+        assert "## User" not in user
+        assert "자료 본문" in user
+
+    def test_render_unescapes_braces_in_single_pass(self):
+        _, user = prompt_registry.render(
+            "hallucination_check", experiences="{answer_text}", answer_text="답변"
+        )
+        # 값 안의 {answer_text}는 재치환되지 않는다
+        assert "{answer_text}" in user
+        assert '{"hallucinated": true' in user
+        assert "{{" not in user
+
+    def test_render_missing_value_raises(self):
+        with pytest.raises(ValueError):
+            prompt_registry.render("profile_extract")
+
+    def test_placeholder_mismatch_detected(self, tmp_path, monkeypatch):
+        (tmp_path / "profile_extract.txt").write_text(
+            "## System\n시스템\n\n## User\n{texts} {unknown}", encoding="utf-8"
+        )
+        monkeypatch.setattr(prompt_registry, "_PROMPTS_DIR", tmp_path)
+        with pytest.raises(RuntimeError):
+            prompt_registry.load_all()
+
+    def test_hot_reload_on_mtime_change(self, tmp_path, monkeypatch):
+        path = tmp_path / "profile_extract.txt"
+        path.write_text("## System\nv1\n\n## User\n{texts}", encoding="utf-8")
+        monkeypatch.setattr(prompt_registry, "_PROMPTS_DIR", tmp_path)
+        monkeypatch.setattr(prompt_registry, "_HOT_RELOAD", True)
+        prompt_registry.load_all()
+
+        path.write_text("## System\nv2\n\n## User\n{texts}", encoding="utf-8")
+        os.utime(path, (time.time() + 10, time.time() + 10))
+
+        assert prompt_registry.get("profile_extract").system == "v2"
+
+        monkeypatch.undo()
+        prompt_registry.load_all()
@@ -21,9 +21,26 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from crawling import naver_client, rate_limiter, response_cache
 from crawling.naver_mcp_crawler import NaverMCPCrawler
 
 
+@pytest.fixture(autouse=True)
+def _fresh_client(tmp_path, monkeypatch):
+    """공용 클라이언트와 응답 캐시를 테스트마다 새로 생성 (임시 캐시 파일)"""
+    monkeypatch.setenv("RESPONSE_CACHE_PATH", str(tmp_path / "response_cache.sqlite3"))
+    # 429 재시도 백오프를 짧게, 버킷은 테스트마다 가득 찬 상태로
+    monkeypatch.setenv("RATE_LIMIT_RETRY_BASE_SECONDS", "0.01")
+    monkeypatch.setenv("RATE_LIMIT_NAVER_PER_SECOND", "1000")
+    naver_client.reset()
+    response_cache.reset()
+    rate_limiter.reset()
+    yield
+    naver_client.reset()
+    response_cache.reset()
+    rate_limiter.reset()
+
+
 class TestNaverMCPCrawler:
     """
     Naver MCP 크롤러 단위 테스트
@@ -32,7 +49,7 @@ class TestNaverMCPCrawler:
 
     Mock이란?
     - 실제 API 호출을 가짜 응답으로 대체하는 기술
-    - requests.get()을 Mock 객체로 교체하여 네트워크 호출 없이 테스트
+    - requests.Session.get()을 Mock 객체로 교체하여 네트워크 호출 없이 테스트
     - 빠르고 안정적이며 외부 의존성이 없음
     """
 
@@ -84,13 +101,13 @@ class TestNaverMCPCrawler:
         with pytest.raises(ValueError, match="sort는 'date' 또는 'sim'"):
             crawler.search_news(query="테스트", sort="invalid")
 
-    @patch("crawling.naver_mcp_crawler.requests.get")
+    @patch("crawling.naver_client.requests.Session.get")
     def test_search_news_success(self, mock_get):
         """
         정상적인 뉴스 검색 테스트
 
         🎭 Mock 사용 예시:
-        1. @patch 데코레이터로 requests.get을 Mock으로 대체
+        1. @patch 데코레이터로 requests.Session.get을 Mock으로 대체
         2. 가짜 응답 데이터 정의 (실제 Naver API 응답 형식)
         3. Mock이 이 가짜 데이터를 반환하도록 설정
         4. 실제 코드 실행 → Mock이 가짜 데이터 반환
@@ -124,14 +141,14 @@ class TestNaverMCPCrawler:
             ],
         }
 
-        # 🎭 Step 2: requests.get()이 위의 Mock 응답을 반환하도록 설정
+        # 🎭 Step 2: Session.get()이 위의 Mock 응답을 반환하도록 설정
         mock_get.return_value = mock_response
 
         # 🎭 Step 3: 크롤러 실행 (API 키는 아무 값이나 가능)
         crawler = NaverMCPCrawler(client_id="test", client_secret="test")
         result = crawler.search_news(query="당근마켓", display=10)
 
-        # 실제로는 requests.get()이 호출되지만
+        # 실제로는 Session.get()이 호출되지만
         # Mock 덕분에 네트워크 호출 없이 위의 가짜 데이터가 반환됨!
 
         # ✅ Step 4: 결과 검증
@@ -145,7 +162,7 @@ class TestNaverMCPCrawler:
         assert call_args[1]["params"]["query"] == "당근마켓"
         assert call_args[1]["params"]["display"] == 10
 
-    @patch("crawling.naver_mcp_crawler.requests.get")
+    @patch("crawling.naver_client.requests.Session.get")
     def test_search_news_authentication_error(self, mock_get):
         """인증 실패 시 에러 처리"""
         mock_response = Mock()
@@ -159,7 +176,7 @@ class TestNaverMCPCrawler:
         with pytest.raises(ValueError, match="인증 실패"):
             crawler.search_news(query="테스트")
 
-    @patch("crawling.naver_mcp_crawler.requests.get")
+    @patch("crawling.naver_client.requests.Session.get")
     def test_search_news_rate_limit(self, mock_get):
         """API 호출 한도 초과 시 에러 처리"""
         mock_response = Mock()
@@ -173,7 +190,7 @@ class TestNaverMCPCrawler:
         with pytest.raises(ValueError, match="API 호출 한도"):
             crawler.search_news(query="테스트")
 
-    @patch("crawling.naver_mcp_crawler.requests.get")
+    @patch("crawling.naver_client.requests.Session.get")
     def test_crawl_news_multiple_pages(self, mock_get):
         """여러 페이지 크롤링 테스트"""
 
@@ -236,6 +253,139 @@ class TestNaverMCPCrawler:
         assert crawler._remove_html_tags("<b>&quot;당근마켓&quot;</b>") == '"당근마켓"'
 
 
+class TestNaverClient:
+    """공용 Naver 클라이언트 (연결 풀·응답 캐시·호출량 집계) 단위 테스트"""
+
+    @staticmethod
+    def _response(items):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"items": items}
+        return response
+
+    @patch("crawling.naver_client.requests.Session.get")
+    def test_cache_shares_responses_and_counts_usage(self, mock_get):
+        mock_get.return_value = self._response(
+            [{"title": "<b>뉴스</b>", "link": "https://example.com/1"}]
+        )
+        client = naver_client.NaverClient("id", "secret")
+
+        first = client.search_news("당근마켓")
+        second = client.search_news("당근마켓")
+        client.search_news("당근마켓", sort="sim")
+
+        assert first == second
+        assert mock_get.call_count == 2
+        usage = client.usage()
+        assert (usage["calls"], usage["cache_hits"]) == (2, 1)
+
+    @patch("crawling.naver_client.requests.Session.get")
+    def test_crawl_news_cleans_html_and_stops_on_short_page(self, mock_get):
+        mock_get.return_value = self._response(
+            [{"title": "<b>&quot;당근&quot;</b>", "link": "https://example.com/1"}]
+        )
+        client = naver_client.NaverClient("id", "secret")
+
+        result = client.crawl_news("당근마켓", max_pages=3, display=10)
+
+        assert result == [
+            {
+                "title": '"당근"',
+                "link": "https://example.com/1",
+                "description": "",
+                "pubDate": "",
+            }
+        ]
+        mock_get.assert_called_once()
+
+    @patch("crawling.naver_client.requests.Session.get")
+    def test_cache_persists_across_clients_with_ttl_by_sort(
+        self, mock_get, monkeypatch
+    ):
+        mock_get.return_value = self._response([{"title": "뉴스", "link": "x"}])
+        monkeypatch.setenv("NAVER_CACHE_TTL_DATE_SECONDS", "0")
+        first = naver_client.NaverClient("id", "secret")
+        first.search_news("당근마켓", sort="date")
+        first.search_news("당근마켓", sort="sim")
+
+        # 프로세스 재시작과 같은 상황: 새 캐시 객체가 같은 파일을 연다
+        response_cache.reset()
+        second = naver_client.NaverClient("id", "secret")
+        second.search_news("  당근마켓 ", sort="sim")
+        second.search_news("당근마켓", sort="date")
+
+        assert mock_get.call_count == 3  # sim만 디스크 캐시 적중
+        stats = response_cache.get_cache().stats()["naver"]
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_get_client_is_shared_per_credentials(self):
+        naver_client.reset()
+        a = naver_client.get_client("id", "secret")
+
+        assert naver_client.get_client("id", "secret") is a
+        assert NaverMCPCrawler("id", "secret")._client is a
+        assert naver_client.get_client("other", "secret") is not a
+        naver_client.reset()
+
+    @patch("crawling.naver_client.requests.Session.get")
+    def test_retries_after_429_then_succeeds(self, mock_get):
+        throttled = Mock(status_code=429, headers={"Retry-After": "0"})
+        mock_get.side_effect = [throttled, self._response([{"title": "당근"}])]
+        client = naver_client.NaverClient("id", "secret")
+
+        result = client.search_news("당근마켓")
+
+        assert result == {"items": [{"title": "당근"}]}
+        assert mock_get.call_count == 2
+        assert client.usage()["calls"] == 2
+
+
+class TestRateLimiter:
+    """제공자별 토큰 버킷 단위 테스트"""
+
+    def test_burst_then_smooths_to_rate(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_NAVER_PER_SECOND", "50")
+        monkeypatch.setenv("RATE_LIMIT_NAVER_BURST", "2")
+        limiter = rate_limiter.RateLimiter()
+
+        waits = [limiter.acquire("naver") for _ in range(3)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.02, abs=0.01)
+
+    def test_penalize_delays_next_acquire(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_NAVER_PER_SECOND", "100")
+        monkeypatch.setenv("RATE_LIMIT_NAVER_BURST", "1")
+        limiter = rate_limiter.RateLimiter()
+
+        limiter.penalize("naver", 0.05)
+
+        assert limiter.acquire("naver") == pytest.approx(0.05, abs=0.02)
+
+    def test_unlimited_provider_never_waits(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_NAVER_PER_SECOND", "0")
+        limiter = rate_limiter.RateLimiter()
+
+        assert [limiter.acquire("naver") for _ in range(20)] == [0.0] * 20
+
+    def test_sqlite_store_shares_bucket_across_limiters(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_NAVER_PER_SECOND", "50")
+        monkeypatch.setenv("RATE_LIMIT_NAVER_BURST", "1")
+        path = tmp_path / "rate_limit.sqlite3"
+        first = rate_limiter.RateLimiter(rate_limiter._SQLiteStore(path))
+        second = rate_limiter.RateLimiter(rate_limiter._SQLiteStore(path))
+
+        assert first.acquire("naver") == 0.0
+        assert second.acquire("naver") > 0.0
+
+    def test_retry_delay_prefers_retry_after(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_RETRY_BASE_SECONDS", "1")
+
+        assert rate_limiter.retry_delay(0, "3") == 3.0
+        assert rate_limiter.retry_delay(2) == 4.0
+        assert rate_limiter.retry_delay(10) == 30.0
+
+
 # =============================================================================
 # 통합 테스트 (Integration Tests)
 # =============================================================================